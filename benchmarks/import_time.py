@@ -0,0 +1,65 @@
+"""
+Import-time benchmark for the top-level package.
+
+Times `import sec_api_io` plus access to the enums in fresh interpreters and
+lists the heavy modules that got loaded along the way. The package has to be
+installed, e.g. in editable mode:
+
+    pip install -e .
+    python benchmarks/import_time.py --runs 20 --max-ms 50
+
+Exits with status 1 when the median exceeds `--max-ms` or when a module in
+`HEAVY_MODULES` is imported before a retriever is used.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ("httpx", "httpcore", "concurrent.futures", "sqlite3")
+_SNIPPET = """
+import json, sys, time
+started = time.perf_counter()
+import sec_api_io
+sec_api_io.DocumentType, sec_api_io.SectionType
+elapsed_ms = (time.perf_counter() - started) * 1000
+print(json.dumps({"elapsed_ms": elapsed_ms, "modules": sorted(sys.modules)}))
+"""
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--max-ms", type=float, help="fail when the median import time is above this")
+    args = parser.parse_args()
+
+    timings = []
+    heavy: set[str] = set()
+    for _ in range(args.runs):
+        output = subprocess.run(
+            [sys.executable, "-c", _SNIPPET],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        result = json.loads(output)
+        timings.append(result["elapsed_ms"])
+        heavy.update(m for m in result["modules"] if m in HEAVY_MODULES)
+
+    median = statistics.median(timings)
+    print(f"import sec_api_io: median={median:.1f}ms min={min(timings):.1f}ms max={max(timings):.1f}ms")
+    failed = False
+    if heavy:
+        print(f"heavy modules imported eagerly: {', '.join(sorted(heavy))}", file=sys.stderr)
+        failed = True
+    if args.max_ms is not None and median > args.max_ms:
+        print(f"median import time {median:.1f}ms is above {args.max_ms:.1f}ms", file=sys.stderr)
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
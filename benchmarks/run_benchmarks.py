@@ -0,0 +1,247 @@
+"""
+Offline throughput benchmarks for the report retrieval paths.
+
+Serves the `tests/data` fixtures from `MockSecapioTransport` and runs every
+(mode, workers) case in a fresh subprocess so peak RSS is per case. The
+package has to be installed, e.g. in editable mode:
+
+    pip install -e .
+    python benchmarks/run_benchmarks.py --latency-ms 20 --jitter-ms 10 \\
+        --output bench.json --compare previous-bench.json
+
+Per-section latency is measured around `_call_sections_extractor_api`, so in
+async mode it includes the time a task waits for the concurrency semaphore.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import sec_api_io
+from sec_api_io.async_secapio_data_retriever import AsyncSecapioDataRetriever
+from sec_api_io.retry import RetryPolicy
+from sec_api_io.secapio_data_retriever import SecapioDataRetriever
+from sec_api_io.testing import MockSecapioTransport, load_fixture_filings
+
+MODES = ("sequential", "multithreading", "bulk", "async")
+FIXTURES_DIR = Path(__file__).resolve().parent.parent / "tests" / "data"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--modes", default=",".join(MODES))
+    parser.add_argument("--workers", default="1,4,16")
+    parser.add_argument("--repeat", type=int, default=5, help="copies of each fixture filing to fetch")
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--jitter-ms", type=float, default=10.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--processing-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write machine-readable results to this JSON file")
+    parser.add_argument("--compare", help="JSON results of an earlier run to compare against")
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    parser.add_argument("--case-config", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        mode, workers = args.case.split(":")
+        print(json.dumps(run_case(mode, int(workers), json.loads(args.case_config))))
+        return
+
+    config = {
+        "repeat": args.repeat,
+        "latency_ms": args.latency_ms,
+        "jitter_ms": args.jitter_ms,
+        "error_rate": args.error_rate,
+        "processing_rate": args.processing_rate,
+        "seed": args.seed,
+    }
+    results = []
+    for mode in args.modes.split(","):
+        for workers in [int(w) for w in args.workers.split(",")]:
+            if mode == "sequential" and workers != 1:
+                continue
+            result = _run_case_in_subprocess(mode, workers, config)
+            results.append(result)
+            print(_format_result(result), file=sys.stderr)
+
+    report = {
+        "version": sec_api_io.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "config": config,
+        "results": results,
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+    if args.compare:
+        _print_comparison(json.loads(Path(args.compare).read_text()), report)
+
+
+def run_case(mode: str, workers: int, config: dict) -> dict:
+    transport = MockSecapioTransport(
+        load_fixture_filings(FIXTURES_DIR),
+        latency_s=config["latency_ms"] / 1000,
+        jitter_s=config["jitter_ms"] / 1000,
+        error_rate=config["error_rate"],
+        processing_rate=config["processing_rate"],
+        seed=config["seed"],
+    )
+    requests = [
+        (f.doc_type, f.url, list(f.sections) if f.doc_type.value == "8-K" else None)
+        for f in transport.filings
+        for _ in range(config["repeat"])
+    ]
+    latencies: list[float] = []
+    kwargs = {
+        "api_key": "benchmark",
+        "retry_policy": RetryPolicy(base_delay_s=0.01, max_delay_s=0.1),
+        "processing_poll_interval_s": 0.05,
+        "metadata_cache_size": 0,
+    }
+
+    started_at = time.perf_counter()
+    if mode == "async":
+        sections = asyncio.run(_run_async(transport, requests, workers, latencies, kwargs))
+    else:
+        retriever = _TimedRetriever(latencies, client=httpx.Client(transport=transport), **kwargs)
+        sections = _run_sync(retriever, mode, requests, workers)
+    elapsed_s = time.perf_counter() - started_at
+
+    latencies_ms = sorted(latency * 1000 for latency in latencies)
+    return {
+        "mode": mode,
+        "workers": workers,
+        "filings": len(requests),
+        "sections": sections,
+        "requests": transport.request_count,
+        "elapsed_s": round(elapsed_s, 4),
+        "sections_per_s": round(sections / elapsed_s, 2),
+        "latency_ms": {
+            "p50": round(_percentile(latencies_ms, 50), 3),
+            "p95": round(_percentile(latencies_ms, 95), 3),
+            "p99": round(_percentile(latencies_ms, 99), 3),
+            "mean": round(statistics.fmean(latencies_ms), 3) if latencies_ms else 0.0,
+        },
+        "peak_rss_mb": round(_peak_rss_mb(), 2),
+    }
+
+
+class _TimedRetriever(SecapioDataRetriever):
+    def __init__(self, latencies: list[float], **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._latencies = latencies
+
+    def _call_sections_extractor_api(self, url, section):
+        started_at = time.perf_counter()
+        try:
+            return super()._call_sections_extractor_api(url, section)
+        finally:
+            self._latencies.append(time.perf_counter() - started_at)
+
+
+class _TimedAsyncRetriever(AsyncSecapioDataRetriever):
+    def __init__(self, latencies: list[float], **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._latencies = latencies
+
+    async def _call_sections_extractor_api(self, url, section):
+        started_at = time.perf_counter()
+        try:
+            return await super()._call_sections_extractor_api(url, section)
+        finally:
+            self._latencies.append(time.perf_counter() - started_at)
+
+
+def _run_sync(retriever: SecapioDataRetriever, mode: str, requests: list, workers: int) -> int:
+    sections = 0
+    if mode == "bulk":
+        for _ in retriever.get_reports_html(requests, workers=workers):
+            pass
+        return sum(len(_sections_of(r)) for r in requests)
+    for doc_type, url, request_sections in requests:
+        retriever.get_report_html(
+            doc_type,
+            url,
+            sections=request_sections,
+            use_multithreading=mode == "multithreading",
+            workers=workers,
+        )
+        sections += len(_sections_of((doc_type, url, request_sections)))
+    return sections
+
+
+async def _run_async(transport, requests, workers, latencies, kwargs) -> int:
+    client = httpx.AsyncClient(transport=transport)
+    async with _TimedAsyncRetriever(latencies, client=client, max_concurrency=workers, **kwargs) as retriever:
+        await retriever.gather_reports_html(requests)
+    return sum(len(_sections_of(r)) for r in requests)
+
+
+def _sections_of(request) -> list:
+    from sec_api_io.sec_edgar_enums import FORM_SECTIONS
+
+    doc_type, _, sections = request
+    return sections or FORM_SECTIONS[doc_type]
+
+
+def _run_case_in_subprocess(mode: str, workers: int, config: dict) -> dict:
+    output = subprocess.run(
+        [sys.executable, __file__, "--case", f"{mode}:{workers}", "--case-config", json.dumps(config)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def _percentile(sorted_values: list[float], percentile: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, round(percentile / 100 * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _format_result(result: dict) -> str:
+    latency = result["latency_ms"]
+    return (
+        f"{result['mode']:>14} workers={result['workers']:<3} "
+        f"{result['sections_per_s']:>9.1f} sections/s  "
+        f"p50={latency['p50']:.1f}ms p95={latency['p95']:.1f}ms p99={latency['p99']:.1f}ms  "
+        f"rss={result['peak_rss_mb']:.1f}MB"
+    )
+
+
+def _print_comparison(baseline: dict, current: dict) -> None:
+    previous = {(r["mode"], r["workers"]): r for r in baseline["results"]}
+    print(f"compared with {baseline['version']} ({baseline['created_at']}):", file=sys.stderr)
+    for result in current["results"]:
+        before = previous.get((result["mode"], result["workers"]))
+        if before is None:
+            continue
+        change = result["sections_per_s"] / before["sections_per_s"] - 1
+        print(
+            f"{result['mode']:>14} workers={result['workers']:<3} sections/s {change:+.1%}  "
+            f"p99 {before['latency_ms']['p99']:.1f}ms -> {result['latency_ms']['p99']:.1f}ms",
+            file=sys.stderr,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,79 @@
 __version__ = "0.0.17"
+
+import importlib
+from typing import TYPE_CHECKING
+
+# Public names and the modules defining them. Modules are imported on first
+# attribute access, so `import sec_api_io` stays cheap and httpx is only
+# loaded once a retriever is actually used.
+_LAZY_ATTRIBUTES = {
+    "AdaptiveConcurrencyLimiter": "sec_api_io.concurrency",
+    "ApiKeyPool": "sec_api_io.api_keys",
+    "ApiKeyPoolExhaustedError": "sec_api_io.api_keys",
+    "AsyncSecapioDataRetriever": "sec_api_io.async_secapio_data_retriever",
+    "BulkDownloadJob": "sec_api_io.jobs",
+    "DocumentType": "sec_api_io.sec_edgar_enums",
+    "FORM_SECTIONS": "sec_api_io.sec_edgar_enums",
+    "InMemoryInstrumentation": "sec_api_io.instrumentation",
+    "InvalidDocumentTypeError": "sec_api_io.sec_edgar_enums",
+    "InvalidSectionTypeError": "sec_api_io.sec_edgar_enums",
+    "MetadataResult": "sec_api_io.secapio_data_retriever",
+    "Report": "sec_api_io.report",
+    "ReportArchive": "sec_api_io.archive",
+    "ReportRequest": "sec_api_io.abstract_sec_data_retriever",
+    "ReportSection": "sec_api_io.abstract_sec_data_retriever",
+    "RetryPolicy": "sec_api_io.retry",
+    "SECTION_NAMES": "sec_api_io.sec_edgar_enums",
+    "SecapioApiKeyInvalidError": "sec_api_io.secapio_data_retriever",
+    "SecapioApiKeyNotSetError": "sec_api_io.secapio_data_retriever",
+    "SecapioDataRetriever": "sec_api_io.secapio_data_retriever",
+    "SecapioRequestError": "sec_api_io.secapio_data_retriever",
+    "SectionType": "sec_api_io.sec_edgar_enums",
+    "TokenBucketRateLimiter": "sec_api_io.rate_limit",
+    "parse_sections": "sec_api_io.sec_edgar_utils",
+}
+
+__all__ = ["__version__", *_LAZY_ATTRIBUTES]
+
+if TYPE_CHECKING:
+    from sec_api_io.abstract_sec_data_retriever import ReportRequest, ReportSection
+    from sec_api_io.api_keys import ApiKeyPool, ApiKeyPoolExhaustedError
+    from sec_api_io.archive import ReportArchive
+    from sec_api_io.async_secapio_data_retriever import AsyncSecapioDataRetriever
+    from sec_api_io.concurrency import AdaptiveConcurrencyLimiter
+    from sec_api_io.instrumentation import InMemoryInstrumentation
+    from sec_api_io.jobs import BulkDownloadJob
+    from sec_api_io.rate_limit import TokenBucketRateLimiter
+    from sec_api_io.report import Report
+    from sec_api_io.retry import RetryPolicy
+    from sec_api_io.sec_edgar_enums import (
+        FORM_SECTIONS,
+        SECTION_NAMES,
+        DocumentType,
+        InvalidDocumentTypeError,
+        InvalidSectionTypeError,
+        SectionType,
+    )
+    from sec_api_io.sec_edgar_utils import parse_sections
+    from sec_api_io.secapio_data_retriever import (
+        MetadataResult,
+        SecapioApiKeyInvalidError,
+        SecapioApiKeyNotSetError,
+        SecapioDataRetriever,
+        SecapioRequestError,
+    )
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module_name), name)
+    # Later lookups find the attribute directly and skip __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> "list[str]":
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
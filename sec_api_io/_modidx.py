@@ -6,7 +6,21 @@ d = { 'settings': { 'branch': 'main',
                 'git_url': 'https://github.com/Elijas/sec-api-io',
                 'lib_path': 'sec_api_io'},
   'syms': { 'sec_api_io.abstract_sec_data_retriever': {},
+            'sec_api_io.api_keys': {},
+            'sec_api_io.archive': {},
+            'sec_api_io.async_secapio_data_retriever': {},
+            'sec_api_io.cache': {},
+            'sec_api_io.cli': {},
+            'sec_api_io.concurrency': {},
+            'sec_api_io.instrumentation': {},
+            'sec_api_io.jobs': {},
+            'sec_api_io.rate_limit': {},
+            'sec_api_io.report': {},
             'sec_api_io.retry': {},
+            'sec_api_io.scheduler': {},
             'sec_api_io.sec_edgar_enums': {},
             'sec_api_io.sec_edgar_utils': {},
-            'sec_api_io.secapio_data_retriever': {}}}
+            'sec_api_io.secapio_data_retriever': {},
+            'sec_api_io.single_flight': {},
+            'sec_api_io.sinks': {},
+            'sec_api_io.testing': {}}}
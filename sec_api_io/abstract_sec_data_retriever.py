@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 from sec_api_io.sec_edgar_enums import DocumentType, SectionType
-from sec_api_io.sec_edgar_utils import validate_sections
+from sec_api_io.sec_edgar_utils import (
+    is_present_sections,
+    parse_sections,
+    sections_from_items,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -14,7 +18,40 @@ class DocumentTypeNotSupportedError(ValueError):
     pass
 
 
-class AbstractSECDataRetriever(ABC):
+class ReportRequest(NamedTuple):
+    """A single filing to retrieve in a bulk call."""
+
+    doc_type: DocumentType | str
+    url: str
+    sections: Iterable[SectionType | str] | None = None
+
+    @classmethod
+    def from_metadata(
+        cls: type[ReportRequest],
+        metadata: dict,
+        sections: Iterable[SectionType | str] | str | None = None,
+    ) -> ReportRequest:
+        """
+        Builds a request from a filing returned by the query API. With
+        `sections="present"`, an 8-K's sections are taken from the `items`
+        in `metadata`; other forms, or 8-Ks without items, get every section.
+        """
+        if is_present_sections(sections):
+            items = metadata.get("items")
+            is_8k = metadata["formType"] == DocumentType.FORM_8K.value
+            sections = sections_from_items(items) if is_8k and items else None
+        return cls(metadata["formType"], metadata["linkToFilingDetails"], sections)
+
+
+class ReportSection(NamedTuple):
+    """One section of a report together with its start marker HTML."""
+
+    section: SectionType
+    marker: str
+    html: str
+
+
+class SECDataRetrieverBase(ABC):
     SUPPORTED_DOCUMENT_TYPES: frozenset[DocumentType] = frozenset()
 
     def __init__(self) -> None:
@@ -24,6 +61,22 @@ class AbstractSECDataRetriever(ABC):
                 msg,
             )
 
+    def _validate_and_convert(
+        self,
+        doc_type: DocumentType | str,
+        sections: Iterable[SectionType | str] | None = None,
+    ) -> tuple[DocumentType, Iterable[SectionType] | None]:
+        new_doc_type = (
+            DocumentType.from_str(doc_type) if isinstance(doc_type, str) else doc_type
+        )
+        if new_doc_type not in self.SUPPORTED_DOCUMENT_TYPES:
+            msg = f"Document type {doc_type} not supported."
+            raise DocumentTypeNotSupportedError(msg)
+        new_sections = list(parse_sections(new_doc_type, sections)) if sections else None
+        return new_doc_type, new_sections
+
+
+class AbstractSECDataRetriever(SECDataRetrieverBase):
     def get_report_html(
         self: AbstractSECDataRetriever,
         doc_type: DocumentType | str,
@@ -31,7 +84,7 @@ class AbstractSECDataRetriever(ABC):
         *,
         sections: Iterable[SectionType | str] | None = None,
         use_multithreading: bool = False,
-        workers: int = 1,
+        workers: int | str = 1,
     ) -> str:
         doc_type, sections = self._validate_and_convert(doc_type, sections)
 
@@ -55,28 +108,28 @@ class AbstractSECDataRetriever(ABC):
         *,
         sections: Iterable[SectionType] | None = None,
         use_multithreading: bool = False,
-        workers: int = 1,
+        workers: int | str = 1,
     ) -> str:
         raise NotImplementedError  # pragma: no cover
 
-    def _validate_and_convert(
-        self,
+
+class AbstractAsyncSECDataRetriever(SECDataRetrieverBase):
+    async def get_report_html(
+        self: AbstractAsyncSECDataRetriever,
         doc_type: DocumentType | str,
+        url: str,
+        *,
         sections: Iterable[SectionType | str] | None = None,
-    ) -> tuple[DocumentType, Iterable[SectionType] | None]:
-        new_doc_type = (
-            DocumentType.from_str(doc_type) if isinstance(doc_type, str) else doc_type
-        )
-        if new_doc_type not in self.SUPPORTED_DOCUMENT_TYPES:
-            msg = f"Document type {doc_type} not supported."
-            raise DocumentTypeNotSupportedError(msg)
-        new_sections = (
-            [
-                SectionType.from_str(section) if isinstance(section, str) else section
-                for section in sections
-            ]
-            if sections
-            else None
-        )
-        validate_sections(new_doc_type, new_sections)
-        return new_doc_type, new_sections
+    ) -> str:
+        doc_type, sections = self._validate_and_convert(doc_type, sections)
+        return await self._get_report_html(doc_type, url=url, sections=sections)
+
+    @abstractmethod
+    async def _get_report_html(
+        self: AbstractAsyncSECDataRetriever,
+        doc_type: DocumentType,
+        url: str,
+        *,
+        sections: Iterable[SectionType] | None = None,
+    ) -> str:
+        raise NotImplementedError  # pragma: no cover
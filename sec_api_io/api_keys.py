@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import math
+import os
+import re
+import threading
+import time
+from typing import TYPE_CHECKING, NamedTuple
+
+from sec_api_io.rate_limit import TokenBucketRateLimiter
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Statuses with which sec-api.io rejects a key: invalid or out of quota
+# (403) and throttled (429).
+EJECT_STATUSES = frozenset({403, 429})
+
+
+class ApiKeyPoolExhaustedError(RuntimeError):
+    pass
+
+
+class ApiKeyStats(NamedTuple):
+    key: str
+    requests: int
+    in_flight: int
+    ejections: int
+    available: bool
+
+
+class _ApiKey:
+    __slots__ = ("key", "limiter", "requests", "in_flight", "ejections", "ejected_until")
+
+    def __init__(self: _ApiKey, key: str, limiter: TokenBucketRateLimiter | None) -> None:
+        self.key = key
+        self.limiter = limiter
+        self.requests = 0
+        self.in_flight = 0
+        self.ejections = 0
+        self.ejected_until = -math.inf
+
+
+class ApiKeyPool:
+    """
+    Spreads requests over several sec-api.io API keys, shared by every
+    thread and asyncio task that uses it.
+
+    Each request leases the least-loaded available key: the one with the
+    fewest requests in flight, then the fewest made so far, so equally
+    loaded keys take turns. A key answered with 403 or 429 is ejected for
+    `cooldown_s` and then tried again; a key that made `quota` requests is
+    not leased again, and once every key is out of quota leasing raises
+    `ApiKeyPoolExhaustedError`. With `rate_per_s` every key is also
+    throttled by a token bucket of its own. When every key with quota left
+    is cooling down, the one that comes back first is leased anyway, so its
+    error reaches the caller instead of the pool stalling.
+    """
+
+    ENV_VAR_NAME = "SECAPIO_API_KEYS"
+
+    def __init__(
+        self: ApiKeyPool,
+        api_keys: Iterable[str],
+        *,
+        cooldown_s: float = 60.0,
+        rate_per_s: float | None = None,
+        quota: int | None = None,
+    ) -> None:
+        keys = list(dict.fromkeys(key.strip() for key in api_keys if key.strip()))
+        if not keys:
+            msg = "at least one API key is required"
+            raise ValueError(msg)
+        if cooldown_s < 0:
+            msg = "cooldown_s cannot be negative"
+            raise ValueError(msg)
+        if quota is not None and quota < 1:
+            msg = "quota cannot be less than 1"
+            raise ValueError(msg)
+        self._cooldown_s = cooldown_s
+        self._quota = quota
+        self._lock = threading.Lock()
+        self._keys = {
+            key: _ApiKey(key, TokenBucketRateLimiter(rate_per_s) if rate_per_s else None)
+            for key in keys
+        }
+
+    @classmethod
+    def from_env(cls: type[ApiKeyPool], env_var: str = ENV_VAR_NAME, **kwargs: object) -> ApiKeyPool:
+        """Reads keys separated by commas or whitespace from `env_var`."""
+        return cls(re.split(r"[\s,]+", os.environ.get(env_var, "")), **kwargs)
+
+    def __len__(self: ApiKeyPool) -> int:
+        return len(self._keys)
+
+    @property
+    def keys(self: ApiKeyPool) -> list[str]:
+        return list(self._keys)
+
+    @property
+    def available(self: ApiKeyPool) -> int:
+        """Number of keys that are neither cooling down nor out of quota."""
+        now = time.monotonic()
+        with self._lock:
+            return sum(self._is_available(state, now) for state in self._keys.values())
+
+    def acquire(self: ApiKeyPool) -> str:
+        state = self._lease()
+        if state.limiter is not None:
+            state.limiter.acquire()
+        return state.key
+
+    async def acquire_async(self: ApiKeyPool) -> str:
+        state = self._lease()
+        if state.limiter is not None:
+            await state.limiter.acquire_async()
+        return state.key
+
+    def release(self: ApiKeyPool, key: str, status_code: int | None = None) -> bool:
+        """
+        Returns a leased key with the status of its response, if any, and
+        whether that status ejected the key.
+        """
+        with self._lock:
+            state = self._keys[key]
+            state.in_flight -= 1
+            if status_code not in EJECT_STATUSES:
+                return False
+            state.ejections += 1
+            state.ejected_until = time.monotonic() + self._cooldown_s
+            return True
+
+    def stats(self: ApiKeyPool) -> list[ApiKeyStats]:
+        now = time.monotonic()
+        with self._lock:
+            return [
+                ApiKeyStats(s.key, s.requests, s.in_flight, s.ejections, self._is_available(s, now))
+                for s in self._keys.values()
+            ]
+
+    def _lease(self: ApiKeyPool) -> _ApiKey:
+        now = time.monotonic()
+        with self._lock:
+            candidates = [s for s in self._keys.values() if not self._out_of_quota(s)]
+            if not candidates:
+                msg = f"every API key has made its quota of {self._quota} requests"
+                raise ApiKeyPoolExhaustedError(msg)
+            ready = [s for s in candidates if s.ejected_until <= now]
+            if ready:
+                state = min(ready, key=lambda s: (s.in_flight, s.requests))
+            else:
+                state = min(candidates, key=lambda s: s.ejected_until)
+            state.in_flight += 1
+            state.requests += 1
+            return state
+
+    def _is_available(self: ApiKeyPool, state: _ApiKey, now: float) -> bool:
+        return state.ejected_until <= now and not self._out_of_quota(state)
+
+    def _out_of_quota(self: ApiKeyPool, state: _ApiKey) -> bool:
+        return self._quota is not None and state.requests >= self._quota
@@ -0,0 +1,341 @@
+from __future__ import annotations
+
+import mmap
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from sec_api_io.abstract_sec_data_retriever import ReportSection
+from sec_api_io.cache import (
+    _CODEC_RAW,
+    _CODECS,
+    CacheCompressionNotAvailableError,
+    _compress,
+    _decompress,
+    zstandard,
+)
+from sec_api_io.report import Report
+from sec_api_io.sec_edgar_enums import DocumentType, SectionType
+from sec_api_io.secapio_data_retriever import (
+    _build_section_separator_html,
+    _extract_accession_number,
+)
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from types import TracebackType
+
+_INDEX_FILE_NAME = "index.sqlite"
+_LOCK_FILE_NAME = ".lock"
+_SEGMENT_NAME = "segment-{:06d}.dat"
+
+
+class ReportAlreadyArchivedError(ValueError):
+    pass
+
+
+class ArchivedSection(NamedTuple):
+    """Location of one section inside the archive's segment files."""
+
+    accession_number: str
+    section: SectionType
+    position: int
+    title: str
+    segment: int
+    offset: int
+    stored_length: int
+    length: int
+    codec: int
+
+
+class ReportArchive:
+    """
+    Packs many reports into a few append-only segment files under
+    `directory`, with a SQLite index keyed by (accession number, section).
+
+    Sections are read through a read-only mmap of their segment. Stored
+    uncompressed, a section is returned as a zero-copy memoryview; with
+    `compression` ("zlib" or "zstd") only that one section is decompressed.
+    Sections smaller than `min_compress_bytes` are always stored as is.
+    Writers in several threads or processes are serialized with a lock file.
+    """
+
+    def __init__(
+        self: ReportArchive,
+        directory: str | os.PathLike,
+        *,
+        compression: str | None = None,
+        min_compress_bytes: int = 1024,
+        max_segment_bytes: int = 1 << 30,
+    ) -> None:
+        if compression not in _CODECS:
+            msg = f"Unsupported compression {compression!r}"
+            raise ValueError(msg)
+        if compression == "zstd" and zstandard is None:
+            msg = "zstd compression requires the 'zstandard' package"
+            raise CacheCompressionNotAvailableError(msg)
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._codec = _CODECS[compression]
+        self._min_compress_bytes = min_compress_bytes
+        self._max_segment_bytes = max_segment_bytes
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self._maps_lock = threading.Lock()
+        self._maps: dict[int, mmap.mmap] = {}
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS filings ("
+                "accession_no TEXT PRIMARY KEY, doc_type TEXT, url TEXT, archived_at REAL NOT NULL)",
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sections ("
+                "accession_no TEXT NOT NULL, section TEXT NOT NULL, position INTEGER NOT NULL, "
+                "title TEXT NOT NULL, segment INTEGER NOT NULL, offset INTEGER NOT NULL, "
+                "stored_length INTEGER NOT NULL, length INTEGER NOT NULL, codec INTEGER NOT NULL, "
+                "PRIMARY KEY (accession_no, section))",
+            )
+
+    @property
+    def directory(self: ReportArchive) -> Path:
+        return self._directory
+
+    def add_report(
+        self: ReportArchive,
+        report: Report,
+        *,
+        accession_number: str,
+        url: str | None = None,
+        replace: bool = False,
+    ) -> int:
+        """
+        Appends every section of `report` and indexes it under
+        `accession_number` (a URL containing one also works). Returns the
+        number of bytes written to the segment file.
+        """
+        accession_number = _extract_accession_number(accession_number)
+        payloads = []
+        for entry in report.index:
+            body = report.section_bytes(entry.section)
+            codec = self._codec if entry.length >= self._min_compress_bytes else _CODEC_RAW
+            payloads.append((entry, codec, body if codec == _CODEC_RAW else _compress(codec, body)))
+
+        with self._write_lock, _file_lock(self._directory / _LOCK_FILE_NAME):
+            conn = self._connection()
+            exists = conn.execute(
+                "SELECT 1 FROM filings WHERE accession_no = ?",
+                (accession_number,),
+            ).fetchone()
+            if exists and not replace:
+                msg = f"{accession_number} is already archived"
+                raise ReportAlreadyArchivedError(msg)
+            segment, offset = self._append(payload for _, _, payload in payloads)
+            rows = []
+            for entry, codec, payload in payloads:
+                rows.append(
+                    (
+                        accession_number,
+                        entry.section.value,
+                        len(rows),
+                        entry.title,
+                        segment,
+                        offset,
+                        len(payload),
+                        entry.length,
+                        codec,
+                    ),
+                )
+                offset += len(payload)
+            # `_append` fsyncs the segment, so the bytes are on disk before
+            # the index points at them and a crash or power loss in between
+            # only leaves unreferenced bytes behind.
+            with conn:
+                conn.execute("DELETE FROM sections WHERE accession_no = ?", (accession_number,))
+                conn.execute(
+                    "INSERT OR REPLACE INTO filings VALUES (?, ?, ?, ?)",
+                    (
+                        accession_number,
+                        report.doc_type and report.doc_type.value,
+                        url,
+                        time.time(),
+                    ),
+                )
+                conn.executemany("INSERT INTO sections VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        return sum(len(payload) for _, _, payload in payloads)
+
+    def section_bytes(
+        self: ReportArchive,
+        accession_number: str,
+        section: SectionType | str,
+    ) -> memoryview | bytes:
+        """
+        The UTF-8 HTML of one section. Uncompressed sections are a view into
+        the mmapped segment; release it before closing the archive.
+        """
+        entry = self._section_entry(accession_number, section)
+        if entry.stored_length == 0:
+            return b""
+        view = self._segment_view(entry.segment, entry.offset + entry.stored_length)
+        payload = view[entry.offset:entry.offset + entry.stored_length]
+        if entry.codec == _CODEC_RAW:
+            return payload
+        try:
+            return _decompress(entry.codec, payload)
+        finally:
+            payload.release()
+
+    def get_section(self: ReportArchive, accession_number: str, section: SectionType | str) -> str:
+        data = self.section_bytes(accession_number, section)
+        try:
+            return str(data, "utf-8")
+        finally:
+            if isinstance(data, memoryview):
+                data.release()
+
+    def get_report(self: ReportArchive, accession_number: str) -> Report:
+        """Reassembles a stored filing into the document `get_report_html` returned."""
+        entries = self.sections(accession_number)
+        if not entries:
+            raise KeyError(accession_number)
+        doc_type = self._connection().execute(
+            "SELECT doc_type FROM filings WHERE accession_no = ?",
+            (entries[0].accession_number,),
+        ).fetchone()[0]
+        return Report.from_sections(
+            (
+                ReportSection(
+                    entry.section,
+                    _build_section_separator_html(entry.section),
+                    self.get_section(entry.accession_number, entry.section),
+                )
+                for entry in entries
+            ),
+            doc_type=doc_type and DocumentType.from_str(doc_type),
+        )
+
+    def sections(self: ReportArchive, accession_number: str) -> list[ArchivedSection]:
+        accession_number = _extract_accession_number(accession_number)
+        rows = self._connection().execute(
+            "SELECT * FROM sections WHERE accession_no = ? ORDER BY position",
+            (accession_number,),
+        ).fetchall()
+        return [_archived_section(row) for row in rows]
+
+    def accession_numbers(self: ReportArchive) -> Iterator[str]:
+        for (accession_number,) in self._connection().execute(
+            "SELECT accession_no FROM filings ORDER BY accession_no",
+        ):
+            yield accession_number
+
+    def __contains__(self: ReportArchive, accession_number: object) -> bool:
+        try:
+            accession_number = _extract_accession_number(str(accession_number))
+        except ValueError:
+            return False
+        row = self._connection().execute(
+            "SELECT 1 FROM filings WHERE accession_no = ?",
+            (accession_number,),
+        ).fetchone()
+        return row is not None
+
+    def __len__(self: ReportArchive) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM filings").fetchone()[0]
+
+    def close(self: ReportArchive) -> None:
+        with self._maps_lock:
+            for segment_map in self._maps.values():
+                try:
+                    segment_map.close()
+                except BufferError:
+                    # A caller still holds a section view; the mapping is
+                    # released once that view is garbage collected.
+                    pass
+            self._maps.clear()
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def __enter__(self: ReportArchive) -> ReportArchive:
+        return self
+
+    def __exit__(
+        self: ReportArchive,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _connection(self: ReportArchive) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._directory / _INDEX_FILE_NAME, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _append(self: ReportArchive, payloads: Iterator[bytes | memoryview]) -> tuple[int, int]:
+        segments = sorted(self._directory.glob("segment-*.dat"))
+        segment = int(segments[-1].stem.split("-")[1]) if segments else 0
+        path = self._directory / _SEGMENT_NAME.format(segment)
+        if path.exists() and path.stat().st_size >= self._max_segment_bytes:
+            segment += 1
+            path = self._directory / _SEGMENT_NAME.format(segment)
+        with open(path, "ab") as f:
+            offset = f.seek(0, os.SEEK_END)
+            for payload in payloads:
+                f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        return segment, offset
+
+    def _section_entry(self: ReportArchive, accession_number: str, section: SectionType | str) -> ArchivedSection:
+        if isinstance(section, str):
+            section = SectionType.from_str(section)
+        accession_number = _extract_accession_number(accession_number)
+        row = self._connection().execute(
+            "SELECT * FROM sections WHERE accession_no = ? AND section = ?",
+            (accession_number, section.value),
+        ).fetchone()
+        if row is None:
+            raise KeyError((accession_number, section))
+        return _archived_section(row)
+
+    def _segment_view(self: ReportArchive, segment: int, end: int) -> memoryview:
+        with self._maps_lock:
+            segment_map = self._maps.get(segment)
+            if segment_map is None or len(segment_map) < end:
+                # The segment grew since it was mapped; map it again. The old
+                # mapping stays valid for views that still reference it.
+                with open(self._directory / _SEGMENT_NAME.format(segment), "rb") as f:
+                    segment_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                self._maps[segment] = segment_map
+            return memoryview(segment_map)
+
+
+@contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    if fcntl is None:  # pragma: no cover
+        yield
+        return
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)
+
+
+def _archived_section(row: tuple) -> ArchivedSection:
+    accession_number, section, *rest = row
+    return ArchivedSection(accession_number, SectionType.from_str(section), *rest)
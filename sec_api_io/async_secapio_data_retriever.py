@@ -0,0 +1,481 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+
+import httpx
+from sec_api_io.abstract_sec_data_retriever import (
+    AbstractAsyncSECDataRetriever,
+    ReportRequest,
+    ReportSection,
+)
+from sec_api_io.concurrency import AUTO_WORKERS, AdaptiveConcurrencyLimiter
+from sec_api_io.report import Report
+from sec_api_io.retry import RetriesExhaustedError, _raise_if_not_found
+from sec_api_io.scheduler import (
+    DEFAULT_PROCESSING_MAX_WAIT_S,
+    DEFAULT_PROCESSING_POLL_INTERVAL_S,
+    processing_timeout_error,
+)
+from sec_api_io.sec_edgar_enums import FORM_SECTIONS, DocumentType, SectionType
+from sec_api_io.secapio_data_retriever import (
+    EXTRACTOR_API_URL,
+    MAX_QUERY_PAGE_SIZE,
+    QUERY_API_URL,
+    MetadataResult,
+    SecapioApiKeyInvalidError,
+    SecapioRequestError,
+    SecapioRetrieverMixin,
+    _build_filings_query,
+    _build_metadata_query,
+    _build_section_separator_html,
+    _is_processing_response,
+    _iter_report_parts,
+    _parse_metadata_response,
+    _query_key,
+    _raise_metadata_request_error,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable
+    from types import TracebackType
+
+    from sec_api_io.api_keys import ApiKeyPool
+    from sec_api_io.cache import ResponseCache
+    from sec_api_io.instrumentation import Instrumentation
+    from sec_api_io.rate_limit import RateLimiter
+    from sec_api_io.retry import RetryPolicy
+
+
+class AsyncSecapioDataRetriever(SecapioRetrieverMixin, AbstractAsyncSECDataRetriever):
+    """Retrieves data from sec-api.io API using asyncio."""
+
+    def __init__(
+        self: AsyncSecapioDataRetriever,
+        api_key: str | Iterable[str] | ApiKeyPool | None = None,
+        *,
+        timeout_s: int | None = None,
+        max_concurrency: int | str = 20,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry_s: float = 30.0,
+        http2: bool | None = None,
+        client: httpx.AsyncClient | None = None,
+        cache: ResponseCache | None = None,
+        metadata_cache_size: int = 1024,
+        latest_metadata_ttl_s: float = 60.0,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        processing_poll_interval_s: float = DEFAULT_PROCESSING_POLL_INTERVAL_S,
+        processing_max_wait_s: float = DEFAULT_PROCESSING_MAX_WAIT_S,
+        instrumentation: Instrumentation | None = None,
+        single_flight: bool = True,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+    ) -> None:
+        """
+        `max_concurrency` bounds the number of in-flight API requests across
+        every call made on this retriever, including bulk calls. With
+        `max_concurrency="auto"` that bound is set by `concurrency_limiter`
+        (a default one if not given), which adapts it to the API's latency
+        and errors.
+        """
+        if max_concurrency == AUTO_WORKERS:
+            concurrency_limiter = concurrency_limiter or AdaptiveConcurrencyLimiter()
+            max_concurrency = concurrency_limiter.max_limit
+        assert max_concurrency>=1, "max_concurrency cannot be less than 1."
+        self._configure(
+            api_key,
+            timeout_s=timeout_s,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry_s=keepalive_expiry_s,
+            http2=http2,
+            cache=cache,
+            metadata_cache_size=metadata_cache_size,
+            latest_metadata_ttl_s=latest_metadata_ttl_s,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            processing_poll_interval_s=processing_poll_interval_s,
+            processing_max_wait_s=processing_max_wait_s,
+            instrumentation=instrumentation,
+            single_flight=single_flight,
+            concurrency_limiter=concurrency_limiter,
+        )
+        self._max_concurrency = max_concurrency
+        # Created lazily so that the semaphore binds to the running event loop.
+        self._semaphore: asyncio.Semaphore | None = None
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient(
+            http2=self._http2,
+            limits=self._pool_limits,
+            timeout=self._timeout_s,
+        )
+
+    @property
+    def client(self: AsyncSecapioDataRetriever) -> httpx.AsyncClient:
+        return self._client
+
+    @property
+    def max_concurrency(self: AsyncSecapioDataRetriever) -> int:
+        return self._max_concurrency
+
+    async def aclose(self: AsyncSecapioDataRetriever) -> None:
+        if self._owns_client:
+            await self._client.aclose()
+        if self._cache is not None:
+            self._cache.close()
+
+    async def __aenter__(self: AsyncSecapioDataRetriever) -> AsyncSecapioDataRetriever:
+        return self
+
+    async def __aexit__(
+        self: AsyncSecapioDataRetriever,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def retrieve_report_metadata(
+        self: AsyncSecapioDataRetriever,
+        doc_type: DocumentType | str,
+        *,
+        accession_number: str | None = None,
+        latest_from_ticker: str | None = None,
+    ) -> dict:
+        new_doc_type, key, value = self._prepare_metadata_lookup(
+            doc_type,
+            accession_number,
+            latest_from_ticker,
+        )
+        metadata = self._get_memoized_metadata(new_doc_type, key, value)
+        if metadata is not None:
+            return metadata
+        metadata = await self._call_latest_report_metadata_api(
+            new_doc_type,
+            key=key,
+            value=value,
+        )
+        if not metadata:
+            msg = "metadata is None"
+            raise RuntimeError(msg)
+        self._memoize_metadata(new_doc_type, key, value, metadata)
+        return metadata
+
+    async def retrieve_reports_metadata(
+        self: AsyncSecapioDataRetriever,
+        doc_type: DocumentType | str,
+        *,
+        accession_numbers: Iterable[str] | None = None,
+        tickers: Iterable[str] | None = None,
+    ) -> list[MetadataResult]:
+        """
+        Resolves many accession numbers, or the latest filing of many
+        tickers, with a few concurrent OR'ed query API requests. Returns one
+        `MetadataResult` per input key in input order.
+        """
+        batch = self._start_metadata_batch(doc_type, accession_numbers, tickers)
+        queries = self._metadata_batch_queries(batch)
+
+        async def fetch(query_string: str) -> list[dict] | Exception:
+            try:
+                data = await self._call_filings_query_api(query_string, 0, MAX_QUERY_PAGE_SIZE)
+            except (SecapioRequestError, SecapioApiKeyInvalidError) as e:
+                return e
+            return data["filings"]
+
+        responses = await asyncio.gather(*(fetch(query_string) for _, query_string in queries))
+        for (values, _), filings in zip(queries, responses):
+            self._resolve_metadata_batch(batch, values, filings)
+        if batch.key == "ticker":
+            values = list(batch.missing)
+            lookups = await asyncio.gather(
+                *(self.retrieve_report_metadata(batch.doc_type, latest_from_ticker=v) for v in values),
+                return_exceptions=True,
+            )
+            for value, result in zip(values, lookups):
+                if isinstance(result, (SecapioRequestError, SecapioApiKeyInvalidError)):
+                    self._set_metadata_batch_result(batch, value, error=result)
+                elif isinstance(result, BaseException):
+                    raise result
+                else:
+                    self._set_metadata_batch_result(batch, value, metadata=result)
+        return self._finish_metadata_batch(batch)
+
+    async def get_report_html(
+        self: AsyncSecapioDataRetriever,
+        doc_type: DocumentType | str,
+        url: str,
+        *,
+        sections: Iterable[SectionType | str] | str | None = None,
+    ) -> str:
+        """
+        With `sections="present"`, only the items an 8-K reports according to
+        its query API metadata are fetched, plus the signature.
+        """
+        return await super().get_report_html(
+            doc_type,
+            url,
+            sections=await self._resolve_sections(doc_type, url, sections),
+        )
+
+    async def gather_reports_html(
+        self: AsyncSecapioDataRetriever,
+        requests: Iterable[ReportRequest | tuple],
+        *,
+        return_exceptions: bool = False,
+    ) -> list[str | BaseException]:
+        """
+        Fetches the sections of many filings at once and returns the reports
+        in input order. All sections share the retriever's concurrency limit.
+        8-Ks requested with `sections="present"` are looked up with one
+        batched metadata query.
+        """
+        report_requests = [ReportRequest(*r) for r in requests]
+        request_sections, lookups = self._split_present_sections(report_requests)
+        if lookups:
+            results = await self.retrieve_reports_metadata(
+                DocumentType.FORM_8K,
+                accession_numbers=list(lookups.values()),
+            )
+            for i, result in zip(lookups, results):
+                request_sections[i] = self._sections_from_metadata(result.metadata)
+        coroutines = [
+            self.get_report_html(request.doc_type, request.url, sections=sections)
+            for request, sections in zip(report_requests, request_sections)
+        ]
+        return await asyncio.gather(*coroutines, return_exceptions=return_exceptions)
+
+    async def get_report(
+        self: AsyncSecapioDataRetriever,
+        doc_type: DocumentType | str,
+        url: str,
+        *,
+        sections: Iterable[SectionType | str] | str | None = None,
+    ) -> Report:
+        """
+        Retrieves the same document as `get_report_html`, returned as a
+        `Report` that indexes the byte range of every section.
+        """
+        sections = await self._resolve_sections(doc_type, url, sections)
+        doc_type, sections = self._validate_and_convert(doc_type, sections)
+        sections = list(sections or FORM_SECTIONS[doc_type])
+        started = time.perf_counter()
+        try:
+            section_htmls = await asyncio.gather(
+                *(self._call_sections_extractor_api(url, section) for section in sections),
+            )
+        except Exception as e:
+            self._record_filing(url, doc_type, started, sections=len(sections), error=e)
+            raise
+        report = Report.from_sections(
+            (
+                ReportSection(section, _build_section_separator_html(section), section_html)
+                for section, section_html in zip(sections, section_htmls)
+            ),
+            doc_type=doc_type,
+        )
+        self._record_filing(url, doc_type, started, sections=len(sections), size=report.size)
+        return report
+
+    async def iter_report_sections(
+        self: AsyncSecapioDataRetriever,
+        doc_type: DocumentType | str,
+        url: str,
+        *,
+        sections: Iterable[SectionType | str] | str | None = None,
+        ordered: bool = True,
+    ) -> AsyncIterator[ReportSection]:
+        """
+        Fetches all sections concurrently and yields them one at a time, in
+        document order or, with `ordered=False`, as they arrive.
+        """
+        sections = await self._resolve_sections(doc_type, url, sections)
+        doc_type, sections = self._validate_and_convert(doc_type, sections)
+        sections = list(sections or FORM_SECTIONS[doc_type])
+
+        async def fetch(section: SectionType) -> ReportSection:
+            section_html = await self._call_sections_extractor_api(url, section)
+            return ReportSection(section, _build_section_separator_html(section), section_html)
+
+        tasks = [asyncio.ensure_future(fetch(section)) for section in sections]
+        try:
+            for next_task in tasks if ordered else asyncio.as_completed(tasks):
+                yield await next_task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _get_report_html(
+        self: AsyncSecapioDataRetriever,
+        doc_type: DocumentType,
+        url: str,
+        *,
+        sections: Iterable[SectionType] | None = None,
+    ) -> str:
+        sections = list(sections or FORM_SECTIONS[doc_type])
+        started = time.perf_counter()
+        try:
+            section_htmls = await asyncio.gather(
+                *(self._call_sections_extractor_api(url, section) for section in sections),
+            )
+        except Exception as e:
+            self._record_filing(url, doc_type, started, sections=len(sections), error=e)
+            raise
+        html = "\n".join(
+            _iter_report_parts(
+                ReportSection(section, _build_section_separator_html(section), section_html)
+                for section, section_html in zip(sections, section_htmls)
+            ),
+        )
+        self._record_filing(url, doc_type, started, sections=len(sections), html=html)
+        return html
+
+    async def _resolve_sections(
+        self: AsyncSecapioDataRetriever,
+        doc_type: DocumentType | str,
+        url: str,
+        sections: Iterable[SectionType | str] | str | None,
+    ) -> Iterable[SectionType | str] | None:
+        request_sections, lookups = self._split_present_sections([ReportRequest(doc_type, url, sections)])
+        if not lookups:
+            return request_sections[0]
+        try:
+            metadata = await self.retrieve_report_metadata(DocumentType.FORM_8K, accession_number=url)
+        except SecapioRequestError:
+            return None
+        return self._sections_from_metadata(metadata)
+
+    def _get_semaphore(self: AsyncSecapioDataRetriever) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        return self._semaphore
+
+    async def _call_sections_extractor_api(
+        self: AsyncSecapioDataRetriever,
+        url: str,
+        section: SectionType,
+    ) -> str:
+        started = time.perf_counter()
+        section_html = self._get_cached_section(url, section)
+        if section_html is not None:
+            self._record_section(url, section, started, html=section_html, cache_hit=True)
+            return section_html
+        started_at = time.monotonic()
+        while True:
+            try:
+                section_html = await self._adeduplicated(
+                    ("extractor", url, section),
+                    lambda: self._request_sections_extractor_api(url, section),
+                )
+            except Exception as e:
+                self._record_section(url, section, started, error=e)
+                raise
+            if not _is_processing_response(section_html):
+                self._set_cached_section(url, section, section_html)
+                self._record_section(url, section, started, html=section_html)
+                return section_html
+            # Sleeping here only suspends this section; other sections and
+            # filings keep running on the event loop.
+            waited_s = time.monotonic() - started_at
+            if waited_s + self._processing_poll_interval_s > self._processing_max_wait_s:
+                raise processing_timeout_error(url, section, waited_s)
+            await asyncio.sleep(self._processing_poll_interval_s)
+
+    async def _request_sections_extractor_api(
+        self: AsyncSecapioDataRetriever,
+        url: str,
+        section: SectionType,
+    ) -> str:
+        async def send() -> str:
+            async with self._get_semaphore():
+                response = await self._asend_keyed(
+                    lambda api_key, extensions: self._client.get(
+                        EXTRACTOR_API_URL,
+                        params=self._extractor_params(url, section, api_key),
+                        extensions=extensions,
+                    ),
+                    "extractor",
+                    url,
+                    section,
+                )
+            response.raise_for_status()
+            return response.text
+
+        try:
+            return await self._retry_policy.run_async(
+                send,
+                on_retry=self._retry_hook("extractor", url, section),
+            )
+        except httpx.HTTPStatusError as e:
+            _raise_if_not_found(e)
+            raise
+
+    async def _call_latest_report_metadata_api(
+        self: AsyncSecapioDataRetriever,
+        doc_type: DocumentType,
+        *,
+        key: str,
+        value: str,
+    ) -> dict:
+        key, value, query = _build_metadata_query(doc_type, key, value)
+        metadata = self._get_cached_metadata(doc_type, key, value)
+        if metadata is not None:
+            return metadata
+
+        async def send() -> httpx.Response:
+            async with self._get_semaphore():
+                res = await self._asend_keyed(
+                    lambda api_key, extensions: self._client.post(
+                        QUERY_API_URL,
+                        params={"token": api_key},
+                        json=query,
+                        extensions=extensions,
+                    ),
+                    "query",
+                )
+            res.raise_for_status()
+            return res
+
+        try:
+            res = await self._adeduplicated(
+                ("query", _query_key(query)),
+                lambda: self._retry_policy.run_async(send, on_retry=self._retry_hook("query")),
+            )
+        except (httpx.HTTPError, RetriesExhaustedError) as e:
+            _raise_metadata_request_error(e)
+        metadata = _parse_metadata_response(res.json(), doc_type, key, value)
+        self._set_cached_metadata(doc_type, key, value, metadata)
+        return metadata
+
+    async def _call_filings_query_api(
+        self: AsyncSecapioDataRetriever,
+        query_string: str,
+        start: int,
+        size: int,
+    ) -> dict:
+        query = _build_filings_query(query_string, start, size)
+
+        async def send() -> httpx.Response:
+            async with self._get_semaphore():
+                res = await self._asend_keyed(
+                    lambda api_key, extensions: self._client.post(
+                        QUERY_API_URL,
+                        params={"token": api_key},
+                        json=query,
+                        extensions=extensions,
+                    ),
+                    "query",
+                )
+            res.raise_for_status()
+            return res
+
+        try:
+            res = await self._adeduplicated(
+                ("query", _query_key(query)),
+                lambda: self._retry_policy.run_async(send, on_retry=self._retry_hook("query")),
+            )
+        except (httpx.HTTPError, RetriesExhaustedError) as e:
+            _raise_metadata_request_error(e)
+        return res.json()
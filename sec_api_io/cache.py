@@ -0,0 +1,449 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Hashable, NamedTuple
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+# Every stored entry starts with a codec byte and the creation timestamp, so
+# entries written with different compression settings can share one cache.
+_HEADER = struct.Struct("<Bd")
+_CODEC_RAW = 0
+_CODEC_ZLIB = 1
+_CODEC_ZSTD = 2
+_CODECS = {None: _CODEC_RAW, "zlib": _CODEC_ZLIB, "zstd": _CODEC_ZSTD}
+# SQLite hits are buffered and their access times written in batches this
+# large, so reads do not each start a write transaction.
+_ACCESS_FLUSH_BATCH = 64
+# Least recently used entries are deleted this many at a time.
+_EVICT_BATCH = 256
+
+
+class CacheCompressionNotAvailableError(ImportError):
+    pass
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    writes: int
+    evictions: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def make_cache_key(*parts: str) -> str:
+    """Content address of an API request, e.g. `(url, item, type)`."""
+    return hashlib.sha256("\x1f".join(parts).encode()).hexdigest()
+
+
+class ResponseCache(ABC):
+    """
+    Byte-value cache for API responses. Subclasses implement storage; this
+    class handles compression, TTL checks and hit/miss accounting.
+    """
+
+    def __init__(
+        self: ResponseCache,
+        *,
+        max_size_bytes: int | None = None,
+        ttl_s: float | None = None,
+        compression: str | None = "auto",
+    ) -> None:
+        if compression == "auto":
+            compression = "zstd" if zstandard is not None else "zlib"
+        if compression not in _CODECS:
+            msg = f"Unsupported compression {compression!r}"
+            raise ValueError(msg)
+        if compression == "zstd" and zstandard is None:
+            msg = "zstd compression requires the 'zstandard' package"
+            raise CacheCompressionNotAvailableError(msg)
+        self._max_size_bytes = max_size_bytes
+        self._ttl_s = ttl_s
+        self._compression = compression
+        self._stats_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._evictions = 0
+
+    @property
+    def stats(self: ResponseCache) -> CacheStats:
+        with self._stats_lock:
+            return CacheStats(self._hits, self._misses, self._writes, self._evictions)
+
+    def get(self: ResponseCache, key: str) -> bytes | None:
+        entry = self._read(key)
+        value = None
+        if entry is not None:
+            codec, created, payload = _split_entry(entry)
+            if self._ttl_s is not None and time.time() - created > self._ttl_s:
+                self._delete(key)
+            else:
+                value = _decompress(codec, payload)
+        with self._stats_lock:
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return value
+
+    def set(self: ResponseCache, key: str, value: bytes) -> None:
+        codec = _CODECS[self._compression]
+        entry = _HEADER.pack(codec, time.time()) + _compress(codec, value)
+        self._write(key, entry)
+        evicted = self._evict() if self._max_size_bytes is not None else 0
+        with self._stats_lock:
+            self._writes += 1
+            self._evictions += evicted
+
+    @abstractmethod
+    def clear(self: ResponseCache) -> None:
+        raise NotImplementedError  # pragma: no cover
+
+    def close(self: ResponseCache) -> None:
+        """Releases open handles; the cache can still be used afterwards."""
+
+    @abstractmethod
+    def _read(self: ResponseCache, key: str) -> bytes | None:
+        raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def _write(self: ResponseCache, key: str, entry: bytes) -> None:
+        raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def _delete(self: ResponseCache, key: str) -> None:
+        raise NotImplementedError  # pragma: no cover
+
+    @abstractmethod
+    def _evict(self: ResponseCache) -> int:
+        """Drops least recently used entries until under `max_size_bytes`."""
+        raise NotImplementedError  # pragma: no cover
+
+
+class FileSystemCache(ResponseCache):
+    """
+    One file per entry under `directory`. Writes go through a temporary file
+    and an atomic rename, so several processes can share the directory.
+    Recency for LRU eviction is tracked with the file modification time.
+    """
+
+    def __init__(
+        self: FileSystemCache,
+        directory: str | os.PathLike,
+        *,
+        max_size_bytes: int | None = None,
+        ttl_s: float | None = None,
+        compression: str | None = "auto",
+    ) -> None:
+        super().__init__(max_size_bytes=max_size_bytes, ttl_s=ttl_s, compression=compression)
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._size_lock = threading.Lock()
+        self._approx_size: int | None = None
+
+    def clear(self: FileSystemCache) -> None:
+        for path in self._entry_paths():
+            _unlink_missing_ok(path)
+        with self._size_lock:
+            self._approx_size = 0
+
+    def _path(self: FileSystemCache, key: str) -> Path:
+        return self._directory / key[:2] / key
+
+    def _entry_paths(self: FileSystemCache) -> list[Path]:
+        return [p for p in self._directory.glob("*/*") if not p.name.startswith(".")]
+
+    def _read(self: FileSystemCache, key: str) -> bytes | None:
+        path = self._path(key)
+        try:
+            entry = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return entry
+
+    def _write(self: FileSystemCache, key: str, entry: bytes) -> None:
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(entry)
+            os.replace(tmp_path, path)
+        except BaseException:
+            _unlink_missing_ok(Path(tmp_path))
+            raise
+        with self._size_lock:
+            if self._approx_size is not None:
+                self._approx_size += len(entry)
+
+    def _delete(self: FileSystemCache, key: str) -> None:
+        _unlink_missing_ok(self._path(key))
+
+    def _evict(self: FileSystemCache) -> int:
+        with self._size_lock:
+            # A full directory scan is only needed once the running estimate
+            # crosses the limit (or on first use).
+            if self._approx_size is not None and self._approx_size <= self._max_size_bytes:
+                return 0
+            entries = []
+            for path in self._entry_paths():
+                try:
+                    st = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+            total = sum(size for _, size, _ in entries)
+            evicted = 0
+            for _, size, path in sorted(entries, key=lambda e: e[0]):
+                if total <= self._max_size_bytes:
+                    break
+                _unlink_missing_ok(path)
+                total -= size
+                evicted += 1
+            self._approx_size = total
+            return evicted
+
+
+class SQLiteCache(ResponseCache):
+    """
+    Entries in a single SQLite database in WAL mode, which is safe to share
+    between threads (one connection per thread) and processes on one host.
+    Like `FileSystemCache`, the total size is tracked as a running estimate
+    and only summed again once it crosses `max_size_bytes`. Access times of
+    hits are written in batches.
+    """
+
+    def __init__(
+        self: SQLiteCache,
+        path: str | os.PathLike,
+        *,
+        max_size_bytes: int | None = None,
+        ttl_s: float | None = None,
+        compression: str | None = "auto",
+    ) -> None:
+        super().__init__(max_size_bytes=max_size_bytes, ttl_s=ttl_s, compression=compression)
+        self._db_path = str(path)
+        self._local = threading.local()
+        self._connections_lock = threading.Lock()
+        self._connections: list[sqlite3.Connection] = []
+        # Bumped by `close()` so that threads open fresh connections.
+        self._generation = 0
+        self._size_lock = threading.Lock()
+        self._approx_size: int | None = None
+        self._access_lock = threading.Lock()
+        self._accessed: dict[str, float] = {}
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+                "size INTEGER NOT NULL, accessed REAL NOT NULL)",
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+
+    def _connection(self: SQLiteCache) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.generation != self._generation:
+            # Each connection is only used by its thread, but `close()` may
+            # close it from another one.
+            conn = sqlite3.connect(self._db_path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            with self._connections_lock:
+                self._connections.append(conn)
+                self._local.conn = conn
+                self._local.generation = self._generation
+        return conn
+
+    def clear(self: SQLiteCache) -> None:
+        with self._access_lock:
+            self._accessed.clear()
+        with self._connection() as conn:
+            conn.execute("DELETE FROM entries")
+        with self._size_lock:
+            self._approx_size = 0
+
+    def close(self: SQLiteCache) -> None:
+        self._flush_accessed()
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+            self._generation += 1
+        for conn in connections:
+            conn.close()
+
+    def _read(self: SQLiteCache, key: str) -> bytes | None:
+        row = self._connection().execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        with self._access_lock:
+            self._accessed[key] = time.time()
+            flush = len(self._accessed) >= _ACCESS_FLUSH_BATCH
+        if flush:
+            self._flush_accessed()
+        return bytes(row[0])
+
+    def _flush_accessed(self: SQLiteCache) -> None:
+        with self._access_lock:
+            accessed, self._accessed = self._accessed, {}
+        if accessed:
+            with self._connection() as conn:
+                conn.executemany(
+                    "UPDATE entries SET accessed = ? WHERE key = ?",
+                    [(at, key) for key, at in accessed.items()],
+                )
+
+    def _write(self: SQLiteCache, key: str, entry: bytes) -> None:
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, accessed) VALUES (?, ?, ?, ?)",
+                (key, entry, len(entry), time.time()),
+            )
+        with self._size_lock:
+            if self._approx_size is not None:
+                self._approx_size += len(entry)
+
+    def _delete(self: SQLiteCache, key: str) -> None:
+        with self._connection() as conn:
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def _evict(self: SQLiteCache) -> int:
+        with self._size_lock:
+            # Replaced entries and other processes' writes make the estimate
+            # inexact, so it is corrected whenever it crosses the limit.
+            if self._approx_size is not None and self._approx_size <= self._max_size_bytes:
+                return 0
+            self._flush_accessed()
+            conn = self._connection()
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            evicted = 0
+            while total > self._max_size_bytes:
+                rows = conn.execute(
+                    "SELECT key, size FROM entries ORDER BY accessed LIMIT ?",
+                    (_EVICT_BATCH,),
+                ).fetchall()
+                if not rows:
+                    break
+                victims = []
+                for key, size in rows:
+                    if total <= self._max_size_bytes:
+                        break
+                    victims.append((key,))
+                    total -= size
+                with conn:
+                    conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+                evicted += len(victims)
+            self._approx_size = total
+            return evicted
+
+
+class LRUCache:
+    """
+    Bounded, thread-safe in-process cache with an optional TTL per entry.
+    Values are stored as is, without serialization.
+    """
+
+    def __init__(self: LRUCache, max_entries: int) -> None:
+        assert max_entries>=1, "max_entries cannot be less than 1."
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[Any, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._evictions = 0
+
+    def __len__(self: LRUCache) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def stats(self: LRUCache) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._writes, self._evictions)
+
+    def get(self: LRUCache, key: Hashable) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] is not None and entry[1] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def set(self: LRUCache, key: Hashable, value: Any, *, ttl_s: float | None = None) -> None:
+        expires_at = None if ttl_s is None else time.monotonic() + ttl_s
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            self._writes += 1
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self: LRUCache, key: Hashable) -> bool:
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def invalidate_where(self: LRUCache, predicate: Callable[[Hashable], bool]) -> int:
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self: LRUCache) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _split_entry(entry: bytes) -> tuple[int, float, bytes]:
+    codec, created = _HEADER.unpack_from(entry)
+    return codec, created, entry[_HEADER.size:]
+
+
+def _compress(codec: int, data: bytes) -> bytes:
+    if codec == _CODEC_ZSTD:
+        return zstandard.ZstdCompressor().compress(data)
+    if codec == _CODEC_ZLIB:
+        return zlib.compress(data)
+    return data
+
+
+def _decompress(codec: int, data: bytes) -> bytes:
+    if codec == _CODEC_ZSTD:
+        if zstandard is None:
+            msg = "cache entry is zstd-compressed but 'zstandard' is not installed"
+            raise CacheCompressionNotAvailableError(msg)
+        return zstandard.ZstdDecompressor().decompress(data)
+    if codec == _CODEC_ZLIB:
+        return zlib.decompress(data)
+    return data
+
+
+def _unlink_missing_ok(path: Path) -> None:
+    # `Path.unlink(missing_ok=True)` needs Python 3.8.
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
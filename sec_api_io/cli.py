@@ -0,0 +1,301 @@
+"""
+Bulk downloader for sec-api.io filings.
+
+Reads tickers, accession numbers or filing URLs, one per line, from a file
+or stdin, resolves their metadata with batched query API lookups and writes
+each report to `<output-dir>/<form>/<ticker>/<accession-number>/`:
+
+    sec-api-io --doc-type 8-K --sections present -o filings tickers.txt
+
+Reports already on disk are skipped, so an interrupted run can simply be
+started again. One JSON status line per input is written to `--status`,
+and progress goes to stderr.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, NamedTuple
+
+from sec_api_io.abstract_sec_data_retriever import ReportRequest
+from sec_api_io.concurrency import AUTO_WORKERS
+from sec_api_io.sec_edgar_enums import DocumentType
+from sec_api_io.sec_edgar_utils import PRESENT_SECTIONS
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from sec_api_io.secapio_data_retriever import SecapioDataRetriever
+
+REPORT_FILE_NAME = "primary-document-secapio.htm"
+_COMPRESSION_SUFFIXES = {None: "", "gzip": ".gz", "zstd": ".zst"}
+_ACCESSION_NUMBER_RE = re.compile(r"\d{10}-?\d{2}-?\d{6}")
+
+
+class DownloadSummary(NamedTuple):
+    done: int
+    skipped: int
+    failed: int
+    bytes_written: int
+    elapsed_s: float
+
+
+class _Target(NamedTuple):
+    input: str
+    url: str
+    metadata: dict
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="sec-api-io",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("input", nargs="?", default="-", help="file with one input per line, or - for stdin")
+    parser.add_argument("-o", "--output-dir", required=True, type=Path)
+    parser.add_argument("--doc-type", required=True, help="10-K, 10-Q or 8-K")
+    parser.add_argument("--sections", help='comma-separated section ids, or "present" for the items an 8-K reports')
+    parser.add_argument("--workers", type=_workers, default=AUTO_WORKERS, help='filings downloaded concurrently, or "auto" (default) to adapt to the API')
+    parser.add_argument("--compression", choices=["gzip", "zstd"])
+    parser.add_argument("--force", action="store_true", help="download reports that are already on disk")
+    parser.add_argument("--status", default="-", help="file to append JSONL status records to, or - for stdout")
+    parser.add_argument("--progress-interval", type=float, default=5.0, help="seconds between progress lines, 0 for none")
+    parser.add_argument("--rate-limit", type=float, help="maximum requests per second")
+    parser.add_argument("--api-key", help="defaults to the SECAPIO_API_KEY environment variable")
+    args = parser.parse_args(argv)
+
+    # Imported here so that `--help` and argument errors stay fast.
+    from sec_api_io.rate_limit import TokenBucketRateLimiter
+    from sec_api_io.secapio_data_retriever import SecapioDataRetriever
+
+    sections = args.sections
+    if sections and sections != PRESENT_SECTIONS:
+        sections = [s.strip() for s in sections.split(",") if s.strip()]
+    rate_limiter = TokenBucketRateLimiter(args.rate_limit) if args.rate_limit else None
+
+    input_file = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")  # noqa: SIM115
+    status = sys.stdout if args.status == "-" else open(args.status, "a", encoding="utf-8")  # noqa: SIM115
+    try:
+        with SecapioDataRetriever(args.api_key, rate_limiter=rate_limiter) as retriever:
+            summary = download(
+                retriever,
+                read_inputs(input_file),
+                doc_type=args.doc_type,
+                output_dir=args.output_dir,
+                sections=sections,
+                workers=args.workers,
+                compression=args.compression,
+                force=args.force,
+                status=status,
+                progress_interval_s=args.progress_interval,
+            )
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+        if status is not sys.stdout:
+            status.close()
+    return 1 if summary.failed else 0
+
+
+def _workers(value: str) -> int | str:
+    if value == AUTO_WORKERS:
+        return value
+    try:
+        workers = int(value)
+    except ValueError:
+        workers = 0
+    if workers < 1:
+        msg = f'expected "{AUTO_WORKERS}" or a positive integer, got {value!r}'
+        raise argparse.ArgumentTypeError(msg)
+    return workers
+
+
+def read_inputs(lines: Iterable[str]) -> list[str]:
+    """Non-empty lines that are not `#` comments, stripped."""
+    inputs = []
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            inputs.append(line)
+    return inputs
+
+
+def download(
+    retriever: SecapioDataRetriever,
+    inputs: Iterable[str],
+    *,
+    doc_type: DocumentType | str,
+    output_dir: str | Path,
+    sections: list[str] | str | None = None,
+    workers: int | str = AUTO_WORKERS,
+    compression: str | None = None,
+    force: bool = False,
+    status: IO[str] | None = None,
+    progress_interval_s: float = 0.0,
+) -> DownloadSummary:
+    """
+    Resolves `inputs` (tickers, accession numbers or filing URLs) to
+    filings of `doc_type` and writes every report under `output_dir`.
+    """
+    doc_type = DocumentType.from_str(doc_type) if isinstance(doc_type, str) else doc_type
+    inputs = list(inputs)
+    output_dir = Path(output_dir)
+    progress = _Progress(status, progress_interval_s)
+    # Inputs naming the same filing share one download but each gets a record.
+    by_url: dict[str, list[_Target]] = {}
+    downloads = []
+    for target in _resolve_targets(retriever, doc_type, inputs, progress):
+        path = _report_path(output_dir, doc_type, target.metadata, compression)
+        if path.exists() and not force:
+            progress.record(target, "skipped", path=path)
+        elif target.url in by_url:
+            by_url[target.url].append(target)
+        else:
+            by_url[target.url] = [target]
+            request = ReportRequest.from_metadata({**target.metadata, "linkToFilingDetails": target.url}, sections)
+            downloads.append((path, request))
+
+    # Reports are streamed from the responses to their files, never held whole.
+    for path, request, result in retriever.download_reports_to(
+        downloads,
+        workers=workers,
+        compression=compression,
+        return_exceptions=True,
+    ):
+        if not isinstance(result, BaseException):
+            progress.wrote(result)
+        for target in by_url[request.url]:
+            if isinstance(result, BaseException):
+                progress.record(target, "failed", error=result)
+            else:
+                progress.record(target, "done", path=path, size=result)
+    return progress.finish()
+
+
+def _resolve_targets(
+    retriever: SecapioDataRetriever,
+    doc_type: DocumentType,
+    inputs: list[str],
+    progress: _Progress,
+) -> list[_Target]:
+    urls: dict[str, str] = {}
+    accession_numbers = []
+    tickers = []
+    for value in inputs:
+        if value.startswith(("http://", "https://")):
+            match = re.search(r"\d{10}-\d{2}-\d{6}|\d{18}", value)
+            if match is None:
+                progress.record(_Target(value, value, {}), "failed", error=ValueError("no accession number in URL"))
+                continue
+            urls[value] = match.group()
+            accession_numbers.append(match.group())
+        elif _ACCESSION_NUMBER_RE.fullmatch(value):
+            accession_numbers.append(value)
+        else:
+            tickers.append(value)
+
+    results = {}
+    if accession_numbers:
+        for result in retriever.retrieve_reports_metadata(doc_type, accession_numbers=accession_numbers):
+            results.setdefault(("accession_number", result.key), result)
+    if tickers:
+        for result in retriever.retrieve_reports_metadata(doc_type, tickers=tickers):
+            results.setdefault(("ticker", result.key), result)
+
+    targets = []
+    for value in inputs:
+        if value in urls:
+            result = results[("accession_number", urls[value])]
+        elif ("accession_number", value) in results:
+            result = results[("accession_number", value)]
+        elif ("ticker", value) in results:
+            result = results[("ticker", value)]
+        else:
+            continue
+        if result.error is not None:
+            progress.record(_Target(value, value, {}), "failed", error=result.error)
+            continue
+        url = value if value in urls else result.metadata["linkToFilingDetails"]
+        targets.append(_Target(value, url, result.metadata))
+    return targets
+
+
+def _report_path(output_dir: Path, doc_type: DocumentType, metadata: dict, compression: str | None) -> Path:
+    ticker = metadata.get("ticker") or "UNKNOWN"
+    file_name = REPORT_FILE_NAME + _COMPRESSION_SUFFIXES[compression]
+    return output_dir / doc_type.value / ticker / metadata["accessionNo"] / file_name
+
+
+class _Progress:
+    """Writes status records and periodic throughput lines, and keeps the totals."""
+
+    def __init__(self: _Progress, status: IO[str] | None, interval_s: float) -> None:
+        self._status = status
+        self._interval_s = interval_s
+        self._started = time.monotonic()
+        self._reported_at = self._started
+        self._counts = {"done": 0, "skipped": 0, "failed": 0}
+        self._bytes_written = 0
+
+    def record(
+        self: _Progress,
+        target: _Target,
+        state: str,
+        *,
+        path: Path | None = None,
+        size: int | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        self._counts[state] += 1
+        if self._status is not None:
+            record = {
+                "input": target.input,
+                "status": state,
+                "ticker": target.metadata.get("ticker"),
+                "accession_number": target.metadata.get("accessionNo"),
+                "url": target.url,
+                "path": path and str(path),
+                "bytes": size,
+                "error": error and f"{type(error).__name__}: {error}",
+                "elapsed_s": round(time.monotonic() - self._started, 3),
+            }
+            self._status.write(json.dumps(record) + "\n")
+            self._status.flush()
+        now = time.monotonic()
+        if self._interval_s and now - self._reported_at >= self._interval_s:
+            self._reported_at = now
+            self._report(now)
+
+    def wrote(self: _Progress, size: int) -> None:
+        self._bytes_written += size
+
+    def finish(self: _Progress) -> DownloadSummary:
+        now = time.monotonic()
+        if self._interval_s:
+            self._report(now)
+        return DownloadSummary(
+            self._counts["done"],
+            self._counts["skipped"],
+            self._counts["failed"],
+            self._bytes_written,
+            now - self._started,
+        )
+
+    def _report(self: _Progress, now: float) -> None:
+        elapsed_s = max(now - self._started, 1e-9)
+        print(
+            f"{self._counts['done']} done, {self._counts['skipped']} skipped, "
+            f"{self._counts['failed']} failed in {elapsed_s:.1f}s "
+            f"({self._counts['done'] / elapsed_s:.2f} filings/s, "
+            f"{self._bytes_written / elapsed_s / 1e6:.2f} MB/s)",
+            file=sys.stderr,
+        )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+
+# Passed as `workers` (or `max_concurrency`) to let an
+# `AdaptiveConcurrencyLimiter` pick the number of requests in flight.
+AUTO_WORKERS = "auto"
+# How quickly the latency baseline follows latencies above it, so that it
+# recovers when the server's unloaded latency rises for good.
+_BASELINE_DRIFT = 0.01
+# Weight of a new sample in the smoothed latency compared to the baseline.
+_LATENCY_SMOOTHING = 0.2
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD limit on the number of requests in flight, shared by every thread
+    and asyncio task that uses it.
+
+    While at least half of the limit is in use and the smoothed request
+    latency stays within `latency_tolerance` times the lowest latency seen,
+    every success adds `1 / limit`, so the limit grows by up to one per
+    round trip. A throttled (429), failed (5xx) or timed out request
+    multiplies it by `backoff_ratio`, and rising latency shrinks it in
+    proportion to how far the latency overshoots; either backs off at most
+    once per round trip, so a burst of failures from one window of requests
+    only counts once.
+    """
+
+    def __init__(
+        self: AdaptiveConcurrencyLimiter,
+        *,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff_ratio: float = 0.5,
+        latency_tolerance: float = 2.0,
+    ) -> None:
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            msg = "limits must satisfy 1 <= min_limit <= initial_limit <= max_limit"
+            raise ValueError(msg)
+        if not 0 < backoff_ratio < 1:
+            msg = "backoff_ratio must be between 0 and 1"
+            raise ValueError(msg)
+        if latency_tolerance < 1:
+            msg = "latency_tolerance cannot be less than 1"
+            raise ValueError(msg)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._backoff_ratio = backoff_ratio
+        self._latency_tolerance = latency_tolerance
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._async_waiters: deque[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+        self._baseline_latency_s: float | None = None
+        self._latency_s: float | None = None
+        self._backed_off_at = -math.inf
+
+    @property
+    def limit(self: AdaptiveConcurrencyLimiter) -> int:
+        return int(self._limit)
+
+    @property
+    def min_limit(self: AdaptiveConcurrencyLimiter) -> int:
+        return self._min_limit
+
+    @property
+    def max_limit(self: AdaptiveConcurrencyLimiter) -> int:
+        return self._max_limit
+
+    @property
+    def in_flight(self: AdaptiveConcurrencyLimiter) -> int:
+        return self._in_flight
+
+    def acquire(self: AdaptiveConcurrencyLimiter) -> None:
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+
+    async def acquire_async(self: AdaptiveConcurrencyLimiter) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self._in_flight < int(self._limit):
+                    self._in_flight += 1
+                    return
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._lock:
+                    if (loop, waiter) in self._async_waiters:
+                        self._async_waiters.remove((loop, waiter))
+                    else:
+                        # The wake-up this waiter received goes to another one.
+                        self._wake()
+                raise
+
+    def release(
+        self: AdaptiveConcurrencyLimiter,
+        latency_s: float | None = None,
+        *,
+        overloaded: bool = False,
+    ) -> None:
+        """
+        Frees a slot and adjusts the limit from the request's outcome.
+        Without `latency_s` the request does not count as a sample, e.g.
+        when it was cancelled.
+        """
+        with self._lock:
+            saturated = self._in_flight * 2 >= int(self._limit)
+            self._in_flight -= 1
+            if latency_s is not None:
+                self._adjust(latency_s, overloaded=overloaded, saturated=saturated)
+            self._wake()
+
+    def _adjust(
+        self: AdaptiveConcurrencyLimiter,
+        latency_s: float,
+        *,
+        overloaded: bool,
+        saturated: bool,
+    ) -> None:
+        now = time.monotonic()
+        if overloaded:
+            self._back_off(self._backoff_ratio, latency_s, now)
+            return
+        baseline = self._baseline_latency_s
+        if baseline is None or latency_s < baseline:
+            self._baseline_latency_s = baseline = latency_s
+        else:
+            self._baseline_latency_s = baseline + (latency_s - baseline) * _BASELINE_DRIFT
+        smoothed = self._latency_s
+        if smoothed is None:
+            self._latency_s = smoothed = latency_s
+        else:
+            self._latency_s = smoothed = smoothed + (latency_s - smoothed) * _LATENCY_SMOOTHING
+        threshold = baseline * self._latency_tolerance
+        if smoothed > threshold:
+            self._back_off(max(self._backoff_ratio, threshold / smoothed), latency_s, now)
+        elif saturated:
+            self._limit = min(float(self._max_limit), self._limit + 1 / self._limit)
+
+    def _back_off(self: AdaptiveConcurrencyLimiter, ratio: float, latency_s: float, now: float) -> None:
+        if now - self._backed_off_at < latency_s:
+            return
+        self._backed_off_at = now
+        self._limit = max(float(self._min_limit), self._limit * ratio)
+
+    def _wake(self: AdaptiveConcurrencyLimiter) -> None:
+        free = int(self._limit) - self._in_flight
+        if free <= 0:
+            return
+        self._condition.notify(free)
+        for _ in range(min(free, len(self._async_waiters))):
+            loop, waiter = self._async_waiters.popleft()
+            loop.call_soon_threadsafe(_set_waiter_result, waiter)
+
+
+def _set_waiter_result(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
@@ -0,0 +1,474 @@
+from __future__ import annotations
+
+import bisect
+import heapq
+import threading
+import time
+from typing import TYPE_CHECKING, NamedTuple
+
+import httpx
+
+try:
+    from opentelemetry import metrics as otel_metrics
+    from opentelemetry import trace as otel_trace
+except ImportError:  # pragma: no cover
+    otel_metrics = None
+    otel_trace = None
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from sec_api_io.sec_edgar_enums import DocumentType, SectionType
+
+LATENCY_BUCKETS_S = tuple(0.001 * 2**i for i in range(18))
+SIZE_BUCKETS_BYTES = tuple(256 * 4**i for i in range(10))
+CONCURRENCY_BUCKETS = tuple(2**i for i in range(9))
+
+
+class InstrumentationNotAvailableError(ImportError):
+    pass
+
+
+class RequestEvent(NamedTuple):
+    """One HTTP attempt. `connect_s` and `server_s` come from httpcore's trace extension."""
+
+    endpoint: str
+    url: str | None
+    section: SectionType | None
+    started_at: float
+    elapsed_s: float
+    connect_s: float
+    server_s: float | None
+    status_code: int | None
+    size: int | None
+    in_flight: int
+    error: BaseException | None
+
+
+class RetryEvent(NamedTuple):
+    endpoint: str
+    url: str | None
+    section: SectionType | None
+    attempt: int
+    delay_s: float
+    error: BaseException
+
+
+class SectionEvent(NamedTuple):
+    url: str
+    section: SectionType
+    started_at: float
+    elapsed_s: float
+    size: int | None
+    cache_hit: bool
+    error: BaseException | None
+
+
+class FilingEvent(NamedTuple):
+    """`elapsed_s` runs from the start of the call until the filing was complete."""
+
+    url: str
+    doc_type: DocumentType
+    started_at: float
+    elapsed_s: float
+    size: int | None
+    sections: int
+    error: BaseException | None
+
+
+class Instrumentation:
+    """
+    Receives an event for every HTTP attempt, retry, section and filing.
+
+    This base class ignores all events and is what retrievers use by default;
+    when `enabled` is false the retriever skips timing work entirely.
+    Hooks run on the thread or event loop that made the request, so they
+    should be quick and thread-safe.
+    """
+
+    enabled = False
+
+    def request_finished(self: Instrumentation, event: RequestEvent) -> None:
+        pass
+
+    def retry_scheduled(self: Instrumentation, event: RetryEvent) -> None:
+        pass
+
+    def section_finished(self: Instrumentation, event: SectionEvent) -> None:
+        pass
+
+    def filing_finished(self: Instrumentation, event: FilingEvent) -> None:
+        pass
+
+    def concurrency_limit_changed(self: Instrumentation, limit: int) -> None:
+        pass
+
+
+class Histogram:
+    """Fixed-bucket histogram; percentiles are estimated by bucket upper bounds."""
+
+    def __init__(self: Histogram, bounds: Sequence[float]) -> None:
+        self._bounds = list(bounds)
+        self._counts = [0] * (len(self._bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+
+    @property
+    def mean(self: Histogram) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def record(self: Histogram, value: float) -> None:
+        self._counts[bisect.bisect_left(self._bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self: Histogram, percentile: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = percentile / 100 * self.count
+        cumulative = 0
+        for bound, count in zip(self._bounds, self._counts):
+            cumulative += count
+            if cumulative >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def buckets(self: Histogram) -> list[tuple[float, int]]:
+        """`(upper_bound, count)` pairs; the last bound is infinity."""
+        return list(zip([*self._bounds, float("inf")], self._counts))
+
+    def snapshot(self: Histogram) -> dict:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+        }
+
+
+class InMemoryInstrumentation(Instrumentation):
+    """Aggregates events into histograms and counters, and keeps the slowest filings."""
+
+    enabled = True
+
+    def __init__(self: InMemoryInstrumentation, *, slowest_filings: int = 10) -> None:
+        self._lock = threading.Lock()
+        self._slowest_filings_size = slowest_filings
+        self.reset()
+
+    def reset(self: InMemoryInstrumentation) -> None:
+        with self._lock:
+            self._histograms = {
+                "request.latency_s": Histogram(LATENCY_BUCKETS_S),
+                "request.connect_s": Histogram(LATENCY_BUCKETS_S),
+                "request.server_s": Histogram(LATENCY_BUCKETS_S),
+                "request.size_bytes": Histogram(SIZE_BUCKETS_BYTES),
+                "request.in_flight": Histogram(CONCURRENCY_BUCKETS),
+                "retry.delay_s": Histogram(LATENCY_BUCKETS_S),
+                "section.latency_s": Histogram(LATENCY_BUCKETS_S),
+                "section.size_bytes": Histogram(SIZE_BUCKETS_BYTES),
+                "filing.latency_s": Histogram(LATENCY_BUCKETS_S),
+                "filing.size_bytes": Histogram(SIZE_BUCKETS_BYTES),
+            }
+            self._counters = dict.fromkeys(
+                (
+                    "requests",
+                    "request_errors",
+                    "retries",
+                    "sections",
+                    "section_errors",
+                    "section_cache_hits",
+                    "filings",
+                    "filing_errors",
+                ),
+                0,
+            )
+            self._gauges: dict[str, float] = {}
+            self._slowest_filings: list[tuple[float, int, FilingEvent]] = []
+            self._filing_sequence = 0
+
+    def histogram(self: InMemoryInstrumentation, name: str) -> Histogram:
+        return self._histograms[name]
+
+    @property
+    def counters(self: InMemoryInstrumentation) -> dict[str, int]:
+        with self._lock:
+            return dict(self._counters)
+
+    @property
+    def gauges(self: InMemoryInstrumentation) -> dict[str, float]:
+        with self._lock:
+            return dict(self._gauges)
+
+    def slowest_filings(self: InMemoryInstrumentation) -> list[FilingEvent]:
+        with self._lock:
+            return [event for _, _, event in sorted(self._slowest_filings, reverse=True)]
+
+    def snapshot(self: InMemoryInstrumentation) -> dict:
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "gauges": dict(self._gauges),
+                "histograms": {name: h.snapshot() for name, h in self._histograms.items()},
+            }
+
+    def request_finished(self: InMemoryInstrumentation, event: RequestEvent) -> None:
+        with self._lock:
+            self._counters["requests"] += 1
+            if event.error is not None or (event.status_code or 0) >= 400:
+                self._counters["request_errors"] += 1
+            self._histograms["request.latency_s"].record(event.elapsed_s)
+            self._histograms["request.connect_s"].record(event.connect_s)
+            self._histograms["request.in_flight"].record(event.in_flight)
+            if event.server_s is not None:
+                self._histograms["request.server_s"].record(event.server_s)
+            if event.size is not None:
+                self._histograms["request.size_bytes"].record(event.size)
+
+    def retry_scheduled(self: InMemoryInstrumentation, event: RetryEvent) -> None:
+        with self._lock:
+            self._counters["retries"] += 1
+            self._histograms["retry.delay_s"].record(event.delay_s)
+
+    def section_finished(self: InMemoryInstrumentation, event: SectionEvent) -> None:
+        with self._lock:
+            self._counters["sections"] += 1
+            if event.error is not None:
+                self._counters["section_errors"] += 1
+                return
+            if event.cache_hit:
+                self._counters["section_cache_hits"] += 1
+            self._histograms["section.latency_s"].record(event.elapsed_s)
+            if event.size is not None:
+                self._histograms["section.size_bytes"].record(event.size)
+
+    def filing_finished(self: InMemoryInstrumentation, event: FilingEvent) -> None:
+        with self._lock:
+            self._counters["filings"] += 1
+            if event.error is not None:
+                self._counters["filing_errors"] += 1
+                return
+            self._histograms["filing.latency_s"].record(event.elapsed_s)
+            if event.size is not None:
+                self._histograms["filing.size_bytes"].record(event.size)
+            if self._slowest_filings_size:
+                self._filing_sequence += 1
+                item = (event.elapsed_s, self._filing_sequence, event)
+                if len(self._slowest_filings) < self._slowest_filings_size:
+                    heapq.heappush(self._slowest_filings, item)
+                else:
+                    heapq.heappushpop(self._slowest_filings, item)
+
+    def concurrency_limit_changed(self: InMemoryInstrumentation, limit: int) -> None:
+        with self._lock:
+            self._gauges["concurrency.limit"] = limit
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """
+    Emits a span per event and records duration and size histograms through
+    the OpenTelemetry API. Spans are created when an event finishes, with
+    its original start time, and are not nested under each other.
+    """
+
+    enabled = True
+
+    def __init__(
+        self: OpenTelemetryInstrumentation,
+        *,
+        tracer_provider: object | None = None,
+        meter_provider: object | None = None,
+    ) -> None:
+        if otel_trace is None:
+            msg = "OpenTelemetryInstrumentation requires the 'opentelemetry-api' package"
+            raise InstrumentationNotAvailableError(msg)
+        self._tracer = otel_trace.get_tracer("sec_api_io", tracer_provider=tracer_provider)
+        meter = otel_metrics.get_meter("sec_api_io", meter_provider=meter_provider)
+        self._request_duration = meter.create_histogram("sec_api_io.request.duration", unit="s")
+        self._section_duration = meter.create_histogram("sec_api_io.section.duration", unit="s")
+        self._section_size = meter.create_histogram("sec_api_io.section.size", unit="By")
+        self._filing_duration = meter.create_histogram("sec_api_io.filing.duration", unit="s")
+        self._retries = meter.create_counter("sec_api_io.retries")
+        self._concurrency_limit = meter.create_up_down_counter("sec_api_io.concurrency.limit")
+        self._concurrency_limit_lock = threading.Lock()
+        self._last_concurrency_limit = 0
+
+    def request_finished(self: OpenTelemetryInstrumentation, event: RequestEvent) -> None:
+        attributes = {
+            "sec_api_io.endpoint": event.endpoint,
+            "sec_api_io.url": event.url,
+            "sec_api_io.section": event.section and event.section.value,
+            "http.response.status_code": event.status_code,
+            "sec_api_io.connect_s": event.connect_s,
+            "sec_api_io.server_s": event.server_s,
+            "sec_api_io.in_flight": event.in_flight,
+        }
+        self._emit_span("sec_api_io.request", event.started_at, event.elapsed_s, attributes, event.error)
+        self._request_duration.record(event.elapsed_s, {"sec_api_io.endpoint": event.endpoint})
+
+    def retry_scheduled(self: OpenTelemetryInstrumentation, event: RetryEvent) -> None:
+        self._retries.add(1, {"sec_api_io.endpoint": event.endpoint})
+
+    def section_finished(self: OpenTelemetryInstrumentation, event: SectionEvent) -> None:
+        attributes = {
+            "sec_api_io.url": event.url,
+            "sec_api_io.section": event.section.value,
+            "sec_api_io.cache_hit": event.cache_hit,
+            "sec_api_io.size": event.size,
+        }
+        self._emit_span("sec_api_io.section", event.started_at, event.elapsed_s, attributes, event.error)
+        if event.error is None:
+            self._section_duration.record(event.elapsed_s, {"sec_api_io.cache_hit": event.cache_hit})
+            if event.size is not None:
+                self._section_size.record(event.size)
+
+    def filing_finished(self: OpenTelemetryInstrumentation, event: FilingEvent) -> None:
+        attributes = {
+            "sec_api_io.url": event.url,
+            "sec_api_io.doc_type": event.doc_type.value,
+            "sec_api_io.sections": event.sections,
+            "sec_api_io.size": event.size,
+        }
+        self._emit_span("sec_api_io.filing", event.started_at, event.elapsed_s, attributes, event.error)
+        if event.error is None:
+            self._filing_duration.record(event.elapsed_s, {"sec_api_io.doc_type": event.doc_type.value})
+
+    def concurrency_limit_changed(self: OpenTelemetryInstrumentation, limit: int) -> None:
+        with self._concurrency_limit_lock:
+            delta = limit - self._last_concurrency_limit
+            self._last_concurrency_limit = limit
+        self._concurrency_limit.add(delta)
+
+    def _emit_span(
+        self: OpenTelemetryInstrumentation,
+        name: str,
+        started_at: float,
+        elapsed_s: float,
+        attributes: dict,
+        error: BaseException | None,
+    ) -> None:
+        start_time = int(started_at * 1e9)
+        span = self._tracer.start_span(
+            name,
+            start_time=start_time,
+            attributes={k: v for k, v in attributes.items() if v is not None},
+        )
+        if error is not None:
+            span.record_exception(error)
+            span.set_status(otel_trace.Status(otel_trace.StatusCode.ERROR, str(error)))
+        span.end(end_time=start_time + int(elapsed_s * 1e9))
+
+
+class ConcurrencyGauge:
+    """Counts requests currently in flight on one retriever."""
+
+    def __init__(self: ConcurrencyGauge) -> None:
+        self._lock = threading.Lock()
+        self._value = 0
+
+    @property
+    def value(self: ConcurrencyGauge) -> int:
+        return self._value
+
+    def enter(self: ConcurrencyGauge) -> int:
+        with self._lock:
+            self._value += 1
+            return self._value
+
+    def exit(self: ConcurrencyGauge) -> None:
+        with self._lock:
+            self._value -= 1
+
+
+class RequestRecorder:
+    """
+    Times one HTTP attempt and reports it as a `RequestEvent`. Pass
+    `extensions` (or `async_extensions` for `httpx.AsyncClient`) to the
+    request to also collect connection and server timings.
+    """
+
+    def __init__(
+        self: RequestRecorder,
+        instrumentation: Instrumentation,
+        gauge: ConcurrencyGauge,
+        endpoint: str,
+        url: str | None = None,
+        section: SectionType | None = None,
+    ) -> None:
+        self._instrumentation = instrumentation
+        self._gauge = gauge
+        self._endpoint = endpoint
+        self._url = url
+        self._section = section
+        self._marks: dict[str, float] = {}
+        self._connect_s = 0.0
+        self._server_s: float | None = None
+        self._request_sent_at: float | None = None
+        self._in_flight = gauge.enter()
+        self._started = time.perf_counter()
+
+    @property
+    def extensions(self: RequestRecorder) -> dict:
+        return {"trace": self._trace}
+
+    @property
+    def async_extensions(self: RequestRecorder) -> dict:
+        return {"trace": self._async_trace}
+
+    def finish(
+        self: RequestRecorder,
+        response: httpx.Response | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        elapsed_s = time.perf_counter() - self._started
+        self._gauge.exit()
+        size = None
+        if response is not None:
+            try:
+                size = len(response.content)
+            except httpx.ResponseNotRead:
+                # Streamed responses are timed up to their headers.
+                length = response.headers.get("content-length")
+                size = None if length is None else int(length)
+        self._instrumentation.request_finished(
+            RequestEvent(
+                endpoint=self._endpoint,
+                url=self._url,
+                section=self._section,
+                started_at=time.time() - elapsed_s,
+                elapsed_s=elapsed_s,
+                connect_s=self._connect_s,
+                server_s=self._server_s,
+                status_code=None if response is None else response.status_code,
+                size=size,
+                in_flight=self._in_flight,
+                error=error,
+            ),
+        )
+
+    def _trace(self: RequestRecorder, name: str, info: dict) -> None:
+        now = time.perf_counter()
+        step, _, phase = name.rpartition(".")
+        if phase == "started":
+            self._marks[step] = now
+            return
+        started = self._marks.pop(step, None)
+        if started is None:
+            return
+        if step.endswith(("connect_tcp", "connect_unix_socket", "start_tls")):
+            self._connect_s += now - started
+        elif step.endswith("send_request_body"):
+            self._request_sent_at = now
+        elif step.endswith("receive_response_headers") and self._request_sent_at is not None:
+            self._server_s = now - self._request_sent_at
+
+    async def _async_trace(self: RequestRecorder, name: str, info: dict) -> None:
+        self._trace(name, info)
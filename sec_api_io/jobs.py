@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import itertools
+import sqlite3
+import threading
+import time
+import zlib
+from typing import TYPE_CHECKING, NamedTuple
+
+import httpx
+from sec_api_io.abstract_sec_data_retriever import ReportRequest, ReportSection
+from sec_api_io.report import Report
+from sec_api_io.scheduler import SectionJob, section_priority
+from sec_api_io.sec_edgar_enums import FORM_SECTIONS, DocumentType, SectionType
+from sec_api_io.sec_edgar_utils import parse_sections
+from sec_api_io.secapio_data_retriever import _build_section_separator_html
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterable, Iterator
+
+    from sec_api_io.archive import ReportArchive
+    from sec_api_io.secapio_data_retriever import SecapioDataRetriever
+
+PENDING = "pending"
+RETRY = "retry"
+DONE = "done"
+FAILED = "failed"
+# Outstanding sections are read from the journal and scheduled this many at
+# a time, so resuming a large job does not load every row at once.
+JOURNAL_PAGE_SIZE = 1000
+
+
+class JobSummary(NamedTuple):
+    done: int
+    failed: int
+    pending: int
+
+
+class JobFailure(NamedTuple):
+    url: str
+    section: str
+    attempts: int
+    error: str
+
+
+class BulkDownloadJob:
+    """
+    Resumable bulk download driven by a SQLite journal at `journal_path`.
+
+    Every (filing, section) pair is a journal row. Fetched sections are
+    kept in the journal until their filing is complete; the filing is then
+    stored in `archive` and its section rows keep only their status. Running
+    the job again, for example after a crash, skips everything already done.
+    Transient failures are retried in later passes, up to `max_attempts`
+    per section; permanent ones such as 404s are recorded and not retried.
+    A filing fails as soon as one of its sections fails permanently or runs
+    out of attempts.
+    """
+
+    def __init__(
+        self: BulkDownloadJob,
+        retriever: SecapioDataRetriever,
+        journal_path: str | os.PathLike,
+        archive: ReportArchive,
+        *,
+        max_attempts: int = 3,
+    ) -> None:
+        self._retriever = retriever
+        self._journal_path = str(journal_path)
+        self._archive = archive
+        self._max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self._journal_path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS filings ("
+                "url TEXT PRIMARY KEY, doc_type TEXT NOT NULL, status TEXT NOT NULL, "
+                "error TEXT, updated_at REAL NOT NULL)",
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sections ("
+                "url TEXT NOT NULL, section TEXT NOT NULL, position INTEGER NOT NULL, "
+                "status TEXT NOT NULL, attempts INTEGER NOT NULL DEFAULT 0, error TEXT, "
+                "html BLOB, updated_at REAL NOT NULL, PRIMARY KEY (url, section))",
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS sections_status ON sections (status)")
+
+    def add(self: BulkDownloadJob, requests: Iterable[ReportRequest | tuple]) -> int:
+        """Adds filings to the journal and returns how many were new."""
+        added = 0
+        now = time.time()
+        with self._lock, self._conn:
+            for request in (ReportRequest(*r) for r in requests):
+                doc_type = request.doc_type
+                if isinstance(doc_type, str):
+                    doc_type = DocumentType.from_str(doc_type)
+                sections = parse_sections(doc_type, request.sections) if request.sections else None
+                status = DONE if request.url in self._archive else PENDING
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO filings VALUES (?, ?, ?, NULL, ?)",
+                    (request.url, doc_type.value, status, now),
+                )
+                if not cursor.rowcount:
+                    continue
+                added += 1
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO sections (url, section, position, status, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (request.url, section.value, position, status, now)
+                        for position, section in enumerate(sections or FORM_SECTIONS[doc_type])
+                    ],
+                )
+        return added
+
+    def run(
+        self: BulkDownloadJob,
+        *,
+        workers: int = 4,
+        max_passes: int = 3,
+        retry_delay_s: float = 10.0,
+    ) -> JobSummary:
+        """
+        Fetches every outstanding section. Sections that fail transiently are
+        retried in up to `max_passes` passes, `retry_delay_s` apart.
+        """
+        for pass_number in range(max_passes):
+            pages = self._outstanding_pages()
+            first_page = next(pages, None)
+            if first_page is None:
+                break
+            if pass_number:
+                time.sleep(retry_delay_s)
+            scheduler = self._retriever.make_section_scheduler(workers)
+            for jobs in itertools.chain((first_page,), pages):
+                urls = [url for url, _ in jobs]
+                section_jobs = [
+                    SectionJob(i, 0, url, section, section_priority(section))
+                    for i, (url, section) in enumerate(jobs)
+                ]
+                for job, result in scheduler.run(section_jobs):
+                    self._record(urls[job.filing_index], job.section, result)
+        return self.summary()
+
+    def summary(self: BulkDownloadJob) -> JobSummary:
+        with self._lock:
+            counts = dict(self._conn.execute("SELECT status, COUNT(*) FROM filings GROUP BY status"))
+        return JobSummary(counts.get(DONE, 0), counts.get(FAILED, 0), counts.get(PENDING, 0))
+
+    def failures(self: BulkDownloadJob) -> list[JobFailure]:
+        """Sections that failed permanently or ran out of attempts."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT url, section, attempts, error FROM sections "
+                "WHERE status = ? OR (status = ? AND attempts >= ?) ORDER BY url, position",
+                (FAILED, RETRY, self._max_attempts),
+            ).fetchall()
+        return [JobFailure(*row) for row in rows]
+
+    def close(self: BulkDownloadJob) -> None:
+        self._conn.close()
+
+    def _outstanding_pages(self: BulkDownloadJob) -> Iterator[list[tuple[str, SectionType]]]:
+        # Keyset pagination on (url, position): rows recorded while a page
+        # is being fetched never shift the pages that follow it.
+        last_url, last_position = "", -1
+        while True:
+            with self._lock:
+                # Sections of a filing that already failed permanently are skipped.
+                rows = self._conn.execute(
+                    "SELECT s.url, s.section, s.position FROM sections s JOIN filings f ON f.url = s.url "
+                    "WHERE f.status = ? AND (s.status = ? OR (s.status = ? AND s.attempts < ?)) "
+                    "AND (s.url > ? OR (s.url = ? AND s.position > ?)) "
+                    "ORDER BY s.url, s.position LIMIT ?",
+                    (PENDING, PENDING, RETRY, self._max_attempts, last_url, last_url, last_position, JOURNAL_PAGE_SIZE),
+                ).fetchall()
+            if not rows:
+                return
+            last_url, _, last_position = rows[-1]
+            yield [(url, SectionType.from_str(section)) for url, section, _ in rows]
+
+    def _record(
+        self: BulkDownloadJob,
+        url: str,
+        section: SectionType,
+        result: str | BaseException,
+    ) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            if isinstance(result, BaseException):
+                status = FAILED if self._is_permanent(result) else RETRY
+                self._conn.execute(
+                    "UPDATE sections SET status = ?, attempts = attempts + 1, error = ?, updated_at = ? "
+                    "WHERE url = ? AND section = ?",
+                    (status, f"{type(result).__name__}: {result}", now, url, section.value),
+                )
+                attempts = self._conn.execute(
+                    "SELECT attempts FROM sections WHERE url = ? AND section = ?",
+                    (url, section.value),
+                ).fetchone()[0]
+                if status == FAILED:
+                    reason = f"section {section.value} failed permanently"
+                elif attempts >= self._max_attempts:
+                    reason = f"section {section.value} failed {attempts} times"
+                else:
+                    return
+                self._conn.execute(
+                    "UPDATE filings SET status = ?, error = ?, updated_at = ? WHERE url = ?",
+                    (FAILED, reason, now, url),
+                )
+                return
+            self._conn.execute(
+                "UPDATE sections SET status = ?, attempts = attempts + 1, error = NULL, html = ?, "
+                "updated_at = ? WHERE url = ? AND section = ?",
+                (DONE, zlib.compress(result.encode()), now, url, section.value),
+            )
+            remaining = self._conn.execute(
+                "SELECT COUNT(*) FROM sections WHERE url = ? AND status != ?",
+                (url, DONE),
+            ).fetchone()[0]
+            if remaining == 0:
+                try:
+                    self._complete_filing(url, now)
+                except Exception as e:
+                    self._conn.execute(
+                        "UPDATE filings SET status = ?, error = ?, updated_at = ? WHERE url = ?",
+                        (FAILED, f"{type(e).__name__}: {e}", now, url),
+                    )
+
+    def _complete_filing(self: BulkDownloadJob, url: str, now: float) -> None:
+        rows = self._conn.execute(
+            "SELECT section, html FROM sections WHERE url = ? ORDER BY position",
+            (url,),
+        ).fetchall()
+        doc_type = self._conn.execute("SELECT doc_type FROM filings WHERE url = ?", (url,)).fetchone()[0]
+        report_sections = []
+        for section_id, html in rows:
+            section = SectionType.from_str(section_id)
+            report_sections.append(
+                ReportSection(section, _build_section_separator_html(section), zlib.decompress(html).decode()),
+            )
+        report = Report.from_sections(
+            report_sections,
+            doc_type=DocumentType.from_str(doc_type),
+        )
+        self._archive.add_report(report, accession_number=url, url=url, replace=True)
+        # The archive now holds the filing, so the journal only keeps statuses.
+        self._conn.execute("UPDATE sections SET html = NULL WHERE url = ?", (url,))
+        self._conn.execute(
+            "UPDATE filings SET status = ?, error = NULL, updated_at = ? WHERE url = ?",
+            (DONE, now, url),
+        )
+
+    def _is_permanent(self: BulkDownloadJob, error: BaseException) -> bool:
+        if isinstance(error, httpx.HTTPStatusError):
+            return not self._retriever.retry_policy.is_retryable(error)
+        return isinstance(error, (ValueError, TypeError))
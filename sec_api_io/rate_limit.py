@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import struct
+import threading
+import time
+from abc import ABC, abstractmethod
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+
+class RateLimiterNotSupportedError(RuntimeError):
+    pass
+
+
+class RateLimiter(ABC):
+    """
+    Proactive client-side throttle. Callers reserve tokens up front and then
+    sleep outside of any lock, so threads, asyncio tasks and processes all
+    queue fairly behind the same budget.
+    """
+
+    def __init__(self: RateLimiter, rate_per_s: float, burst: int | None = None) -> None:
+        if rate_per_s <= 0:
+            msg = "rate_per_s must be positive"
+            raise ValueError(msg)
+        self._rate_per_s = rate_per_s
+        self._burst = burst if burst is not None else max(1, int(rate_per_s))
+        if self._burst < 1:
+            msg = "burst cannot be less than 1"
+            raise ValueError(msg)
+
+    @property
+    def rate_per_s(self: RateLimiter) -> float:
+        return self._rate_per_s
+
+    @property
+    def burst(self: RateLimiter) -> int:
+        return self._burst
+
+    def acquire(self: RateLimiter, tokens: int = 1) -> None:
+        delay = self._reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self: RateLimiter, tokens: int = 1) -> None:
+        delay = self._reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _refill(self: RateLimiter, tokens: float, updated_at: float, now: float) -> float:
+        return min(float(self._burst), tokens + (now - updated_at) * self._rate_per_s)
+
+    @abstractmethod
+    def _reserve(self: RateLimiter, tokens: int) -> float:
+        """Takes `tokens` from the bucket and returns how long to wait for them."""
+        raise NotImplementedError  # pragma: no cover
+
+
+class TokenBucketRateLimiter(RateLimiter):
+    """Token bucket shared by the threads and tasks of one process."""
+
+    def __init__(self: TokenBucketRateLimiter, rate_per_s: float, burst: int | None = None) -> None:
+        super().__init__(rate_per_s, burst)
+        self._lock = threading.Lock()
+        self._tokens = float(self._burst)
+        self._updated_at = time.monotonic()
+
+    def _reserve(self: TokenBucketRateLimiter, tokens: int) -> float:
+        with self._lock:
+            now = time.monotonic()
+            # The balance may go negative: that debt is the queue of callers
+            # that already hold a reservation and are sleeping it off.
+            self._tokens = self._refill(self._tokens, self._updated_at, now) - tokens
+            self._updated_at = now
+            return max(0.0, -self._tokens / self._rate_per_s)
+
+
+class FileLockRateLimiter(RateLimiter):
+    """
+    Token bucket whose state lives in a small file guarded by `flock`, so
+    every process on the host that uses the same `path` shares one budget.
+    """
+
+    _STATE = struct.Struct("<dd")
+
+    def __init__(
+        self: FileLockRateLimiter,
+        path: str | os.PathLike,
+        rate_per_s: float,
+        burst: int | None = None,
+    ) -> None:
+        if fcntl is None:
+            msg = "FileLockRateLimiter requires fcntl (POSIX)"
+            raise RateLimiterNotSupportedError(msg)
+        super().__init__(rate_per_s, burst)
+        self._path = os.fspath(path)
+        self._thread_lock = threading.Lock()
+
+    def _reserve(self: FileLockRateLimiter, tokens: int) -> float:
+        with self._thread_lock:
+            fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                now = time.time()
+                state = os.pread(fd, self._STATE.size, 0)
+                if len(state) == self._STATE.size:
+                    current, updated_at = self._STATE.unpack(state)
+                    current = self._refill(current, updated_at, now)
+                else:
+                    current = float(self._burst)
+                current -= tokens
+                os.pwrite(fd, self._STATE.pack(current, now), 0)
+            finally:
+                os.close(fd)
+        return max(0.0, -current / self._rate_per_s)
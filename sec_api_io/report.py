@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import mmap
+import os
+import re
+from typing import TYPE_CHECKING, NamedTuple, Union
+
+from sec_api_io.abstract_sec_data_retriever import ReportSection
+from sec_api_io.sec_edgar_enums import DocumentType, SectionType
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+    from types import TracebackType
+
+ReportBuffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+# Matches the start markers that `get_report_html` puts before each section,
+# including the newline that separates a marker from the section HTML.
+_MARKER_RE = re.compile(
+    rb'<top-level-section-start-marker id="(?P<id>[^"]*)"(?: title="(?P<title>[^"]*)")?'
+    rb"[^\n]*?</top-level-section-start-marker>\n",
+)
+_MARKER_START = b"<top-level-section-start-marker"
+_MAX_MARKER_LENGTH = 1024
+
+
+class SectionIndexEntry(NamedTuple):
+    """Where the HTML of one section lives inside the UTF-8 encoded report."""
+
+    section: SectionType
+    title: str
+    offset: int
+    length: int
+
+
+class Report:
+    """
+    An assembled report together with an index of its sections.
+
+    The document is kept as UTF-8 bytes (or a read-only mmap), and any
+    section is a constant-time slice of it; nothing is re-scanned after the
+    index has been built.
+    """
+
+    def __init__(
+        self: Report,
+        data: ReportBuffer,
+        index: Sequence[SectionIndexEntry],
+        *,
+        doc_type: DocumentType | None = None,
+    ) -> None:
+        self._data = data
+        self._view = memoryview(data)
+        self._index = tuple(index)
+        self._entries = {}
+        for entry in self._index:
+            self._entries.setdefault(entry.section, entry)
+        self.doc_type = doc_type
+
+    @classmethod
+    def from_sections(
+        cls: type[Report],
+        report_sections: Iterable[ReportSection],
+        *,
+        doc_type: DocumentType | None = None,
+    ) -> Report:
+        """Assembles the same document `get_report_html` returns, indexing it on the way."""
+        buffer = bytearray()
+        index = []
+        for position, report_section in enumerate(report_sections):
+            if position:
+                buffer += b"\n"
+            marker = report_section.marker.encode() + b"\n"
+            buffer += marker
+            body = report_section.html.encode()
+            match = _MARKER_RE.match(marker)
+            title = (match and match.group("title") or b"").decode()
+            index.append(SectionIndexEntry(report_section.section, title, len(buffer), len(body)))
+            buffer += body
+        return cls(bytes(buffer), index, doc_type=doc_type)
+
+    @classmethod
+    def parse(
+        cls: type[Report],
+        data: ReportBuffer | str,
+        *,
+        doc_type: DocumentType | None = None,
+    ) -> Report:
+        """Builds the index of an existing report with a single scan for start markers."""
+        if isinstance(data, str):
+            data = data.encode()
+        return cls(data, build_section_index(data), doc_type=doc_type)
+
+    @classmethod
+    def open(
+        cls: type[Report],
+        path: str | os.PathLike,
+        *,
+        index: Sequence[SectionIndexEntry] | None = None,
+        doc_type: DocumentType | None = None,
+    ) -> Report:
+        """
+        Memory-maps an uncompressed report file. A previously stored `index`
+        skips the scan entirely. Close the report to release the mapping.
+        """
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                data: ReportBuffer = b""
+            else:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if index is None:
+            index = build_section_index(data)
+        return cls(data, index, doc_type=doc_type)
+
+    @property
+    def index(self: Report) -> tuple[SectionIndexEntry, ...]:
+        return self._index
+
+    @property
+    def sections(self: Report) -> list[SectionType]:
+        return [entry.section for entry in self._index]
+
+    @property
+    def size(self: Report) -> int:
+        """Length of the UTF-8 encoded document in bytes."""
+        return self._view.nbytes
+
+    @property
+    def html(self: Report) -> str:
+        return str(self._view, "utf-8")
+
+    def section_bytes(self: Report, section: SectionType | str) -> memoryview:
+        """Zero-copy view of a section; release it before closing an mmapped report."""
+        entry = self._entry(section)
+        return self._view[entry.offset:entry.offset + entry.length]
+
+    def __getitem__(self: Report, section: SectionType | str) -> str:
+        return str(self.section_bytes(section), "utf-8")
+
+    def __contains__(self: Report, section: object) -> bool:
+        try:
+            self._entry(section)
+        except (KeyError, ValueError):
+            return False
+        return True
+
+    def __len__(self: Report) -> int:
+        return len(self._index)
+
+    def __iter__(self: Report) -> Iterator[SectionType]:
+        return iter(self.sections)
+
+    def iter_sections(self: Report) -> Iterator[ReportSection]:
+        for entry in self._index:
+            end = entry.offset - 1
+            window_start = max(0, end - _MAX_MARKER_LENGTH)
+            start = window_start + bytes(self._view[window_start:end]).rfind(_MARKER_START)
+            marker = str(self._view[start:end], "utf-8")
+            html = str(self._view[entry.offset:entry.offset + entry.length], "utf-8")
+            yield ReportSection(entry.section, marker, html)
+
+    def close(self: Report) -> None:
+        self._view.release()
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+    def __enter__(self: Report) -> Report:
+        return self
+
+    def __exit__(
+        self: Report,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _entry(self: Report, section: SectionType | str) -> SectionIndexEntry:
+        if isinstance(section, str):
+            section = SectionType.from_str(section)
+        return self._entries[section]
+
+
+def build_section_index(data: ReportBuffer) -> list[SectionIndexEntry]:
+    """Finds every start marker in `data` and returns the section byte ranges between them."""
+    matches = list(_MARKER_RE.finditer(data))
+    index = []
+    for match, next_match in zip(matches, [*matches[1:], None]):
+        # Sections are separated by a newline before the next marker.
+        end = next_match.start() - 1 if next_match else len(data)
+        index.append(
+            SectionIndexEntry(
+                SectionType.from_str(match.group("id").decode()),
+                (match.group("title") or b"").decode(),
+                match.end(),
+                end - match.end(),
+            ),
+        )
+    return index
@@ -1,5 +1,10 @@
-from httpx._exceptions import HTTPStatusError
+from __future__ import annotations
+
+from email.utils import parsedate_to_datetime
+from httpx._exceptions import HTTPStatusError, TransportError
+import asyncio
 import random
+import threading
 import time
 
 
@@ -25,14 +30,7 @@ def retry_with_exponential_backoff(
  
             # Retry on specific errors
             except errors as e:
-                if e.response.status_code==404:
-                    # Do not retry on 404 status code.
-                    # This code block is highly unlikely to be reached when URL is fetched from metadata.
-                    raise HTTPStatusError(f"404 Not Found (Client Error). The URL may not be a correct "
-                                          f"filing type or section ID my be wrong. "
-                                          f"Filing URL: {e.request.url.params._dict['url']}. "
-                                          f"Secton ID: {e.request.url.params._dict['item']}.", 
-                                          request=e.request, response=e.response,)
+                _raise_if_not_found(e)
                 num_retries += 1
                 # Check if max retries has been reached
                 if num_retries > max_retries:
@@ -47,4 +45,174 @@ def retry_with_exponential_backoff(
             except Exception as e:
                 raise e
  
-    return wrapper
\ No newline at end of file
+    return wrapper
+
+
+def _raise_if_not_found(e: HTTPStatusError) -> None:
+    if e.response.status_code==404:
+        # Do not retry on 404 status code.
+        # This code block is highly unlikely to be reached when URL is fetched from metadata.
+        raise HTTPStatusError(f"404 Not Found (Client Error). The URL may not be a correct "
+                              f"filing type or section ID my be wrong. "
+                              f"Filing URL: {e.request.url.params._dict['url']}. "
+                              f"Secton ID: {e.request.url.params._dict['item']}.", 
+                              request=e.request, response=e.response,)
+
+
+class RetriesExhaustedError(Exception):
+    pass
+
+
+class RetryBudget:
+    """
+    Limits retries across every call that shares the budget. Each retry
+    withdraws one token and each first-attempt success deposits
+    `deposit_per_success`, so retries stay a bounded fraction of traffic
+    and a failing upstream cannot turn every caller into a retry loop.
+    """
+
+    def __init__(
+        self,
+        max_tokens: float = 100,
+        deposit_per_success: float = 0.1,
+    ):
+        self._max_tokens = max_tokens
+        self._deposit_per_success = deposit_per_success
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            return self._tokens
+
+    def try_withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(self._max_tokens, self._tokens + self._deposit_per_success)
+
+
+class RetryPolicy:
+    """
+    Decides whether and when to retry a failed request.
+
+    Only statuses in `retry_statuses` and (optionally) transport errors such
+    as timeouts and connection failures are retried. Delays use capped
+    decorrelated jitter, a `Retry-After` header takes precedence when
+    present (still capped at `max_delay_s`), and no retry is scheduled past `deadline_s` from the first
+    attempt or when the shared `budget` is empty.
+    """
+
+    DEFAULT_RETRY_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+    def __init__(
+        self,
+        *,
+        max_retries: int = 8,
+        base_delay_s: float = 0.1,
+        max_delay_s: float = 10.0,
+        retry_statuses: frozenset = DEFAULT_RETRY_STATUSES,
+        retry_transport_errors: bool = True,
+        respect_retry_after: bool = True,
+        deadline_s: float | None = 120.0,
+        budget: RetryBudget | None = None,
+    ):
+        self.max_retries = max_retries
+        self.base_delay_s = base_delay_s
+        self.max_delay_s = max_delay_s
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_transport_errors = retry_transport_errors
+        self.respect_retry_after = respect_retry_after
+        self.deadline_s = deadline_s
+        self.budget = budget if budget is not None else RetryBudget()
+
+    def is_retryable(self, error: BaseException) -> bool:
+        if isinstance(error, HTTPStatusError):
+            return error.response.status_code in self.retry_statuses
+        return self.retry_transport_errors and isinstance(error, TransportError)
+
+    def run(self, send, *, on_retry=None):
+        """Calls `send()` until it succeeds or the policy gives up."""
+        started_at = time.monotonic()
+        delay = self.base_delay_s
+        attempt = 0
+        while True:
+            try:
+                result = send()
+            except Exception as e:
+                delay = self._next_delay(e, attempt, delay, started_at)
+                attempt += 1
+                if on_retry is not None:
+                    on_retry(attempt, delay, e)
+                time.sleep(delay)
+                continue
+            if attempt == 0:
+                self.budget.deposit()
+            return result
+
+    async def run_async(self, send, *, on_retry=None):
+        """Awaits `send()` until it succeeds or the policy gives up."""
+        started_at = time.monotonic()
+        delay = self.base_delay_s
+        attempt = 0
+        while True:
+            try:
+                result = await send()
+            except Exception as e:
+                delay = self._next_delay(e, attempt, delay, started_at)
+                attempt += 1
+                if on_retry is not None:
+                    on_retry(attempt, delay, e)
+                await asyncio.sleep(delay)
+                continue
+            if attempt == 0:
+                self.budget.deposit()
+            return result
+
+    def _next_delay(self, error, attempt, previous_delay, started_at) -> float:
+        # Re-raises `error` (or a RetriesExhaustedError) when retrying is
+        # not allowed, otherwise returns how long to sleep.
+        if not self.is_retryable(error):
+            raise error
+        if attempt >= self.max_retries:
+            raise RetriesExhaustedError(
+                f"Maximum number of retries ({self.max_retries}) exceeded."
+            ) from error
+        delay = min(self.max_delay_s, random.uniform(self.base_delay_s, previous_delay * 3))
+        retry_after = self._retry_after_s(error) if self.respect_retry_after else None
+        if retry_after is not None:
+            # A server asking for a longer wait is retried after
+            # `max_delay_s` anyway rather than stalling the caller.
+            delay = min(retry_after, self.max_delay_s)
+        if self.deadline_s is not None:
+            remaining = self.deadline_s - (time.monotonic() - started_at)
+            if delay > remaining:
+                raise RetriesExhaustedError(
+                    f"Retry deadline of {self.deadline_s}s exceeded."
+                ) from error
+        if not self.budget.try_withdraw():
+            raise RetriesExhaustedError("Retry budget exhausted.") from error
+        return delay
+
+    @staticmethod
+    def _retry_after_s(error: BaseException) -> float | None:
+        if not isinstance(error, HTTPStatusError):
+            return None
+        value = error.response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, retry_at.timestamp() - time.time())
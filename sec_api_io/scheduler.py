@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import math
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Callable, NamedTuple
+
+from sec_api_io.sec_edgar_enums import SectionType
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+
+    from sec_api_io.concurrency import AdaptiveConcurrencyLimiter
+
+DEFAULT_PROCESSING_POLL_INTERVAL_S = 5.0
+DEFAULT_PROCESSING_MAX_WAIT_S = 120.0
+# Sections with a higher priority are fetched first; unlisted ones are 0.
+# MD&A and results of operations come first, exhibits and signatures last.
+DEFAULT_SECTION_PRIORITIES: dict[SectionType, int] = {
+    SectionType.FORM_10Q_PART1ITEM2: 10,
+    SectionType.FORM_10K_7: 10,
+    SectionType.FORM_8K_22: 10,
+    SectionType.FORM_10Q_PART1ITEM1: 5,
+    SectionType.FORM_10K_1A: 5,
+    SectionType.FORM_10K_8: 5,
+    SectionType.FORM_10Q_PART2ITEM6: -10,
+    SectionType.FORM_10K_15: -10,
+    SectionType.FORM_8K_91: -10,
+    SectionType.FORM_8K_SIGNATURE: -10,
+}
+
+
+class SectionPendingError(RuntimeError):
+    """The extractor has not finished processing the section yet."""
+
+
+class SectionProcessingTimeoutError(TimeoutError):
+    pass
+
+
+class SectionDeadlineExceededError(TimeoutError):
+    pass
+
+
+def processing_timeout_error(
+    url: str,
+    section: SectionType,
+    waited_s: float,
+) -> SectionProcessingTimeoutError:
+    msg = f"Section {section.value} of {url} was still being processed after {waited_s:.1f}s."
+    return SectionProcessingTimeoutError(msg)
+
+
+class SectionJob(NamedTuple):
+    """
+    One (filing, section) unit of work. `deadline` is a `time.monotonic()`
+    value after which the job is failed instead of started.
+    """
+
+    filing_index: int
+    position: int
+    url: str
+    section: SectionType
+    priority: int = 0
+    deadline: float | None = None
+
+
+def section_priority(section: SectionType, priorities: Mapping[SectionType, int] | None = None) -> int:
+    if priorities and section in priorities:
+        return priorities[section]
+    return DEFAULT_SECTION_PRIORITIES.get(section, 0)
+
+
+class SectionFetchScheduler:
+    """
+    Runs section fetches of any number of filings on one shared thread pool.
+
+    Jobs are handed to the pool only when a worker is free, so the queue of
+    pending work stays in the scheduler rather than in the executor. The
+    queue is ordered by priority, then deadline, then submission order, so
+    high-priority sections go first even when the pool is saturated; a job
+    whose deadline passes before a worker frees up fails with
+    `SectionDeadlineExceededError` without being fetched. A fetch
+    that raises `SectionPendingError` is parked in a delay queue and polled
+    again after `processing_poll_interval_s` without occupying a worker, for
+    at most `processing_max_wait_s`.
+
+    With a `limiter`, the pool has `limiter.max_limit` threads and only
+    `limiter.limit` jobs, read again whenever one finishes, are in flight.
+    """
+
+    def __init__(
+        self: SectionFetchScheduler,
+        fetch: Callable[[str, SectionType], str],
+        *,
+        workers: int | None = None,
+        limiter: AdaptiveConcurrencyLimiter | None = None,
+        processing_poll_interval_s: float = DEFAULT_PROCESSING_POLL_INTERVAL_S,
+        processing_max_wait_s: float = DEFAULT_PROCESSING_MAX_WAIT_S,
+    ) -> None:
+        if limiter is not None:
+            workers = limiter.max_limit
+        assert workers is not None and workers>=1, "workers cannot be less than 1."
+        self._fetch = fetch
+        self._workers = workers
+        self._limiter = limiter
+        self._processing_poll_interval_s = processing_poll_interval_s
+        self._processing_max_wait_s = processing_max_wait_s
+
+    def run(
+        self: SectionFetchScheduler,
+        jobs: Iterable[SectionJob],
+    ) -> Iterator[tuple[SectionJob, str | BaseException]]:
+        sequence = itertools.count()
+        pending = [_queue_entry(job, next(sequence)) for job in jobs]
+        heapq.heapify(pending)
+        in_flight: dict[Future, SectionJob] = {}
+        delayed: list[tuple[float, int, SectionJob]] = []
+        first_pending_at: dict[SectionJob, float] = {}
+        with ThreadPoolExecutor(max_workers=self._workers) as executor:
+            try:
+                while pending or in_flight or delayed:
+                    now = time.monotonic()
+                    while delayed and delayed[0][0] <= now:
+                        _, order, job = heapq.heappop(delayed)
+                        heapq.heappush(pending, _queue_entry(job, order))
+                    capacity = self._workers if self._limiter is None else self._limiter.limit
+                    while pending and len(in_flight) < capacity:
+                        job = heapq.heappop(pending)[-1]
+                        if job.deadline is not None and now > job.deadline:
+                            yield job, _deadline_exceeded_error(job)
+                            continue
+                        future = executor.submit(self._fetch, job.url, job.section)
+                        in_flight[future] = job
+                    timeout = max(0.0, delayed[0][0] - now) if delayed else None
+                    if not in_flight:
+                        # Nothing to wait on when every pending job just
+                        # passed its deadline; the loop ends if none are left.
+                        if timeout is not None:
+                            time.sleep(timeout)
+                        continue
+                    done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        job = in_flight.pop(future)
+                        error = future.exception()
+                        if isinstance(error, SectionPendingError):
+                            error = self._reschedule(job, delayed, first_pending_at, sequence)
+                            if error is None:
+                                continue
+                        yield job, (future.result() if error is None else error)
+            finally:
+                # Stop feeding the pool when the consumer stops early or a
+                # job fails; only requests already in flight are awaited.
+                pending.clear()
+                delayed.clear()
+                for future in in_flight:
+                    future.cancel()
+
+    def _reschedule(
+        self: SectionFetchScheduler,
+        job: SectionJob,
+        delayed: list[tuple[float, int, SectionJob]],
+        first_pending_at: dict[SectionJob, float],
+        sequence: Iterator[int],
+    ) -> SectionProcessingTimeoutError | None:
+        now = time.monotonic()
+        waited = now - first_pending_at.setdefault(job, now)
+        if waited + self._processing_poll_interval_s > self._processing_max_wait_s:
+            return processing_timeout_error(job.url, job.section, waited)
+        heapq.heappush(delayed, (now + self._processing_poll_interval_s, next(sequence), job))
+        return None
+
+
+def _queue_entry(job: SectionJob, order: int) -> tuple[int, float, int, SectionJob]:
+    return (-job.priority, math.inf if job.deadline is None else job.deadline, order, job)
+
+
+def _deadline_exceeded_error(job: SectionJob) -> SectionDeadlineExceededError:
+    msg = f"Section {job.section.value} of {job.url} was not started before its deadline."
+    return SectionDeadlineExceededError(msg)
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import functools
+import re
 from enum import Enum
 
 from frozendict import frozendict
 
+# "Part II, Item 1A" style 10-Q prefixes, once spaces and commas are gone.
+_ROMAN_PART_RE = re.compile(r"^part(ii|i)(?=item)")
+# "1.01", "1-01" and "1-1" are all 8-K item 1.01.
+_8K_ITEM_RE = re.compile(r"(\d+)[.-](\d+)")
+
 
 class DocumentType(Enum):
     INVALID_DOCUMENT_TYPE = (
@@ -15,11 +22,14 @@ class DocumentType(Enum):
 
     @staticmethod
     def from_str(s: str) -> DocumentType:
-        try:
-            return DocumentType(s.strip().upper())
-        except ValueError as e:
+        """Accepts the form name in any case, with or without "Form" or the hyphen."""
+        doc_type = _DOCUMENT_TYPES.get(s)
+        if doc_type is None:
+            doc_type = _lookup_document_type(s)
+        if doc_type is None:
             msg = f"Invalid document type {s}"
-            raise InvalidDocumentTypeError(msg) from e
+            raise InvalidDocumentTypeError(msg)
+        return doc_type
 
 
 class SectionType(Enum):
@@ -97,11 +107,18 @@ class SectionType(Enum):
 
     @staticmethod
     def from_str(s: str) -> SectionType:
-        try:
-            return SectionType(s.strip().lower())
-        except ValueError as e:
+        """
+        Accepts the extractor's section ids in any case as well as common
+        aliases: "Item 1A" and "item7" for 10-K items, "Part I, Item 2" for
+        10-Q items and "1.01" or "Item 1.01" for 8-K items.
+        """
+        section = _SECTIONS.get(s)
+        if section is None:
+            section = _lookup_section(s)
+        if section is None:
             msg = f"Invalid section {s}"
-            raise InvalidSectionTypeError(msg) from e
+            raise InvalidSectionTypeError(msg)
+        return section
 
     @property
     def name(self) -> str:
@@ -116,6 +133,44 @@ class InvalidSectionTypeError(ValueError):
     pass
 
 
+def _document_type_key(s: str) -> str:
+    key = re.sub(r"[\s_-]+", "", s.upper())
+    return key[len("FORM"):] if key.startswith("FORM") else key
+
+
+def _section_key(s: str) -> str:
+    key = re.sub(r"[\s,:_]+", "", s.lower()).rstrip(".")
+    key = _ROMAN_PART_RE.sub(lambda m: f"part{len(m.group(1))}", key)
+    if key.startswith("item"):
+        key = key[len("item"):]
+    match = _8K_ITEM_RE.fullmatch(key)
+    if match:
+        key = f"{int(match[1])}-{int(match[2])}"
+    return "signature" if key == "signatures" else key
+
+
+# Exact values are looked up first; anything else goes through the
+# normalized keys, whose results are cached per input string.
+_DOCUMENT_TYPES = {doc_type.value: doc_type for doc_type in DocumentType}
+_DOCUMENT_TYPE_KEYS = {_document_type_key(doc_type.value): doc_type for doc_type in DocumentType}
+_SECTIONS = {
+    section.value: section
+    for section in SectionType
+    if section != SectionType.INVALID_SECTION_TYPE
+}
+_SECTION_KEYS = {_section_key(value): section for value, section in _SECTIONS.items()}
+
+
+@functools.lru_cache(maxsize=1024)
+def _lookup_document_type(s: str) -> DocumentType | None:
+    return _DOCUMENT_TYPE_KEYS.get(_document_type_key(s))
+
+
+@functools.lru_cache(maxsize=4096)
+def _lookup_section(s: str) -> SectionType | None:
+    return _SECTION_KEYS.get(_section_key(s))
+
+
 FORM_SECTIONS = frozendict(
     {
         DocumentType.FORM_10Q: [
@@ -192,6 +247,11 @@ FORM_SECTIONS = frozendict(
     },
 )
 
+# Set views of `FORM_SECTIONS` for membership tests.
+FORM_SECTION_SETS = frozendict(
+    {doc_type: frozenset(sections) for doc_type, sections in FORM_SECTIONS.items()},
+)
+
 SECTION_NAMES = frozendict(
     {
         # Related to 10-Q
@@ -1,17 +1,47 @@
 from __future__ import annotations
 
+import functools
+import re
 from typing import TYPE_CHECKING
 
 from sec_api_io.sec_edgar_enums import (
+    FORM_SECTION_SETS,
     FORM_SECTIONS,
+    DocumentType,
     InvalidDocumentTypeError,
     InvalidSectionTypeError,
+    SectionType,
 )
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
-    from sec_api_io.sec_edgar_enums import DocumentType, SectionType
+# Passed as `sections` to fetch only the items an 8-K reports.
+PRESENT_SECTIONS = "present"
+_ITEM_NUMBER_RE = re.compile(r"(\d+)\.(\d+)")
+
+
+def is_present_sections(sections: object) -> bool:
+    return isinstance(sections, str) and sections == PRESENT_SECTIONS
+
+
+def sections_from_items(items: Iterable[str]) -> list[SectionType]:
+    """
+    Maps the `items` of an 8-K's query API metadata, such as
+    "Item 2.02: Results of Operations and Financial Condition", to their
+    extractor sections in document order, followed by the signature.
+    Items the extractor does not know are ignored.
+    """
+    present = set()
+    for item in items:
+        match = _ITEM_NUMBER_RE.search(item)
+        if match:
+            present.add(f"{int(match[1])}-{int(match[2])}")
+    return [
+        section
+        for section in FORM_SECTIONS[DocumentType.FORM_8K]
+        if section.value in present or section == SectionType.FORM_8K_SIGNATURE
+    ]
 
 
 def validate_sections(
@@ -21,11 +51,36 @@ def validate_sections(
     if sections is None:
         return
 
-    if doc_type not in FORM_SECTIONS:
+    if doc_type not in FORM_SECTION_SETS:
         msg = f"Unsupported document type: {doc_type}"
         raise InvalidDocumentTypeError(msg)
 
+    allowed = FORM_SECTION_SETS[doc_type]
     for section in sections:
-        if section not in FORM_SECTIONS[doc_type]:
+        if section not in allowed:
             msg = f"Unsupported section: {section}"
             raise InvalidSectionTypeError(msg)
+
+
+def parse_sections(
+    doc_type: DocumentType | str,
+    sections: Iterable[SectionType | str],
+) -> tuple[SectionType, ...]:
+    """
+    Converts `sections` (enum members, ids or aliases accepted by
+    `SectionType.from_str`) and checks that `doc_type` has them. Results are
+    cached per distinct list, so validating the same lists again is cheap.
+    """
+    if isinstance(doc_type, str):
+        doc_type = DocumentType.from_str(doc_type)
+    return _parse_sections(doc_type, tuple(sections))
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_sections(doc_type: DocumentType, sections: tuple[SectionType | str, ...]) -> tuple[SectionType, ...]:
+    parsed = tuple(
+        SectionType.from_str(section) if isinstance(section, str) else section
+        for section in sections
+    )
+    validate_sections(doc_type, parsed)
+    return parsed
@@ -1,16 +1,52 @@
 from __future__ import annotations
 
+import datetime
+import importlib.util
+import itertools
+import json
 import os
 import re
-from typing import TYPE_CHECKING
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import IO, TYPE_CHECKING, Callable, NamedTuple
 
-from concurrent.futures import ThreadPoolExecutor
 import httpx
-from sec_api_io.retry import retry_with_exponential_backoff
+from sec_api_io.retry import (
+    RetriesExhaustedError,
+    RetryPolicy,
+    _raise_if_not_found,
+)
+from sec_api_io.api_keys import ApiKeyPool
 from sec_api_io.abstract_sec_data_retriever import (
     AbstractSECDataRetriever,
     DocumentTypeNotSupportedError,
+    ReportRequest,
+    ReportSection,
+)
+from sec_api_io.cache import LRUCache, make_cache_key
+from sec_api_io.concurrency import AUTO_WORKERS, AdaptiveConcurrencyLimiter
+from sec_api_io.instrumentation import (
+    ConcurrencyGauge,
+    FilingEvent,
+    Instrumentation,
+    RequestRecorder,
+    RetryEvent,
+    SectionEvent,
+)
+from sec_api_io.report import Report
+from sec_api_io.scheduler import (
+    DEFAULT_PROCESSING_MAX_WAIT_S,
+    DEFAULT_PROCESSING_POLL_INTERVAL_S,
+    SectionFetchScheduler,
+    SectionJob,
+    SectionPendingError,
+    processing_timeout_error,
+    section_priority,
 )
+from sec_api_io.single_flight import SingleFlight
+from sec_api_io.sinks import open_report_sink
+from sec_api_io.sec_edgar_utils import is_present_sections, sections_from_items
 from sec_api_io.sec_edgar_enums import (
     FORM_SECTIONS,
     SECTION_NAMES,
@@ -19,9 +55,28 @@ from sec_api_io.sec_edgar_enums import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Awaitable, Iterable, Iterator, Mapping
+    from types import TracebackType
+
+    from sec_api_io.archive import ReportArchive
+    from sec_api_io.cache import CacheStats, ResponseCache
+    from sec_api_io.rate_limit import RateLimiter
+    from sec_api_io.sinks import ReportTarget
 
 ACCESSION_NUMBER_LENGTH = 18
+# Body the extractor returns while a section is still being extracted.
+PROCESSING_RESPONSE = "processing"
+EXTRACTOR_API_URL = "https://api.sec-api.io/extractor"
+QUERY_API_URL = "https://api.sec-api.io"
+# The query API returns at most this many filings per request.
+MAX_QUERY_PAGE_SIZE = 50
+# A ticker can match many filings, so fewer tickers than accession numbers
+# share a query; tickers whose latest filing is not on the first page are
+# looked up one by one.
+TICKERS_PER_QUERY = 10
+# Sections streamed by `download_report_to` are only kept for the response
+# cache up to this size, so a huge section is never held whole in memory.
+MAX_STREAMED_CACHE_ENTRY_BYTES = 8 * 1024 * 1024
 
 
 class ValueNotSetError(ValueError):
@@ -61,33 +116,151 @@ class SecapioRequestError(RuntimeError):
     pass
 
 
-class SecapioDataRetriever(AbstractSECDataRetriever):
-    """Retrieves data from sec-api.io API."""
+class MetadataResult(NamedTuple):
+    """Outcome of one key of a batched metadata lookup."""
+
+    key: str
+    metadata: dict | None
+    error: Exception | None
+
+
+class _MetadataBatch(NamedTuple):
+    doc_type: DocumentType
+    key: str
+    inputs: list[str]
+    results: list[MetadataResult | None]
+    # Normalized value -> positions in `inputs` still waiting for a result.
+    missing: dict[str, list[int]]
+
+
+class SecapioRetrieverMixin:
+    """Configuration and request building shared by the sync and async retrievers."""
 
     SUPPORTED_DOCUMENT_TYPES = frozenset({DocumentType.FORM_10Q, DocumentType.FORM_10K, DocumentType.FORM_8K})
     API_KEY_ENV_VAR_NAME = "SECAPIO_API_KEY"
 
-    def __init__(
-        self: SecapioDataRetriever,
-        api_key: str | None = None,
+    def _configure(
+        self,
+        api_key: str | Iterable[str] | ApiKeyPool | None,
         *,
-        timeout_s: int | None = None,
+        timeout_s: int | None,
+        max_connections: int,
+        max_keepalive_connections: int,
+        keepalive_expiry_s: float,
+        http2: bool | None,
+        cache: ResponseCache | None,
+        metadata_cache_size: int,
+        latest_metadata_ttl_s: float,
+        rate_limiter: RateLimiter | None,
+        retry_policy: RetryPolicy | None,
+        processing_poll_interval_s: float,
+        processing_max_wait_s: float,
+        instrumentation: Instrumentation | None,
+        single_flight: bool,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None,
     ) -> None:
-        self._api_key = get_value_or_env_var(
-            api_key,
-            self.API_KEY_ENV_VAR_NAME,
-            exc=SecapioApiKeyNotSetError,
-        )
+        self._api_key_pool = _make_api_key_pool(api_key, self.API_KEY_ENV_VAR_NAME)
         self._timeout_s = timeout_s or 10
+        self._pool_limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry_s,
+        )
+        self._http2 = _h2_available() if http2 is None else http2
+        self._cache = cache
+        self._metadata_cache = LRUCache(metadata_cache_size) if metadata_cache_size else None
+        self._latest_metadata_ttl_s = latest_metadata_ttl_s
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._processing_poll_interval_s = processing_poll_interval_s
+        self._processing_max_wait_s = processing_max_wait_s
+        self._instrumentation = instrumentation or Instrumentation()
+        self._in_flight = ConcurrencyGauge()
+        self._single_flight = SingleFlight() if single_flight else None
+        self._concurrency_limiter = concurrency_limiter
+        self._concurrency_limiter_lock = threading.Lock()
 
-    def retrieve_report_metadata(
-        self: SecapioDataRetriever,
-        doc_type: DocumentType | str,
+    @property
+    def pool_limits(self) -> httpx.Limits:
+        return self._pool_limits
+
+    @property
+    def cache(self) -> ResponseCache | None:
+        return self._cache
+
+    @property
+    def api_key_pool(self) -> ApiKeyPool:
+        return self._api_key_pool
+
+    @property
+    def rate_limiter(self) -> RateLimiter | None:
+        return self._rate_limiter
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        return self._retry_policy
+
+    @property
+    def instrumentation(self) -> Instrumentation:
+        return self._instrumentation
+
+    @property
+    def concurrency_limiter(self) -> AdaptiveConcurrencyLimiter | None:
+        return self._concurrency_limiter
+
+    @property
+    def metadata_cache_stats(self) -> CacheStats | None:
+        return None if self._metadata_cache is None else self._metadata_cache.stats
+
+    def invalidate_report_metadata(
+        self,
+        doc_type: DocumentType | str | None = None,
         *,
         accession_number: str | None = None,
         latest_from_ticker: str | None = None,
-    ) -> dict:
-        # Validate arguments
+    ) -> int:
+        """
+        Drops in-memory metadata entries matching every given filter and
+        returns how many were dropped. Without filters the cache is cleared.
+        """
+        if self._metadata_cache is None:
+            return 0
+        new_doc_type = DocumentType.from_str(doc_type) if isinstance(doc_type, str) else doc_type
+        accession_number = accession_number and _extract_accession_number(accession_number)
+        ticker = latest_from_ticker and _normalize_ticker(latest_from_ticker)
+
+        def matches(cache_key: tuple[DocumentType, str, str]) -> bool:
+            cached_doc_type, key, value = cache_key
+            if new_doc_type is not None and cached_doc_type != new_doc_type:
+                return False
+            if accession_number and (key, value) != ("accessionNo", accession_number):
+                return False
+            return not ticker or (key, value) == ("ticker", ticker)
+
+        return self._metadata_cache.invalidate_where(matches)
+
+    def _get_memoized_metadata(self, doc_type: DocumentType, key: str, value: str) -> dict | None:
+        if self._metadata_cache is None:
+            return None
+        metadata = self._metadata_cache.get((doc_type, key, value.strip()))
+        return None if metadata is None else dict(metadata)
+
+    def _memoize_metadata(self, doc_type: DocumentType, key: str, value: str, metadata: dict) -> None:
+        if self._metadata_cache is not None:
+            # A filing never changes, but the latest filing of a ticker does.
+            ttl_s = self._latest_metadata_ttl_s if key == "ticker" else None
+            self._metadata_cache.set((doc_type, key, value.strip()), dict(metadata), ttl_s=ttl_s)
+
+    @property
+    def http2(self) -> bool:
+        return self._http2
+
+    def _prepare_metadata_lookup(
+        self,
+        doc_type: DocumentType | str,
+        accession_number: str | None,
+        latest_from_ticker: str | None,
+    ) -> tuple[DocumentType, str, str]:
         if not accession_number and not latest_from_ticker:
             msg = "either url or ticker must be provided"
             raise ValueError(msg)
@@ -100,27 +273,743 @@ class SecapioDataRetriever(AbstractSECDataRetriever):
         if new_doc_type not in self.SUPPORTED_DOCUMENT_TYPES:
             msg = f"Document type {doc_type} not supported."
             raise DocumentTypeNotSupportedError(msg)
-
-        # Retrieve metadata
-        metadata = None
         if latest_from_ticker:
-            metadata = self._call_latest_report_metadata_api(
-                new_doc_type,
-                key="ticker",
-                value=latest_from_ticker,
+            return new_doc_type, "ticker", _normalize_ticker(latest_from_ticker)
+        return new_doc_type, "accessionNo", _extract_accession_number(accession_number)
+
+    def _start_metadata_batch(
+        self,
+        doc_type: DocumentType | str,
+        accession_numbers: Iterable[str] | None,
+        tickers: Iterable[str] | None,
+    ) -> _MetadataBatch:
+        if (accession_numbers is None) == (tickers is None):
+            msg = "exactly one of accession_numbers or tickers must be provided"
+            raise ValueError(msg)
+        new_doc_type = self._validate_and_convert(doc_type)[0]
+        key = "ticker" if accession_numbers is None else "accessionNo"
+        inputs = list(accession_numbers if tickers is None else tickers)
+        batch = _MetadataBatch(new_doc_type, key, inputs, [None] * len(inputs), {})
+        for i, raw in enumerate(inputs):
+            try:
+                value = _normalize_ticker(raw) if key == "ticker" else _extract_accession_number(raw)
+            except ValueError as e:
+                batch.results[i] = MetadataResult(raw, None, e)
+                continue
+            metadata = self._get_memoized_metadata(new_doc_type, key, value)
+            if metadata is None:
+                metadata = self._get_cached_metadata(new_doc_type, key, value)
+            if metadata is not None:
+                batch.results[i] = MetadataResult(raw, metadata, None)
+            else:
+                batch.missing.setdefault(value, []).append(i)
+        return batch
+
+    def _metadata_batch_queries(self, batch: _MetadataBatch) -> list[tuple[list[str], str]]:
+        chunk_size = TICKERS_PER_QUERY if batch.key == "ticker" else MAX_QUERY_PAGE_SIZE
+        values = list(batch.missing)
+        chunks = [values[i:i + chunk_size] for i in range(0, len(values), chunk_size)]
+        return [
+            (
+                chunk,
+                f'{batch.key}:({" OR ".join(json.dumps(v) for v in chunk)})'
+                f' AND formType:"{batch.doc_type.value}"',
             )
-        if accession_number:
-            accession_number = _extract_accession_number(accession_number)
-            metadata = self._call_latest_report_metadata_api(
-                new_doc_type,
-                key="accessionNo",
-                value=accession_number,
+            for chunk in chunks
+        ]
+
+    def _resolve_metadata_batch(
+        self,
+        batch: _MetadataBatch,
+        values: list[str],
+        filings: list[dict] | Exception,
+    ) -> None:
+        """Stores the filings returned for one chunk of `values`."""
+        if isinstance(filings, Exception):
+            for value in values:
+                self._set_metadata_batch_result(batch, value, error=filings)
+            return
+        for filing in filings:
+            value = str(filing.get(batch.key, ""))
+            value = _normalize_ticker(value) if batch.key == "ticker" else value
+            # Filings are sorted newest first, so the first match wins.
+            if value in values and value in batch.missing:
+                self._memoize_metadata(batch.doc_type, batch.key, value, filing)
+                self._set_cached_metadata(batch.doc_type, batch.key, value, filing)
+                self._set_metadata_batch_result(batch, value, metadata=filing)
+
+    def _set_metadata_batch_result(
+        self,
+        batch: _MetadataBatch,
+        value: str,
+        *,
+        metadata: dict | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        for i in batch.missing.pop(value, []):
+            batch.results[i] = MetadataResult(batch.inputs[i], metadata and dict(metadata), error)
+
+    def _finish_metadata_batch(self, batch: _MetadataBatch) -> list[MetadataResult]:
+        for value in list(batch.missing):
+            msg = f'no {batch.doc_type.value} found for {batch.key}="{value}"'
+            self._set_metadata_batch_result(batch, value, error=SecapioRequestError(msg))
+        return batch.results
+
+    def _split_present_sections(
+        self,
+        requests: list[ReportRequest],
+    ) -> tuple[list[Iterable[SectionType | str] | None], dict[int, str]]:
+        """
+        The sections of every request, and the URLs of the 8-Ks asking for
+        their "present" sections by position; those still need a metadata
+        lookup. Other forms asking for "present" sections get all of them.
+        """
+        sections = []
+        lookups = {}
+        for i, request in enumerate(requests):
+            if not is_present_sections(request.sections):
+                sections.append(request.sections)
+                continue
+            sections.append(None)
+            if self._validate_and_convert(request.doc_type)[0] == DocumentType.FORM_8K:
+                lookups[i] = request.url
+        return sections, lookups
+
+    def _sections_from_metadata(self, metadata: dict | None) -> list[SectionType] | None:
+        # Without an item list there is nothing to prune, so every section
+        # is fetched.
+        items = metadata and metadata.get("items")
+        return sections_from_items(items) if items else None
+
+    def _get_cached_section(self, url: str, section: SectionType) -> str | None:
+        if self._cache is None:
+            return None
+        value = self._cache.get(make_cache_key("extractor", url, section.value, "html"))
+        return None if value is None else value.decode()
+
+    def _set_cached_section(self, url: str, section: SectionType, html: str) -> None:
+        if self._cache is not None:
+            self._cache.set(make_cache_key("extractor", url, section.value, "html"), html.encode())
+
+    def _get_cached_metadata(self, doc_type: DocumentType, key: str, value: str) -> dict | None:
+        # Only accession number lookups are immutable; "latest filing for a
+        # ticker" changes whenever the company files again.
+        if self._cache is None or key != "accessionNo":
+            return None
+        cached = self._cache.get(make_cache_key("query", doc_type.value, key, value))
+        return None if cached is None else json.loads(cached)
+
+    def _set_cached_metadata(self, doc_type: DocumentType, key: str, value: str, metadata: dict) -> None:
+        if self._cache is not None and key == "accessionNo":
+            self._cache.set(
+                make_cache_key("query", doc_type.value, key, value),
+                json.dumps(metadata).encode(),
             )
+
+    def _throttle(self) -> None:
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+
+    async def _athrottle(self) -> None:
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire_async()
+
+    def _send_instrumented(
+        self,
+        send_request: Callable[[dict | None], httpx.Response],
+        endpoint: str,
+        url: str | None = None,
+        section: SectionType | None = None,
+    ) -> httpx.Response:
+        if not self._instrumentation.enabled:
+            return send_request(None)
+        recorder = RequestRecorder(self._instrumentation, self._in_flight, endpoint, url, section)
+        try:
+            response = send_request(recorder.extensions)
+        except BaseException as e:
+            recorder.finish(error=e)
+            raise
+        recorder.finish(response)
+        return response
+
+    async def _asend_instrumented(
+        self,
+        send_request: Callable[[dict | None], Awaitable[httpx.Response]],
+        endpoint: str,
+        url: str | None = None,
+        section: SectionType | None = None,
+    ) -> httpx.Response:
+        if not self._instrumentation.enabled:
+            return await send_request(None)
+        recorder = RequestRecorder(self._instrumentation, self._in_flight, endpoint, url, section)
+        try:
+            response = await send_request(recorder.async_extensions)
+        except BaseException as e:
+            recorder.finish(error=e)
+            raise
+        recorder.finish(response)
+        return response
+
+    def _auto_concurrency_limiter(self) -> AdaptiveConcurrencyLimiter:
+        with self._concurrency_limiter_lock:
+            if self._concurrency_limiter is None:
+                self._concurrency_limiter = AdaptiveConcurrencyLimiter()
+            return self._concurrency_limiter
+
+    def _send_limited(
+        self,
+        send_request: Callable[[dict | None], httpx.Response],
+        endpoint: str,
+        url: str | None = None,
+        section: SectionType | None = None,
+    ) -> httpx.Response:
+        # The rate limit token is taken last, right before the request goes
+        # out, so requests queued for a slot do not bank tokens and burst.
+        limiter = self._concurrency_limiter
+        if limiter is None:
+            self._throttle()
+            return self._send_instrumented(send_request, endpoint, url, section)
+        limiter.acquire()
+        try:
+            self._throttle()
+        except BaseException:
+            limiter.release()
+            raise
+        started = time.perf_counter()
+        try:
+            response = self._send_instrumented(send_request, endpoint, url, section)
+        except BaseException as e:
+            self._release_concurrency(limiter, started, e)
+            raise
+        self._release_concurrency(limiter, started, response)
+        return response
+
+    async def _asend_limited(
+        self,
+        send_request: Callable[[dict | None], Awaitable[httpx.Response]],
+        endpoint: str,
+        url: str | None = None,
+        section: SectionType | None = None,
+    ) -> httpx.Response:
+        limiter = self._concurrency_limiter
+        if limiter is None:
+            await self._athrottle()
+            return await self._asend_instrumented(send_request, endpoint, url, section)
+        await limiter.acquire_async()
+        try:
+            await self._athrottle()
+        except BaseException:
+            limiter.release()
+            raise
+        started = time.perf_counter()
+        try:
+            response = await self._asend_instrumented(send_request, endpoint, url, section)
+        except BaseException as e:
+            self._release_concurrency(limiter, started, e)
+            raise
+        self._release_concurrency(limiter, started, response)
+        return response
+
+    def _send_keyed(
+        self,
+        send_request: Callable[[str, dict | None], httpx.Response],
+        endpoint: str,
+        url: str | None = None,
+        section: SectionType | None = None,
+    ) -> httpx.Response:
+        # A key rejected with 403/429 is ejected from the pool and the
+        # request goes straight to the next key, without waiting for a retry.
+        pool = self._api_key_pool
+        for attempt in range(len(pool)):
+            api_key = pool.acquire()
+            try:
+                response = self._send_limited(
+                    lambda extensions, api_key=api_key: send_request(api_key, extensions),
+                    endpoint,
+                    url,
+                    section,
+                )
+            except BaseException:
+                pool.release(api_key)
+                raise
+            ejected = pool.release(api_key, response.status_code)
+            if not ejected or attempt == len(pool) - 1 or not pool.available:
+                return response
+            response.close()
+        raise AssertionError  # pragma: no cover
+
+    async def _asend_keyed(
+        self,
+        send_request: Callable[[str, dict | None], Awaitable[httpx.Response]],
+        endpoint: str,
+        url: str | None = None,
+        section: SectionType | None = None,
+    ) -> httpx.Response:
+        pool = self._api_key_pool
+        for attempt in range(len(pool)):
+            api_key = await pool.acquire_async()
+            try:
+                response = await self._asend_limited(
+                    lambda extensions, api_key=api_key: send_request(api_key, extensions),
+                    endpoint,
+                    url,
+                    section,
+                )
+            except BaseException:
+                pool.release(api_key)
+                raise
+            ejected = pool.release(api_key, response.status_code)
+            if not ejected or attempt == len(pool) - 1 or not pool.available:
+                return response
+            await response.aclose()
+        raise AssertionError  # pragma: no cover
+
+    def _release_concurrency(
+        self,
+        limiter: AdaptiveConcurrencyLimiter,
+        started: float,
+        outcome: httpx.Response | BaseException,
+    ) -> None:
+        latency_s = time.perf_counter() - started
+        if isinstance(outcome, httpx.Response):
+            overloaded = outcome.status_code == 429 or outcome.status_code >= 500
+        elif isinstance(outcome, httpx.TransportError):
+            overloaded = True
+        else:
+            # Cancellations and local errors say nothing about the server.
+            latency_s, overloaded = None, False
+        limit = limiter.limit
+        limiter.release(latency_s, overloaded=overloaded)
+        if limiter.limit != limit:
+            self._instrumentation.concurrency_limit_changed(limiter.limit)
+
+    def _deduplicated(self, key: tuple, fn: Callable[[], object]) -> object:
+        if self._single_flight is None:
+            return fn()
+        return self._single_flight.call(key, fn)
+
+    async def _adeduplicated(self, key: tuple, fn: Callable[[], Awaitable[object]]) -> object:
+        if self._single_flight is None:
+            return await fn()
+        return await self._single_flight.call_async(key, fn)
+
+    def _retry_hook(
+        self,
+        endpoint: str,
+        url: str | None = None,
+        section: SectionType | None = None,
+    ) -> Callable[[int, float, BaseException], None] | None:
+        if not self._instrumentation.enabled:
+            return None
+
+        def on_retry(attempt: int, delay_s: float, error: BaseException) -> None:
+            self._instrumentation.retry_scheduled(
+                RetryEvent(endpoint, url, section, attempt, delay_s, error),
+            )
+
+        return on_retry
+
+    def _record_section(
+        self,
+        url: str,
+        section: SectionType,
+        started: float,
+        *,
+        html: str | None = None,
+        size: int | None = None,
+        cache_hit: bool = False,
+        error: BaseException | None = None,
+    ) -> None:
+        if not self._instrumentation.enabled:
+            return
+        elapsed_s = time.perf_counter() - started
+        if size is None and html is not None:
+            size = len(html.encode())
+        self._instrumentation.section_finished(
+            SectionEvent(url, section, time.time() - elapsed_s, elapsed_s, size, cache_hit, error),
+        )
+
+    def _record_filing(
+        self,
+        url: str,
+        doc_type: DocumentType,
+        started: float,
+        *,
+        sections: int,
+        html: str | None = None,
+        size: int | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        if not self._instrumentation.enabled:
+            return
+        elapsed_s = time.perf_counter() - started
+        if size is None and html is not None:
+            size = len(html.encode())
+        self._instrumentation.filing_finished(
+            FilingEvent(url, doc_type, time.time() - elapsed_s, elapsed_s, size, sections, error),
+        )
+
+    def _extractor_params(self, url: str, section: SectionType, api_key: str) -> dict:
+        return {
+            "url": url,
+            "item": section.value,
+            "type": "html",
+            "token": api_key,
+        }
+
+
+class SecapioDataRetriever(SecapioRetrieverMixin, AbstractSECDataRetriever):
+    """Retrieves data from sec-api.io API."""
+
+    def __init__(
+        self: SecapioDataRetriever,
+        api_key: str | Iterable[str] | ApiKeyPool | None = None,
+        *,
+        timeout_s: int | None = None,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry_s: float = 30.0,
+        http2: bool | None = None,
+        client: httpx.Client | None = None,
+        cache: ResponseCache | None = None,
+        metadata_cache_size: int = 1024,
+        latest_metadata_ttl_s: float = 60.0,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        processing_poll_interval_s: float = DEFAULT_PROCESSING_POLL_INTERVAL_S,
+        processing_max_wait_s: float = DEFAULT_PROCESSING_MAX_WAIT_S,
+        instrumentation: Instrumentation | None = None,
+        single_flight: bool = True,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+    ) -> None:
+        """
+        All API calls share one pooled keep-alive `httpx.Client`. `http2=None`
+        enables HTTP/2 when the optional `h2` package is installed. A
+        caller-provided `client` is used as is and not closed by `close()`.
+        Extractor responses and accession number lookups are served from
+        `cache` when one is given. Metadata lookups are also kept in memory:
+        accession numbers indefinitely and latest-by-ticker lookups for
+        `latest_metadata_ttl_s`; `metadata_cache_size=0` disables this.
+        Every HTTP request, including retries, first takes a token from
+        `rate_limiter`, which may be shared with other retrievers. Failed
+        requests are retried according to `retry_policy`. Sections the
+        extractor reports as still "processing" are polled every
+        `processing_poll_interval_s` for up to `processing_max_wait_s`.
+        Timings, sizes, retries and cache hits of every request, section and
+        filing are reported to `instrumentation`, which does nothing by default.
+        With `single_flight`, concurrent identical extractor and query API
+        requests share one HTTP call and its result or exception.
+        `workers="auto"` sizes section downloads with `concurrency_limiter`,
+        created on first use if not given, which then bounds every request
+        made by this retriever and adapts to the API's latency and errors.
+        Several keys, given as a list, an `ApiKeyPool` or the
+        `SECAPIO_API_KEYS` environment variable (when `SECAPIO_API_KEY` is
+        not set), share the load; see `ApiKeyPool`.
+        """
+        self._configure(
+            api_key,
+            timeout_s=timeout_s,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry_s=keepalive_expiry_s,
+            http2=http2,
+            cache=cache,
+            metadata_cache_size=metadata_cache_size,
+            latest_metadata_ttl_s=latest_metadata_ttl_s,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            processing_poll_interval_s=processing_poll_interval_s,
+            processing_max_wait_s=processing_max_wait_s,
+            instrumentation=instrumentation,
+            single_flight=single_flight,
+            concurrency_limiter=concurrency_limiter,
+        )
+        self._owns_client = client is None
+        self._client = client or httpx.Client(
+            http2=self._http2,
+            limits=self._pool_limits,
+            timeout=self._timeout_s,
+        )
+
+    @property
+    def client(self: SecapioDataRetriever) -> httpx.Client:
+        return self._client
+
+    def close(self: SecapioDataRetriever) -> None:
+        if self._owns_client:
+            self._client.close()
+        if self._cache is not None:
+            self._cache.close()
+
+    def __enter__(self: SecapioDataRetriever) -> SecapioDataRetriever:
+        return self
+
+    def __exit__(
+        self: SecapioDataRetriever,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def retrieve_report_metadata(
+        self: SecapioDataRetriever,
+        doc_type: DocumentType | str,
+        *,
+        accession_number: str | None = None,
+        latest_from_ticker: str | None = None,
+    ) -> dict:
+        new_doc_type, key, value = self._prepare_metadata_lookup(
+            doc_type,
+            accession_number,
+            latest_from_ticker,
+        )
+        metadata = self._get_memoized_metadata(new_doc_type, key, value)
+        if metadata is not None:
+            return metadata
+        metadata = self._call_latest_report_metadata_api(
+            new_doc_type,
+            key=key,
+            value=value,
+        )
         if not metadata:
             msg = "metadata is None"
             raise RuntimeError(msg)
+        self._memoize_metadata(new_doc_type, key, value, metadata)
         return metadata
 
+    def get_report_html(
+        self: SecapioDataRetriever,
+        doc_type: DocumentType | str,
+        url: str,
+        *,
+        sections: Iterable[SectionType | str] | str | None = None,
+        use_multithreading: bool = False,
+        workers: int | str = 1,
+    ) -> str:
+        """
+        With `sections="present"`, only the items an 8-K reports according to
+        its query API metadata are fetched, plus the signature.
+        """
+        return super().get_report_html(
+            doc_type,
+            url,
+            sections=self._resolve_sections(doc_type, url, sections),
+            use_multithreading=use_multithreading,
+            workers=workers,
+        )
+
+    def retrieve_reports_metadata(
+        self: SecapioDataRetriever,
+        doc_type: DocumentType | str,
+        *,
+        accession_numbers: Iterable[str] | None = None,
+        tickers: Iterable[str] | None = None,
+        workers: int = 4,
+    ) -> list[MetadataResult]:
+        """
+        Resolves many accession numbers, or the latest filing of many
+        tickers, with a few OR'ed query API requests run on `workers` threads.
+
+        Returns one `MetadataResult` per input key in input order; keys that
+        are invalid or match no filing carry an error instead of metadata.
+        """
+        assert workers>=1, "workers cannot be less than 1."
+        batch = self._start_metadata_batch(doc_type, accession_numbers, tickers)
+        queries = self._metadata_batch_queries(batch)
+
+        def fetch(query_string: str) -> list[dict] | Exception:
+            try:
+                return self._call_filings_query_api(query_string, 0, MAX_QUERY_PAGE_SIZE)["filings"]
+            except (SecapioRequestError, SecapioApiKeyInvalidError) as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            responses = executor.map(fetch, [query_string for _, query_string in queries])
+            for (values, _), filings in zip(queries, responses):
+                self._resolve_metadata_batch(batch, values, filings)
+            if batch.key == "ticker":
+                lookups = {
+                    executor.submit(self._retrieve_metadata_result, batch.doc_type, value): value
+                    for value in batch.missing
+                }
+                for future in as_completed(lookups):
+                    metadata, error = future.result()
+                    self._set_metadata_batch_result(batch, lookups[future], metadata=metadata, error=error)
+        return self._finish_metadata_batch(batch)
+
+    def _retrieve_metadata_result(
+        self: SecapioDataRetriever,
+        doc_type: DocumentType,
+        ticker: str,
+    ) -> tuple[dict | None, Exception | None]:
+        try:
+            return self.retrieve_report_metadata(doc_type, latest_from_ticker=ticker), None
+        except (SecapioRequestError, SecapioApiKeyInvalidError) as e:
+            return None, e
+
+    def get_reports_html(
+        self: SecapioDataRetriever,
+        requests: Iterable[ReportRequest | tuple],
+        *,
+        workers: int | str = 1,
+        return_exceptions: bool = False,
+        priorities: Mapping[SectionType | str, int] | None = None,
+        deadline_s: float | None = None,
+        processing_poll_interval_s: float | None = None,
+        processing_max_wait_s: float | None = None,
+    ) -> Iterator[tuple[ReportRequest, str | BaseException]]:
+        """
+        Downloads many filings through one shared pool of `workers` threads.
+
+        Every (filing, section) pair goes into a single work queue, and each
+        filing is yielded as `(request, html)` as soon as all of its sections
+        have arrived, so filings come back in completion order. With
+        `return_exceptions=True` a failed filing is yielded with its exception
+        instead of stopping the whole batch. 8-Ks requested with
+        `sections="present"` are looked up with one batched metadata query.
+        Sections are queued by priority
+        (`DEFAULT_SECTION_PRIORITIES`, overridden by `priorities`), so
+        critical sections of every filing are fetched before the rest;
+        sections not started within `deadline_s` fail their filing.
+        """
+        started = time.perf_counter()
+        for request, doc_type, result in self._iter_reports_sections(
+            [ReportRequest(*r) for r in requests],
+            started,
+            workers=workers,
+            return_exceptions=return_exceptions,
+            priorities=priorities,
+            deadline_s=deadline_s,
+            processing_poll_interval_s=processing_poll_interval_s,
+            processing_max_wait_s=processing_max_wait_s,
+        ):
+            if isinstance(result, BaseException):
+                yield request, result
+                continue
+            html = "\n".join(_iter_report_parts(result))
+            self._record_filing(request.url, doc_type, started, sections=len(result), html=html)
+            yield request, html
+
+    def _iter_reports_sections(
+        self: SecapioDataRetriever,
+        report_requests: list[ReportRequest],
+        started: float,
+        *,
+        workers: int | str,
+        return_exceptions: bool,
+        priorities: Mapping[SectionType | str, int] | None = None,
+        deadline_s: float | None = None,
+        processing_poll_interval_s: float | None = None,
+        processing_max_wait_s: float | None = None,
+    ) -> Iterator[tuple[ReportRequest, DocumentType, list[ReportSection] | BaseException]]:
+        """
+        Yields the sections of every filing as soon as all of them arrived.
+        Failed filings are recorded here; completed ones by the caller, which
+        knows the size of what it builds from the sections.
+        """
+        request_sections, lookups = self._split_present_sections(report_requests)
+        if lookups:
+            results = self.retrieve_reports_metadata(DocumentType.FORM_8K, accession_numbers=list(lookups.values()))
+            for i, result in zip(lookups, results):
+                request_sections[i] = self._sections_from_metadata(result.metadata)
+        filings = [
+            self._validate_and_convert(r.doc_type, sections)
+            for r, sections in zip(report_requests, request_sections)
+        ]
+        filing_sections = [
+            list(sections or FORM_SECTIONS[doc_type]) for doc_type, sections in filings
+        ]
+        jobs = [
+            job
+            for i, request in enumerate(report_requests)
+            for job in self._section_jobs(i, request.url, filing_sections[i], priorities, deadline_s)
+        ]
+        section_htmls: list[list[str | None]] = [[None] * len(s) for s in filing_sections]
+        remaining = [len(s) for s in filing_sections]
+        failed: set[int] = set()
+        scheduler = self.make_section_scheduler(
+            workers,
+            processing_poll_interval_s=processing_poll_interval_s,
+            processing_max_wait_s=processing_max_wait_s,
+        )
+        for job, result in scheduler.run(jobs):
+            i = job.filing_index
+            if i in failed:
+                continue
+            if isinstance(result, BaseException):
+                self._record_filing(
+                    job.url,
+                    filings[i][0],
+                    started,
+                    sections=len(filing_sections[i]),
+                    error=result,
+                )
+                if not return_exceptions:
+                    raise result
+                failed.add(i)
+                section_htmls[i] = []
+                yield report_requests[i], filings[i][0], result
+                continue
+            section_htmls[i][job.position] = result
+            remaining[i] -= 1
+            if remaining[i] == 0:
+                report_sections = [
+                    ReportSection(section, _build_section_separator_html(section), html)
+                    for section, html in zip(filing_sections[i], section_htmls[i])
+                ]
+                section_htmls[i] = []
+                yield report_requests[i], filings[i][0], report_sections
+
+    def iter_filings(
+        self: SecapioDataRetriever,
+        query: str | None = None,
+        *,
+        ticker: str | None = None,
+        doc_type: DocumentType | str | None = None,
+        filed_from: datetime.date | str | None = None,
+        filed_to: datetime.date | str | None = None,
+        page_size: int = MAX_QUERY_PAGE_SIZE,
+    ) -> Iterator[dict]:
+        """
+        Yields the metadata of every filing matching the filters, newest
+        first. `query` is a raw query API `query_string` that is combined with
+        the other filters. Pages are requested lazily and the next page is
+        prefetched on a background thread while the current one is consumed.
+        Pass the results to `ReportRequest.from_metadata` to download them.
+        """
+        if not 1 <= page_size <= MAX_QUERY_PAGE_SIZE:
+            msg = f"page_size must be between 1 and {MAX_QUERY_PAGE_SIZE}"
+            raise ValueError(msg)
+        query_string = _build_filings_query_string(
+            query,
+            ticker=ticker,
+            doc_type=doc_type and self._validate_and_convert(doc_type, None)[0],
+            filed_from=filed_from,
+            filed_to=filed_to,
+        )
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            next_page = executor.submit(self._call_filings_query_api, query_string, 0, page_size)
+            try:
+                start = 0
+                while next_page is not None:
+                    data = next_page.result()
+                    filings = data["filings"]
+                    start += len(filings)
+                    total = data.get("total", {}).get("value", 0)
+                    next_page = None
+                    if len(filings) == page_size and start < total:
+                        next_page = executor.submit(
+                            self._call_filings_query_api,
+                            query_string,
+                            start,
+                            page_size,
+                        )
+                    yield from filings
+            finally:
+                if next_page is not None:
+                    next_page.cancel()
+
     def _get_report_html(
         self: SecapioDataRetriever,
         doc_type: DocumentType,
@@ -128,82 +1017,498 @@ class SecapioDataRetriever(AbstractSECDataRetriever):
         *,
         sections: Iterable[SectionType] | None = None,
         use_multithreading: bool = False,
-        workers: int = 1,
+        workers: int | str = 1,
     ) -> str:
-        assert workers>=1, "workers cannot be less than 1."
-        if workers>1:
+        _check_workers(workers)
+        if workers == AUTO_WORKERS:
+            assert use_multithreading, "when workers is 'auto', use_multithreading must be True."
+        elif workers>1:
             assert use_multithreading, "when workers are greater than 1, use_multithreading must be True."
-        if (not use_multithreading) or (workers==1) :
-            html_parts = []
-            sections = sections or FORM_SECTIONS[doc_type]
-            for section in sections:
-                title = SECTION_NAMES[section]
-                title = re.sub(r"[^a-zA-Z0-9' ]+", "", title)
-                separator_html = (
-                    "<top-level-section-start-marker"
-                    f' id="{section.value}"'
-                    f' title="{title}"'
-                    ' comment="This tag was added by '
-                    'sec-api-io library based on sec-api.io API"'
-                    ' style="display: none;"'
-                    "</top-level-section-start-marker>"
-                )
-                html_parts.append(separator_html)
-                section_html = self._call_sections_extractor_api(
+        sections = list(sections or FORM_SECTIONS[doc_type])
+        started = time.perf_counter()
+        try:
+            html = "\n".join(
+                _iter_report_parts(
+                    self._iter_report_sections(doc_type, url, sections=sections, workers=workers),
+                ),
+            )
+        except Exception as e:
+            self._record_filing(url, doc_type, started, sections=len(sections), error=e)
+            raise
+        self._record_filing(url, doc_type, started, sections=len(sections), html=html)
+        return html
+
+    def get_report(
+        self: SecapioDataRetriever,
+        doc_type: DocumentType | str,
+        url: str,
+        *,
+        sections: Iterable[SectionType | str] | str | None = None,
+        workers: int | str = 1,
+        priorities: Mapping[SectionType | str, int] | None = None,
+        deadline_s: float | None = None,
+    ) -> Report:
+        """
+        Retrieves the same document as `get_report_html`, returned as a
+        `Report` that indexes the byte range of every section.
+        """
+        _check_workers(workers)
+        sections = self._resolve_sections(doc_type, url, sections)
+        doc_type, sections = self._validate_and_convert(doc_type, sections)
+        sections = list(sections or FORM_SECTIONS[doc_type])
+        started = time.perf_counter()
+        try:
+            report = Report.from_sections(
+                self._iter_report_sections(
+                    doc_type,
                     url,
-                    section,
+                    sections=sections,
+                    workers=workers,
+                    priorities=priorities,
+                    deadline_s=deadline_s,
+                ),
+                doc_type=doc_type,
+            )
+        except Exception as e:
+            self._record_filing(url, doc_type, started, sections=len(sections), error=e)
+            raise
+        self._record_filing(url, doc_type, started, sections=len(sections), size=report.size)
+        return report
+
+    def iter_report_sections(
+        self: SecapioDataRetriever,
+        doc_type: DocumentType | str,
+        url: str,
+        *,
+        sections: Iterable[SectionType | str] | str | None = None,
+        workers: int | str = 1,
+        ordered: bool = True,
+        priorities: Mapping[SectionType | str, int] | None = None,
+        deadline_s: float | None = None,
+        processing_poll_interval_s: float | None = None,
+        processing_max_wait_s: float | None = None,
+    ) -> Iterator[ReportSection]:
+        """
+        Yields the report one `ReportSection` at a time instead of building
+        the whole document. With `ordered=False` and `workers>1`, sections are
+        yielded as soon as they arrive rather than in document order, and
+        higher-priority sections (see `get_reports_html`) arrive first.
+        """
+        _check_workers(workers)
+        sections = self._resolve_sections(doc_type, url, sections)
+        doc_type, sections = self._validate_and_convert(doc_type, sections)
+        return self._iter_report_sections(
+            doc_type,
+            url,
+            sections=sections,
+            workers=workers,
+            ordered=ordered,
+            priorities=priorities,
+            deadline_s=deadline_s,
+            processing_poll_interval_s=processing_poll_interval_s,
+            processing_max_wait_s=processing_max_wait_s,
+        )
+
+    def stream_report_html(
+        self: SecapioDataRetriever,
+        doc_type: DocumentType | str,
+        url: str,
+        *,
+        sections: Iterable[SectionType | str] | str | None = None,
+        workers: int | str = 1,
+        priorities: Mapping[SectionType | str, int] | None = None,
+        deadline_s: float | None = None,
+        processing_poll_interval_s: float | None = None,
+        processing_max_wait_s: float | None = None,
+    ) -> Iterator[str]:
+        """
+        Yields text chunks that concatenate to exactly what `get_report_html`
+        returns, so the report can be written out while it is downloaded.
+        """
+        report_sections = self.iter_report_sections(
+            doc_type,
+            url,
+            sections=sections,
+            workers=workers,
+            priorities=priorities,
+            deadline_s=deadline_s,
+            processing_poll_interval_s=processing_poll_interval_s,
+            processing_max_wait_s=processing_max_wait_s,
+        )
+        return _iter_report_chunks(report_sections)
+
+    def download_report_to(
+        self: SecapioDataRetriever,
+        target: ReportTarget,
+        doc_type: DocumentType | str,
+        url: str,
+        *,
+        sections: Iterable[SectionType | str] | str | None = None,
+        compression: str | None = None,
+    ) -> int:
+        """
+        Writes the report to a path or binary file object while it is being
+        downloaded and returns the number of uncompressed bytes written.
+
+        Section bodies are copied from the HTTP response in chunks, so memory
+        use is bounded by the chunk size rather than the report size. With a
+        response cache, a section is also buffered to be cached, unless it
+        grows past `MAX_STREAMED_CACHE_ENTRY_BYTES`; larger sections are
+        not cached. The written bytes are the UTF-8 encoding of `get_report_html`'s result.
+        `compression` may be `"gzip"` or `"zstd"`.
+        """
+        sections = self._resolve_sections(doc_type, url, sections)
+        doc_type, sections = self._validate_and_convert(doc_type, sections)
+        sections = list(sections or FORM_SECTIONS[doc_type])
+        started = time.perf_counter()
+        written = 0
+        try:
+            with open_report_sink(target, compression=compression) as sink:
+                for position, section in enumerate(sections):
+                    prefix = "\n" if position else ""
+                    marker = f"{prefix}{_build_section_separator_html(section)}\n".encode()
+                    sink.write(marker)
+                    written += len(marker)
+                    written += self._write_section(sink, url, section)
+        except Exception as e:
+            self._record_filing(url, doc_type, started, sections=len(sections), error=e)
+            raise
+        self._record_filing(url, doc_type, started, sections=len(sections), size=written)
+        return written
+
+    def download_reports_to(
+        self: SecapioDataRetriever,
+        downloads: Iterable[tuple[ReportTarget, ReportRequest | tuple]],
+        *,
+        workers: int | str = 1,
+        compression: str | None = None,
+        return_exceptions: bool = False,
+    ) -> Iterator[tuple[ReportTarget, ReportRequest, int | BaseException]]:
+        """
+        Runs `download_report_to` for many `(target, request)` pairs on a
+        pool of `workers` threads, yielding `(target, request, bytes_written)`
+        as each report is completed. With `workers="auto"` the threads'
+        requests are bounded by the retriever's `concurrency_limiter`.
+        """
+        _check_workers(workers)
+        if workers == AUTO_WORKERS:
+            workers = self._auto_concurrency_limiter().max_limit
+        downloads = [(target, ReportRequest(*request)) for target, request in downloads]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    self.download_report_to,
+                    target,
+                    request.doc_type,
+                    request.url,
+                    sections=request.sections,
+                    compression=compression,
+                ): (target, request)
+                for target, request in downloads
+            }
+            try:
+                for future in as_completed(futures):
+                    target, request = futures[future]
+                    error = future.exception()
+                    if error is not None and not return_exceptions:
+                        raise error
+                    yield target, request, future.result() if error is None else error
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def archive_reports(
+        self: SecapioDataRetriever,
+        archive: ReportArchive,
+        requests: Iterable[ReportRequest | tuple],
+        *,
+        workers: int | str = 1,
+        return_exceptions: bool = False,
+        skip_archived: bool = True,
+    ) -> Iterator[tuple[ReportRequest, int | BaseException]]:
+        """
+        Downloads filings like `get_reports_html` and stores each one in
+        `archive` under the accession number in its URL, yielding
+        `(request, bytes_stored)` as filings complete. Filings already in the
+        archive are skipped unless `skip_archived=False`, and a filing
+        requested more than once is only downloaded for its first request.
+        """
+        # Imported here because the archive module builds on this one.
+        from sec_api_io.archive import ReportAlreadyArchivedError
+
+        report_requests = []
+        seen = set()
+        for request in (ReportRequest(*r) for r in requests):
+            # The archive keys filings by accession number, so URLs without
+            # one fail before anything is downloaded for them.
+            try:
+                accession_number = _extract_accession_number(request.url)
+            except ValueError as e:
+                if not return_exceptions:
+                    raise
+                yield request, e
+                continue
+            if accession_number in seen or (skip_archived and accession_number in archive):
+                continue
+            seen.add(accession_number)
+            report_requests.append(request)
+        started = time.perf_counter()
+        for request, doc_type, result in self._iter_reports_sections(
+            report_requests,
+            started,
+            workers=workers,
+            return_exceptions=return_exceptions,
+        ):
+            if isinstance(result, BaseException):
+                yield request, result
+                continue
+            report = Report.from_sections(result, doc_type=doc_type)
+            self._record_filing(request.url, doc_type, started, sections=len(result), size=report.size)
+            try:
+                stored = archive.add_report(
+                    report,
+                    accession_number=request.url,
+                    url=request.url,
+                    replace=not skip_archived,
                 )
-                html_parts.append(section_html)
-            return "\n".join(html_parts)
-        else:
-            return self._get_report_html_with_multithreading(doc_type, url, sections=sections, num_workers=workers)
+            except ReportAlreadyArchivedError as e:
+                # Another writer archived the filing while it was downloading.
+                if not return_exceptions:
+                    raise
+                stored = e
+            yield request, stored
 
-    def _get_report_html_with_multithreading(
+    def _write_section(
+        self: SecapioDataRetriever,
+        sink: IO[bytes],
+        url: str,
+        section: SectionType,
+    ) -> int:
+        started = time.perf_counter()
+        section_html = self._get_cached_section(url, section)
+        if section_html is not None:
+            written = sink.write(section_html.encode())
+            self._record_section(url, section, started, size=written, cache_hit=True)
+            return written
+        started_at = time.monotonic()
+        while True:
+            response = self._open_sections_extractor_stream(url, section)
+            body = response.iter_bytes()
+            # Look at the start of the body before writing anything, so a
+            # "processing" placeholder never reaches the sink.
+            head = b""
+            for chunk in body:
+                head += chunk
+                if len(head) > len(PROCESSING_RESPONSE) + 2:
+                    break
+            else:
+                response.close()
+                if _is_processing_response(head.decode(errors="replace")):
+                    waited_s = time.monotonic() - started_at
+                    if waited_s + self._processing_poll_interval_s > self._processing_max_wait_s:
+                        raise processing_timeout_error(url, section, waited_s)
+                    time.sleep(self._processing_poll_interval_s)
+                    continue
+            break
+        written = 0
+        chunks = [] if self._cache is not None else None
+        try:
+            for chunk in itertools.chain((head,), body):
+                written += sink.write(chunk)
+                if chunks is not None:
+                    chunks.append(chunk)
+                    if written > MAX_STREAMED_CACHE_ENTRY_BYTES:
+                        chunks = None
+        finally:
+            response.close()
+        if chunks is not None:
+            self._set_cached_section(url, section, b"".join(chunks).decode())
+        self._record_section(url, section, started, size=written)
+        return written
+
+    def _iter_report_sections(
         self: SecapioDataRetriever,
         doc_type: DocumentType,
         url: str,
         *,
         sections: Iterable[SectionType] | None = None,
-        num_workers: int = 6
-    ):
-        html_parts = []
-        sections = sections or FORM_SECTIONS[doc_type]
-        with ThreadPoolExecutor(max_workers=num_workers) as executor:
-            section_htmls = list(executor.map(lambda section: self._call_sections_extractor_api(url, section), sections))
-        for section, section_html in zip(sections, section_htmls):
-            title = re.sub(r"[^a-zA-Z0-9' ]+", "", SECTION_NAMES[section])
-            separator_html = (
-                "<top-level-section-start-marker"
-                f' id="{section.value}"'
-                f' title="{title}"'
-                ' comment="This tag was added by '
-                'sec-api-io library based on sec-api.io API"'
-                ' style="display: none;"'
-                "</top-level-section-start-marker>"
+        workers: int | str = 1,
+        ordered: bool = True,
+        priorities: Mapping[SectionType | str, int] | None = None,
+        deadline_s: float | None = None,
+        processing_poll_interval_s: float | None = None,
+        processing_max_wait_s: float | None = None,
+    ) -> Iterator[ReportSection]:
+        sections = list(sections or FORM_SECTIONS[doc_type])
+        # Even a single worker goes through the scheduler, so that a section
+        # still being processed does not hold up the ones after it.
+        scheduler = self.make_section_scheduler(
+            workers,
+            processing_poll_interval_s=processing_poll_interval_s,
+            processing_max_wait_s=processing_max_wait_s,
+        )
+        jobs = self._section_jobs(0, url, sections, priorities, deadline_s)
+        buffered: dict[int, ReportSection] = {}
+        next_position = 0
+        for job, result in scheduler.run(jobs):
+            if isinstance(result, BaseException):
+                raise result
+            report_section = ReportSection(
+                job.section,
+                _build_section_separator_html(job.section),
+                result,
             )
-            html_parts.append(separator_html)
-            html_parts.append(section_html)
-        return "\n".join(html_parts)
+            if not ordered:
+                yield report_section
+                continue
+            # Hold back sections that arrive early until every section
+            # before them has been yielded.
+            buffered[job.position] = report_section
+            while next_position in buffered:
+                yield buffered.pop(next_position)
+                next_position += 1
+
+    def _resolve_sections(
+        self: SecapioDataRetriever,
+        doc_type: DocumentType | str,
+        url: str,
+        sections: Iterable[SectionType | str] | str | None,
+    ) -> Iterable[SectionType | str] | None:
+        request_sections, lookups = self._split_present_sections([ReportRequest(doc_type, url, sections)])
+        if not lookups:
+            return request_sections[0]
+        try:
+            metadata = self.retrieve_report_metadata(DocumentType.FORM_8K, accession_number=url)
+        except SecapioRequestError:
+            return None
+        return self._sections_from_metadata(metadata)
+
+    def _section_jobs(
+        self: SecapioDataRetriever,
+        filing_index: int,
+        url: str,
+        sections: list[SectionType],
+        priorities: Mapping[SectionType | str, int] | None,
+        deadline_s: float | None,
+    ) -> list[SectionJob]:
+        if priorities:
+            priorities = {
+                SectionType.from_str(s) if isinstance(s, str) else s: priority
+                for s, priority in priorities.items()
+            }
+        deadline = None if deadline_s is None else time.monotonic() + deadline_s
+        return [
+            SectionJob(filing_index, position, url, section, section_priority(section, priorities), deadline)
+            for position, section in enumerate(sections)
+        ]
+
+    def make_section_scheduler(
+        self: SecapioDataRetriever,
+        workers: int | str,
+        *,
+        processing_poll_interval_s: float | None = None,
+        processing_max_wait_s: float | None = None,
+    ) -> SectionFetchScheduler:
+        """
+        A scheduler fetching sections through this retriever, with its cache,
+        retries and processing polls, on `workers` threads or `"auto"`.
+        """
+        auto = workers == AUTO_WORKERS
+        return SectionFetchScheduler(
+            self._call_sections_extractor_api,
+            workers=None if auto else workers,
+            limiter=self._auto_concurrency_limiter() if auto else None,
+            processing_poll_interval_s=(
+                self._processing_poll_interval_s
+                if processing_poll_interval_s is None
+                else processing_poll_interval_s
+            ),
+            processing_max_wait_s=(
+                self._processing_max_wait_s
+                if processing_max_wait_s is None
+                else processing_max_wait_s
+            ),
+        )
 
-    @retry_with_exponential_backoff
     def _call_sections_extractor_api(
         self: SecapioDataRetriever,
         url: str,
         section: SectionType,
     ) -> str:
-        params = {
-            "url": url,
-            "item": section.value,
-            "type": "html",
-            "token": self._api_key,
-        }
-        response = httpx.get(
-            "https://api.sec-api.io/extractor",
-            timeout=self._timeout_s,
-            params=params,
-        )
-        response.raise_for_status()
-        return response.text
+        started = time.perf_counter()
+        section_html = self._get_cached_section(url, section)
+        if section_html is not None:
+            self._record_section(url, section, started, html=section_html, cache_hit=True)
+            return section_html
+        try:
+            section_html = self._deduplicated(
+                ("extractor", url, section),
+                lambda: self._request_sections_extractor_api(url, section),
+            )
+        except Exception as e:
+            self._record_section(url, section, started, error=e)
+            raise
+        if _is_processing_response(section_html):
+            msg = f"Section {section.value} of {url} is still being processed."
+            raise SectionPendingError(msg)
+        self._set_cached_section(url, section, section_html)
+        self._record_section(url, section, started, html=section_html)
+        return section_html
+
+    def _request_sections_extractor_api(
+        self: SecapioDataRetriever,
+        url: str,
+        section: SectionType,
+    ) -> str:
+        def send() -> str:
+            response = self._send_keyed(
+                lambda api_key, extensions: self._client.get(
+                    EXTRACTOR_API_URL,
+                    params=self._extractor_params(url, section, api_key),
+                    extensions=extensions,
+                ),
+                "extractor",
+                url,
+                section,
+            )
+            response.raise_for_status()
+            return response.text
+
+        try:
+            return self._retry_policy.run(send, on_retry=self._retry_hook("extractor", url, section))
+        except httpx.HTTPStatusError as e:
+            _raise_if_not_found(e)
+            raise
+
+    def _open_sections_extractor_stream(
+        self: SecapioDataRetriever,
+        url: str,
+        section: SectionType,
+    ) -> httpx.Response:
+        # Only the status line and headers are awaited here, so a retry never
+        # happens after part of the body was already written to a sink.
+        def send_request(api_key: str, extensions: dict | None) -> httpx.Response:
+            request = self._client.build_request(
+                "GET",
+                EXTRACTOR_API_URL,
+                params=self._extractor_params(url, section, api_key),
+                extensions=extensions,
+            )
+            return self._client.send(request, stream=True)
+
+        def send() -> httpx.Response:
+            response = self._send_keyed(send_request, "extractor", url, section)
+            if response.is_error:
+                response.read()
+                response.close()
+            response.raise_for_status()
+            return response
+
+        try:
+            return self._retry_policy.run(send, on_retry=self._retry_hook("extractor", url, section))
+        except httpx.HTTPStatusError as e:
+            _raise_if_not_found(e)
+            raise
 
     def _call_latest_report_metadata_api(
         self: SecapioDataRetriever,
@@ -212,47 +1517,218 @@ class SecapioDataRetriever(AbstractSECDataRetriever):
         key: str,
         value: str,
     ) -> dict:
-        key = key.strip()
-        value = value.strip()
-        query = {
-            "query": {
-                "query_string": {
-                    "query": f'{key}:"{value}" AND formType:"{doc_type.value}"',
-                },
-            },
-            "from": "0",
-            "size": "1",
-            "sort": [{"filedAt": {"order": "desc"}}],
-        }
+        key, value, query = _build_metadata_query(doc_type, key, value)
+        metadata = self._get_cached_metadata(doc_type, key, value)
+        if metadata is not None:
+            return metadata
+
+        def send() -> httpx.Response:
+            res = self._send_keyed(
+                lambda api_key, extensions: self._client.post(
+                    QUERY_API_URL,
+                    params={"token": api_key},
+                    json=query,
+                    extensions=extensions,
+                ),
+                "query",
+            )
+            res.raise_for_status()
+            return res
 
-        client = httpx.Client()
         try:
-            res = client.post(
-                f"https://api.sec-api.io?token={self._api_key}",
-                json=query,
+            res = self._deduplicated(
+                ("query", _query_key(query)),
+                lambda: self._retry_policy.run(send, on_retry=self._retry_hook("query")),
+            )
+        except (httpx.HTTPError, RetriesExhaustedError) as e:
+            _raise_metadata_request_error(e)
+        metadata = _parse_metadata_response(res.json(), doc_type, key, value)
+        self._set_cached_metadata(doc_type, key, value, metadata)
+        return metadata
+
+    def _call_filings_query_api(
+        self: SecapioDataRetriever,
+        query_string: str,
+        start: int,
+        size: int,
+    ) -> dict:
+        query = _build_filings_query(query_string, start, size)
+
+        def send() -> httpx.Response:
+            res = self._send_keyed(
+                lambda api_key, extensions: self._client.post(
+                    QUERY_API_URL,
+                    params={"token": api_key},
+                    json=query,
+                    extensions=extensions,
+                ),
+                "query",
             )
             res.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == httpx.codes.FORBIDDEN:
-                msg = "Invalid API key."
-                raise SecapioApiKeyInvalidError(msg) from e
-            msg = f"HTTP Status Error occurred while making the request: {e!s}"
-            raise SecapioRequestError(msg) from e
-        except httpx.RequestError as e:
-            msg = f"An unexpected error occurred while making the request: {e!s}"
-            raise SecapioRequestError(msg) from e
-
-        filings = res.json()["filings"]
-        if len(filings) == 0:
-            msg = f'no {doc_type.value} found for {key}="{value}"'
-            raise SecapioRequestError(msg)
-        if not isinstance(filings[0], dict):
-            msg = f"expected a dict, got {type(filings[0])}"
-            raise SecapioRequestError(msg)
-        return filings[0]
+            return res
+
+        try:
+            res = self._deduplicated(
+                ("query", _query_key(query)),
+                lambda: self._retry_policy.run(send, on_retry=self._retry_hook("query")),
+            )
+        except (httpx.HTTPError, RetriesExhaustedError) as e:
+            _raise_metadata_request_error(e)
+        return res.json()
+
+
+def _make_api_key_pool(api_key: str | Iterable[str] | ApiKeyPool | None, env_var: str) -> ApiKeyPool:
+    if isinstance(api_key, ApiKeyPool):
+        return api_key
+    if api_key is not None and not isinstance(api_key, str):
+        return ApiKeyPool(api_key)
+    if (
+        not (api_key or "").strip()
+        and not os.environ.get(env_var, "").strip()
+        and os.environ.get(ApiKeyPool.ENV_VAR_NAME, "").strip()
+    ):
+        return ApiKeyPool.from_env()
+    return ApiKeyPool([get_value_or_env_var(api_key, env_var, exc=SecapioApiKeyNotSetError)])
+
+
+def _check_workers(workers: int | str) -> None:
+    if workers != AUTO_WORKERS:
+        assert workers>=1, "workers cannot be less than 1."
+
+
+def _build_section_separator_html(section: SectionType) -> str:
+    title = re.sub(r"[^a-zA-Z0-9' ]+", "", SECTION_NAMES[section])
+    return (
+        "<top-level-section-start-marker"
+        f' id="{section.value}"'
+        f' title="{title}"'
+        ' comment="This tag was added by '
+        'sec-api-io library based on sec-api.io API"'
+        ' style="display: none;"'
+        "</top-level-section-start-marker>"
+    )
+
+
+def _iter_report_parts(report_sections: Iterable[ReportSection]) -> Iterator[str]:
+    for report_section in report_sections:
+        yield report_section.marker
+        yield report_section.html
+
+
+def _iter_report_chunks(report_sections: Iterable[ReportSection]) -> Iterator[str]:
+    separator = ""
+    for part in _iter_report_parts(report_sections):
+        yield separator + part
+        separator = "\n"
+
+
+def _build_metadata_query(
+    doc_type: DocumentType,
+    key: str,
+    value: str,
+) -> tuple[str, str, dict]:
+    key = key.strip()
+    value = value.strip()
+    query = {
+        "query": {
+            "query_string": {
+                "query": f'{key}:"{value}" AND formType:"{doc_type.value}"',
+            },
+        },
+        "from": "0",
+        "size": "1",
+        "sort": [{"filedAt": {"order": "desc"}}],
+    }
+    return key, value, query
+
+
+def _query_key(query: dict) -> str:
+    return json.dumps(query, sort_keys=True)
+
+
+def _build_filings_query(query_string: str, start: int, size: int) -> dict:
+    return {
+        "query": {"query_string": {"query": query_string}},
+        "from": str(start),
+        "size": str(size),
+        "sort": [{"filedAt": {"order": "desc"}}],
+    }
+
+
+def _build_filings_query_string(
+    query: str | None,
+    *,
+    ticker: str | None,
+    doc_type: DocumentType | None,
+    filed_from: datetime.date | str | None,
+    filed_to: datetime.date | str | None,
+) -> str:
+    conditions = [f"({query.strip()})"] if query and query.strip() else []
+    if ticker:
+        conditions.append(f'ticker:"{ticker.strip()}"')
+    if doc_type is not None:
+        conditions.append(f'formType:"{doc_type.value}"')
+    if filed_from is not None or filed_to is not None:
+        lower = _format_query_date(filed_from) or "*"
+        upper = _format_query_date(filed_to) or "*"
+        conditions.append(f"filedAt:[{lower} TO {upper}]")
+    if not conditions:
+        msg = "at least one of query, ticker, doc_type, filed_from or filed_to must be provided"
+        raise ValueError(msg)
+    return " AND ".join(conditions)
+
+
+def _format_query_date(value: datetime.date | str | None) -> str | None:
+    if isinstance(value, datetime.date):
+        return value.isoformat()[:10]
+    return value
+
+
+def _raise_metadata_request_error(e: Exception) -> None:
+    if isinstance(e, httpx.HTTPStatusError):
+        if e.response.status_code == httpx.codes.FORBIDDEN:
+            msg = "Invalid API key."
+            raise SecapioApiKeyInvalidError(msg) from e
+        msg = f"HTTP Status Error occurred while making the request: {e!s}"
+        raise SecapioRequestError(msg) from e
+    msg = f"An unexpected error occurred while making the request: {e!s}"
+    raise SecapioRequestError(msg) from e
+
+
+def _parse_metadata_response(
+    data: dict,
+    doc_type: DocumentType,
+    key: str,
+    value: str,
+) -> dict:
+    filings = data["filings"]
+    if len(filings) == 0:
+        msg = f'no {doc_type.value} found for {key}="{value}"'
+        raise SecapioRequestError(msg)
+    if not isinstance(filings[0], dict):
+        msg = f"expected a dict, got {type(filings[0])}"
+        raise SecapioRequestError(msg)
+    return filings[0]
+
+
+def _is_processing_response(section_html: str) -> bool:
+    return section_html.strip() == PROCESSING_RESPONSE
+
+
+def _h2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def _normalize_ticker(ticker: str) -> str:
+    # Every metadata lookup keys tickers this way, so single and batched
+    # lookups share memoized entries.
+    return ticker.strip().upper()
 
 
 def _extract_accession_number(url: str) -> str:
+    dashed = re.search(r"(?<!\d)\d{10}-\d{2}-\d{6}(?!\d)", url)
+    if dashed:
+        return dashed.group()
     numbers = re.findall(r"\d+", url)
     s = max(numbers, key=len)
     if len(s) != ACCESSION_NUMBER_LENGTH:
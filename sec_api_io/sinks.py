@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import gzip
+import io
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Union
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+ReportTarget = Union[str, "os.PathLike[str]", IO[bytes]]
+SINK_COMPRESSIONS = (None, "gzip", "zstd")
+
+
+class SinkCompressionNotAvailableError(ImportError):
+    pass
+
+
+@contextmanager
+def open_report_sink(
+    target: ReportTarget,
+    *,
+    compression: str | None = None,
+) -> Iterator[IO[bytes]]:
+    """
+    Opens a binary sink for incremental report writes.
+
+    Paths are written to a temporary file in the same directory and renamed
+    into place only when the block exits without error, so readers never see
+    a partial report. File objects are written to directly and left open.
+    """
+    if compression not in SINK_COMPRESSIONS:
+        msg = f"Unsupported compression {compression!r}"
+        raise ValueError(msg)
+    if compression == "zstd" and zstandard is None:
+        msg = "zstd compression requires the 'zstandard' package"
+        raise SinkCompressionNotAvailableError(msg)
+    if isinstance(target, io.TextIOBase):
+        msg = "report sinks must be opened in binary mode"
+        raise TypeError(msg)
+
+    if not isinstance(target, (str, os.PathLike)):
+        with _compressing_writer(target, compression) as writer:
+            yield writer
+        return
+
+    path = Path(target)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            with _compressing_writer(f, compression) as writer:
+                yield writer
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+@contextmanager
+def _compressing_writer(
+    fileobj: IO[bytes],
+    compression: str | None,
+) -> Iterator[IO[bytes]]:
+    if compression is None:
+        yield fileobj
+    elif compression == "gzip":
+        with gzip.GzipFile(fileobj=fileobj, mode="wb") as writer:
+            yield writer
+    else:
+        with zstandard.ZstdCompressor().stream_writer(fileobj, closefd=False) as writer:
+            yield writer
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import re
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+import httpx
+from sec_api_io.report import Report
+from sec_api_io.sec_edgar_enums import SECTION_NAMES, DocumentType, SectionType
+from sec_api_io.secapio_data_retriever import PROCESSING_RESPONSE, _extract_accession_number
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterable
+
+# `key:"value"` or `key:("value" OR "value")`
+_QUERY_FIELD_RE = re.compile(r'(\w+):(?:"([^"]*)"|\(([^)]*)\))')
+
+
+class MockFiling(NamedTuple):
+    """A filing served by `MockSecapioTransport`, split into its sections."""
+
+    accession_number: str
+    doc_type: DocumentType
+    ticker: str
+    url: str
+    sections: dict[str, str]
+
+
+def split_report_html(html: str) -> dict[str, str]:
+    """Splits a report produced by `get_report_html` back into section HTML by section id."""
+    report = Report.parse(html)
+    return {section.value: report[section] for section in report}
+
+
+def load_fixture_filings(directory: str | os.PathLike) -> list[MockFiling]:
+    """
+    Loads the report fixtures of the test suite: `<ticker>.<accession>.result.htm`
+    10-K/10-Q files and `8-K/<ticker>/<accession>/primary-document-secapio.htm`.
+    """
+    directory = Path(directory)
+    filings = []
+    for path in sorted(directory.glob("*.result.htm")):
+        ticker, accession_digits = path.name.split(".")[:2]
+        sections = split_report_html(path.read_text(encoding="utf-8"))
+        doc_type = (
+            DocumentType.FORM_10Q
+            if SectionType.FORM_10Q_PART1ITEM1.value in sections
+            else DocumentType.FORM_10K
+        )
+        filings.append(_make_filing(accession_digits, doc_type, ticker, sections))
+    for path in sorted(directory.glob("8-K/*/*/primary-document-secapio.htm")):
+        accession_digits = path.parent.name.replace("-", "")
+        ticker = path.parent.parent.name
+        sections = split_report_html(path.read_text(encoding="utf-8"))
+        filings.append(_make_filing(accession_digits, DocumentType.FORM_8K, ticker, sections))
+    return filings
+
+
+def _make_filing(
+    accession_digits: str,
+    doc_type: DocumentType,
+    ticker: str,
+    sections: dict[str, str],
+) -> MockFiling:
+    accession_number = _extract_accession_number(accession_digits)
+    url = f"https://www.sec.gov/Archives/edgar/data/0/{accession_digits}/primary-document.htm"
+    return MockFiling(accession_number, doc_type, ticker, url, sections)
+
+
+class MockSecapioTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """
+    In-process stand-in for the sec-api.io extractor and query APIs.
+
+    Filings are looked up by the accession number contained in the requested
+    URL. Every response can be delayed by `latency_s` plus up to `jitter_s`,
+    and a fraction of extractor requests can fail with `error_status` or
+    answer "processing". Works with both `httpx.Client` and `httpx.AsyncClient`.
+    """
+
+    def __init__(
+        self: MockSecapioTransport,
+        filings: Iterable[MockFiling],
+        *,
+        latency_s: float = 0.0,
+        jitter_s: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        processing_rate: float = 0.0,
+        seed: int | None = None,
+    ) -> None:
+        self._filings = {filing.accession_number: filing for filing in filings}
+        self._latency_s = latency_s
+        self._jitter_s = jitter_s
+        self._error_rate = error_rate
+        self._error_status = error_status
+        self._processing_rate = processing_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.request_count = 0
+
+    @property
+    def filings(self: MockSecapioTransport) -> list[MockFiling]:
+        return list(self._filings.values())
+
+    def handle_request(self: MockSecapioTransport, request: httpx.Request) -> httpx.Response:
+        delay, response = self._respond(request)
+        if delay:
+            time.sleep(delay)
+        return response
+
+    async def handle_async_request(self: MockSecapioTransport, request: httpx.Request) -> httpx.Response:
+        delay, response = self._respond(request)
+        if delay:
+            await asyncio.sleep(delay)
+        return response
+
+    def _respond(self: MockSecapioTransport, request: httpx.Request) -> tuple[float, httpx.Response]:
+        with self._lock:
+            self.request_count += 1
+            delay = self._latency_s + self._random.uniform(0, self._jitter_s)
+            roll = self._random.random()
+        if request.url.path == "/extractor":
+            if roll < self._error_rate:
+                return delay, httpx.Response(self._error_status, request=request)
+            if roll < self._error_rate + self._processing_rate:
+                return delay, httpx.Response(200, text=PROCESSING_RESPONSE, request=request)
+            return delay, self._extract(request)
+        return delay, self._query(request)
+
+    def _extract(self: MockSecapioTransport, request: httpx.Request) -> httpx.Response:
+        try:
+            filing = self._filings.get(_extract_accession_number(request.url.params["url"]))
+        except ValueError:
+            filing = None
+        if filing is None:
+            return httpx.Response(404, request=request)
+        section_html = filing.sections.get(request.url.params["item"], "")
+        return httpx.Response(200, text=section_html, request=request)
+
+    def _query(self: MockSecapioTransport, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        conditions = [
+            (key, set(re.findall(r'"([^"]*)"', values)) if values else {value})
+            for key, value, values in _QUERY_FIELD_RE.findall(body["query"]["query_string"]["query"])
+        ]
+        matches = [_filing_metadata(filing) for filing in self._filings.values()]
+        matches = [m for m in matches if all(m.get(k) in v for k, v in conditions)]
+        start = int(body.get("from", 0))
+        size = int(body.get("size", 50))
+        data = {"total": {"value": len(matches)}, "filings": matches[start:start + size]}
+        return httpx.Response(200, json=data, request=request)
+
+
+def _filing_metadata(filing: MockFiling) -> dict:
+    metadata = {
+        "accessionNo": filing.accession_number,
+        "formType": filing.doc_type.value,
+        "ticker": filing.ticker,
+        "linkToFilingDetails": filing.url,
+    }
+    if filing.doc_type == DocumentType.FORM_8K:
+        # The query API lists an 8-K's items as "Item 2.02: <title>".
+        items = []
+        for section_id in filing.sections:
+            major, _, minor = section_id.partition("-")
+            if minor:
+                items.append(f"Item {major}.{int(minor):02d}: {SECTION_NAMES[SectionType(section_id)]}")
+        metadata["items"] = items
+    return metadata
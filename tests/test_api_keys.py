@@ -0,0 +1,85 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from sec_api_io.api_keys import ApiKeyPool, ApiKeyPoolExhaustedError
+from sec_api_io.async_secapio_data_retriever import AsyncSecapioDataRetriever
+from sec_api_io.secapio_data_retriever import SecapioApiKeyInvalidError, SecapioDataRetriever
+from sec_api_io.testing import MockSecapioTransport, load_fixture_filings
+
+
+def test_pool_balances_ejects_and_restores_keys():
+    pool = ApiKeyPool(['a', 'b', ' a ', ''], cooldown_s=0.05, quota=3)
+    assert pool.keys==['a', 'b']
+    # Equally loaded keys take turns; a key in flight is avoided.
+    first = pool.acquire()
+    assert pool.acquire()!=first
+    pool.release('a')
+    pool.release('b')
+    assert [pool.acquire() for _ in range(2)]==['a', 'b']
+    pool.release('a')
+    assert pool.release('b', 429)
+    assert (pool.available, pool.acquire())==(1, 'a')
+    pool.release('a', 200)
+    time.sleep(0.06)
+    assert pool.acquire()=='b'
+    pool.release('b')
+    # Both keys used their quota.
+    assert [s.requests for s in pool.stats()]==[3, 3]
+    assert pool.available==0
+    with pytest.raises(ApiKeyPoolExhaustedError):
+        pool.acquire()
+    assert [s.requests for s in pool.stats()]==[3, 3]
+
+    # Keys that are only cooling down are still leased, soonest back first.
+    pool = ApiKeyPool(['a', 'b'], cooldown_s=60)
+    pool.release(pool.acquire(), 403)
+    time.sleep(0.01)
+    pool.release(pool.acquire(), 429)
+    assert (pool.available, pool.acquire())==(0, 'a')
+
+
+def test_pool_from_env(monkeypatch):
+    monkeypatch.setenv('SECAPIO_API_KEYS', 'k1, k2\nk3')
+    assert ApiKeyPool.from_env().keys==['k1', 'k2', 'k3']
+    monkeypatch.delenv('SECAPIO_API_KEY', raising=False)
+    assert SecapioDataRetriever().api_key_pool.keys==['k1', 'k2', 'k3']
+    monkeypatch.delenv('SECAPIO_API_KEYS')
+    with pytest.raises(ValueError):
+        ApiKeyPool.from_env()
+
+
+def key_checking_transport(filings, valid_keys):
+    mock = MockSecapioTransport(filings)
+    tokens = []
+
+    def handler(request):
+        tokens.append(request.url.params['token'])
+        if tokens[-1] not in valid_keys:
+            return httpx.Response(403, text='invalid key')
+        return mock.handle_request(request)
+
+    return httpx.MockTransport(handler), tokens
+
+
+def test_retrievers_move_requests_off_rejected_keys():
+    filing = load_fixture_filings('tests/data')[2]
+    transport, tokens = key_checking_transport([filing], {'good'})
+    retriever = SecapioDataRetriever(api_key=['bad', 'good'], client=httpx.Client(transport=transport))
+    expected = retriever.get_report_html(filing.doc_type, filing.url, sections=['1-1', '2-1'])
+    assert tokens==['bad', 'good', 'good']
+    assert [(s.key, s.ejections, s.available) for s in retriever.api_key_pool.stats()]==[('bad', 1, False), ('good', 0, True)]
+
+    transport, tokens = key_checking_transport([filing], {'good'})
+    async_retriever = AsyncSecapioDataRetriever(api_key=['bad', 'good'], client=httpx.AsyncClient(transport=transport))
+    html = asyncio.run(async_retriever.get_report_html(filing.doc_type, filing.url, sections=['1-1', '2-1']))
+    assert html==expected
+    assert tokens[0]=='bad' and set(tokens[1:])=={'good'}
+
+    # With every key rejected the error still reaches the caller.
+    transport, tokens = key_checking_transport([filing], set())
+    retriever = SecapioDataRetriever(api_key=ApiKeyPool(['a', 'b']), client=httpx.Client(transport=transport))
+    with pytest.raises(SecapioApiKeyInvalidError):
+        retriever.retrieve_report_metadata(filing.doc_type, accession_number=filing.accession_number)
+    assert tokens==['a', 'b']
@@ -0,0 +1,83 @@
+from pathlib import Path
+
+import httpx
+import pytest
+from sec_api_io.archive import ReportAlreadyArchivedError, ReportArchive
+from sec_api_io.report import Report
+from sec_api_io.secapio_data_retriever import SecapioDataRetriever
+from sec_api_io.testing import MockSecapioTransport, load_fixture_filings
+
+FIXTURES = sorted(Path('tests/data').glob('*.result.htm'))
+
+
+def accession_number_of(path):
+    return path.name.split('.')[1]
+
+
+@pytest.mark.parametrize('compression', [None, 'zlib'])
+def test_round_trip(tmp_path, compression):
+    with ReportArchive(tmp_path, compression=compression) as archive:
+        for path in FIXTURES:
+            archive.add_report(Report.parse(path.read_bytes()), accession_number=accession_number_of(path))
+        assert len(archive)==len(FIXTURES)
+
+        for path in FIXTURES:
+            report = Report.parse(path.read_bytes())
+            for entry in report.index:
+                assert archive.get_section(accession_number_of(path), entry.section)==report[entry.section]
+            assert archive.get_report(accession_number_of(path)).html==report.html
+            assert [e.section for e in archive.sections(accession_number_of(path))]==report.sections
+
+    # The index and segments are reopened from disk.
+    with ReportArchive(tmp_path) as archive:
+        path = FIXTURES[-1]
+        assert accession_number_of(path) in archive
+        assert archive.get_section(accession_number_of(path), '7')==Report.parse(path.read_bytes())['7']
+
+
+def test_uncompressed_sections_are_views(tmp_path):
+    path = FIXTURES[-1]
+    with ReportArchive(tmp_path) as archive:
+        archive.add_report(Report.parse(path.read_bytes()), accession_number=accession_number_of(path))
+        view = archive.section_bytes(accession_number_of(path), '1')
+        assert isinstance(view, memoryview)
+        view.release()
+    assert len(list(tmp_path.glob('segment-*.dat')))==1
+
+
+def test_segments_roll_over_and_duplicates_are_rejected(tmp_path):
+    with ReportArchive(tmp_path, max_segment_bytes=1) as archive:
+        for path in FIXTURES:
+            archive.add_report(Report.parse(path.read_bytes()), accession_number=accession_number_of(path))
+        with pytest.raises(ReportAlreadyArchivedError):
+            archive.add_report(Report.parse(FIXTURES[0].read_bytes()), accession_number=accession_number_of(FIXTURES[0]))
+        with pytest.raises(KeyError):
+            archive.get_section(accession_number_of(FIXTURES[0]), '1-1')
+    assert len(list(tmp_path.glob('segment-*.dat')))==len(FIXTURES)
+
+
+def test_retriever_archives_reports(tmp_path):
+    filings = load_fixture_filings('tests/data')
+    transport = MockSecapioTransport(filings)
+    retriever = SecapioDataRetriever(api_key='key', client=httpx.Client(transport=transport))
+    requests = [(f.doc_type, f.url, list(f.sections) if f.doc_type.value == '8-K' else None) for f in filings]
+    with ReportArchive(tmp_path, compression='zlib') as archive:
+        # A filing requested twice is downloaded and archived once.
+        results = list(retriever.archive_reports(archive, requests + requests[:1], workers=4, return_exceptions=True))
+        assert len(results)==len(filings)
+        assert all(isinstance(stored, int) for _, stored in results)
+        for filing in filings:
+            sections = list(filing.sections) if filing.doc_type.value == '8-K' else None
+            expected = retriever.get_report_html(filing.doc_type, filing.url, sections=sections)
+            assert archive.get_report(filing.accession_number).html==expected
+        requests_made = transport.request_count
+        assert list(retriever.archive_reports(archive, requests)) == []
+        assert transport.request_count==requests_made
+
+        # URLs without an accession number fail before anything is fetched.
+        bad = ('10-K', 'https://www.sec.gov/Archives/edgar/data/0/primary-document.htm', None)
+        results = list(retriever.archive_reports(archive, [bad], return_exceptions=True))
+        assert [(r, type(e)) for r, e in results]==[(bad, ValueError)]
+        with pytest.raises(ValueError):
+            list(retriever.archive_reports(archive, [bad]))
+        assert transport.request_count==requests_made
@@ -0,0 +1,69 @@
+import asyncio
+
+import httpx
+import pytest
+from sec_api_io.abstract_sec_data_retriever import ReportRequest
+from sec_api_io.async_secapio_data_retriever import AsyncSecapioDataRetriever
+from sec_api_io.secapio_data_retriever import SecapioDataRetriever
+
+
+def extractor_handler(request):
+    if request.url.path == '/extractor':
+        return httpx.Response(200, text=f"<p>{request.url.params['url']} {request.url.params['item']}</p>")
+    return httpx.Response(200, json={'filings': [{'ticker': 'A'}]})
+
+
+@pytest.fixture
+def async_retriever():
+    client = httpx.AsyncClient(transport=httpx.MockTransport(extractor_handler))
+    return AsyncSecapioDataRetriever(api_key='key', client=client, max_concurrency=3)
+
+
+@pytest.fixture
+def sync_retriever():
+    client = httpx.Client(transport=httpx.MockTransport(extractor_handler))
+    return SecapioDataRetriever(api_key='key', client=client)
+
+
+def test_async_get_report_html_matches_sync(async_retriever, sync_retriever):
+    expected_html = sync_retriever.get_report_html('10-K', 'https://a')
+    actual_html = asyncio.run(async_retriever.get_report_html('10-K', 'https://a'))
+    assert actual_html==expected_html
+
+
+def test_async_retrieve_report_metadata(async_retriever):
+    metadata = asyncio.run(async_retriever.retrieve_report_metadata('10-Q', latest_from_ticker='A'))
+    assert metadata == {'ticker': 'A'}
+
+
+def test_gather_reports_html_keeps_input_order(async_retriever, sync_retriever):
+    requests = [
+        ReportRequest('10-Q', 'https://q'),
+        ('8-K', 'https://k', ['2-2', 'signature']),
+    ]
+    actual_htmls = asyncio.run(async_retriever.gather_reports_html(requests))
+    assert actual_htmls == [
+        sync_retriever.get_report_html('10-Q', 'https://q'),
+        sync_retriever.get_report_html('8-K', 'https://k', sections=['2-2', 'signature']),
+    ]
+
+
+def test_concurrency_is_bounded_across_filings():
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return httpx.Response(200, text='x')
+
+    async def run():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncSecapioDataRetriever(api_key='key', client=client, max_concurrency=4) as retriever:
+            await retriever.gather_reports_html([('10-K', f'https://{i}') for i in range(5)])
+
+    asyncio.run(run())
+    assert peak == 4
@@ -0,0 +1,130 @@
+import os
+import time
+
+import httpx
+import pytest
+from sec_api_io.cache import FileSystemCache, LRUCache, SQLiteCache, make_cache_key
+from sec_api_io.secapio_data_retriever import SecapioDataRetriever
+
+
+@pytest.fixture(params=['fs', 'sqlite'])
+def make_cache(request, tmp_path):
+    def make(**kwargs):
+        if request.param == 'fs':
+            return FileSystemCache(tmp_path / 'cache', **kwargs)
+        return SQLiteCache(tmp_path / 'cache.sqlite', **kwargs)
+    return make
+
+
+def test_roundtrip_and_stats(make_cache):
+    cache = make_cache(compression='zlib')
+    key = make_cache_key('extractor', 'https://a', '7', 'html')
+    assert cache.get(key) is None
+    cache.set(key, b'<p>item 7</p>' * 100)
+    assert cache.get(key) == b'<p>item 7</p>' * 100
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.writes == 1
+
+
+def test_ttl_expires_entries(make_cache):
+    cache = make_cache(ttl_s=0.01, compression=None)
+    cache.set('k', b'v')
+    time.sleep(0.02)
+    assert cache.get('k') is None
+
+
+def test_lru_eviction_keeps_recently_used(make_cache):
+    cache = make_cache(max_size_bytes=200, compression=None)
+    cache.set('a', b'a' * 60)
+    time.sleep(0.01)
+    cache.set('b', b'b' * 60)
+    time.sleep(0.01)
+    assert cache.get('a') == b'a' * 60
+    time.sleep(0.01)
+    cache.set('c', b'c' * 60)
+    assert cache.get('b') is None
+    assert cache.get('a') == b'a' * 60
+    assert cache.get('c') == b'c' * 60
+    assert cache.stats.evictions == 1
+
+
+def test_close_and_reuse(make_cache):
+    cache = make_cache(max_size_bytes=200, compression=None)
+    cache.set('a', b'a' * 45)
+    time.sleep(0.01)
+    cache.set('b', b'b' * 45)
+    time.sleep(0.01)
+    assert cache.get('a') == b'a' * 45
+    cache.close()
+    # The hit before closing still counts for eviction order.
+    time.sleep(0.01)
+    cache.set('c', b'c' * 45)
+    cache.set('d', b'd' * 45)
+    assert cache.get('b') is None
+    assert cache.get('a') == b'a' * 45
+    assert cache.stats.evictions == 1
+    cache.close()
+    cache.close()
+
+
+def test_cache_is_shared_between_instances(make_cache):
+    make_cache(compression='zlib').set('k', b'v')
+    assert make_cache(compression=None).get('k') == b'v'
+
+
+def test_retriever_serves_repeat_calls_from_cache(tmp_path):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        if request.url.path == '/extractor':
+            return httpx.Response(200, text=f"<p>{request.url.params['item']}</p>")
+        return httpx.Response(200, json={'filings': [{'accessionNo': '0001090872-22-000026'}]})
+
+    cache = FileSystemCache(tmp_path)
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    retriever = SecapioDataRetriever(api_key='key', client=client, cache=cache)
+    first_html = retriever.get_report_html('10-Q', 'https://a')
+    retriever.retrieve_report_metadata('10-Q', accession_number='000109087222000026')
+    calls.clear()
+    assert retriever.get_report_html('10-Q', 'https://a', use_multithreading=True, workers=4)==first_html
+    retriever.retrieve_report_metadata('10-Q', accession_number='000109087222000026')
+    assert calls == []
+    retriever.retrieve_report_metadata('10-Q', latest_from_ticker='A')
+    assert calls == ['/']
+
+
+def test_lru_cache_bounds_entries_and_expires():
+    cache = LRUCache(2)
+    cache.set('a', 1)
+    cache.set('b', 2, ttl_s=0.01)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+    assert cache.get('b') is None
+    assert cache.stats.evictions == 1
+    cache.set('d', 4, ttl_s=0.01)
+    time.sleep(0.02)
+    assert cache.get('d') is None
+    assert cache.get('c') == 3
+
+
+def test_metadata_is_memoized_and_invalidated():
+    calls = []
+
+    def handler(request):
+        calls.append(request.read())
+        return httpx.Response(200, json={'filings': [{'n': len(calls)}]})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    retriever = SecapioDataRetriever(api_key='key', client=client, latest_metadata_ttl_s=0.05)
+    assert retriever.retrieve_report_metadata('10-Q', latest_from_ticker='AAPL') == {'n': 1}
+    assert retriever.retrieve_report_metadata('10-Q', latest_from_ticker='AAPL') == {'n': 1}
+    assert retriever.retrieve_report_metadata('10-Q', accession_number='https://www.sec.gov/Archives/edgar/data/1090872/000109087222000026/a-20221031.htm') == {'n': 2}
+    assert retriever.metadata_cache_stats.hits == 1
+    assert retriever.invalidate_report_metadata(latest_from_ticker='AAPL') == 1
+    assert retriever.retrieve_report_metadata('10-Q', latest_from_ticker='AAPL') == {'n': 3}
+    time.sleep(0.06)
+    assert retriever.retrieve_report_metadata('10-Q', latest_from_ticker='AAPL') == {'n': 4}
+    assert retriever.retrieve_report_metadata('10-Q', accession_number='000109087222000026') == {'n': 2}
+    assert len(calls) == 4
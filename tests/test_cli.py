@@ -0,0 +1,48 @@
+import io
+import json
+
+import httpx
+import pytest
+from sec_api_io.cli import REPORT_FILE_NAME, download, main, read_inputs
+from sec_api_io.secapio_data_retriever import SecapioDataRetriever
+from sec_api_io.testing import MockSecapioTransport, load_fixture_filings
+
+
+def test_download_writes_the_fixture_tree_and_resumes(tmp_path):
+    aeon, cownl = [f for f in load_fixture_filings('tests/data') if f.doc_type.value == '8-K']
+    transport = MockSecapioTransport([aeon, cownl])
+    retriever = SecapioDataRetriever(api_key='key', client=httpx.Client(transport=transport))
+    inputs = read_inputs(['# 8-Ks\n', 'aeon\n', '\n', f'{cownl.url}\n', 'NOPE\n', aeon.accession_number])
+    assert inputs==['aeon', cownl.url, 'NOPE', aeon.accession_number]
+
+    status = io.StringIO()
+    summary = download(retriever, inputs, doc_type='8-K', output_dir=tmp_path, sections='present', status=status)
+    # Both inputs naming AEON's filing get a record, but it is written once.
+    assert summary[:3]==(3, 0, 1)
+    records = [json.loads(line) for line in status.getvalue().splitlines()]
+    assert sorted((r['input'], r['status']) for r in records)==sorted(
+        [('NOPE', 'failed'), ('aeon', 'done'), (aeon.accession_number, 'done'), (cownl.url, 'done')],
+    )
+    sizes = []
+    for filing in [aeon, cownl]:
+        path = tmp_path / '8-K' / filing.ticker / filing.accession_number / REPORT_FILE_NAME
+        expected = retriever.get_report_html('8-K', filing.url, sections=list(filing.sections))
+        assert path.read_text(encoding='utf-8')==expected
+        sizes.append(len(expected.encode()))
+    assert summary.bytes_written==sum(sizes)
+
+    # A second run finds the reports on disk and downloads nothing.
+    requests = transport.request_count
+    status = io.StringIO()
+    summary = download(retriever, [aeon.accession_number, cownl.url], doc_type='8-K', output_dir=tmp_path, status=status)
+    assert summary[:3]==(0, 2, 0)
+    assert [json.loads(line)['status'] for line in status.getvalue().splitlines()]==['skipped', 'skipped']
+    assert transport.request_count - requests<=1
+
+
+@pytest.mark.parametrize('workers', ['0', '-2', 'many', '1.5'])
+def test_invalid_workers_is_a_usage_error(workers, capsys, tmp_path):
+    with pytest.raises(SystemExit) as excinfo:
+        main(['--doc-type', '8-K', '-o', str(tmp_path), '--workers', workers])
+    assert excinfo.value.code==2
+    assert 'positive integer' in capsys.readouterr().err
@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+from sec_api_io.async_secapio_data_retriever import AsyncSecapioDataRetriever
+from sec_api_io.concurrency import AdaptiveConcurrencyLimiter
+from sec_api_io.instrumentation import InMemoryInstrumentation
+from sec_api_io.retry import RetryPolicy
+from sec_api_io.secapio_data_retriever import SecapioDataRetriever
+from sec_api_io.testing import MockSecapioTransport, load_fixture_filings
+
+
+def saturate(limiter, latency_s, **kwargs):
+    """Fills every slot and releases them all with the same outcome."""
+    for _ in range(limiter.limit):
+        limiter.acquire()
+    for _ in range(limiter.in_flight):
+        limiter.release(latency_s, **kwargs)
+
+
+def test_limit_grows_while_healthy_and_backs_off_on_overload():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=8)
+    for _ in range(20):
+        saturate(limiter, 0.01)
+    assert limiter.limit==8
+
+    # A window of failures backs off once.
+    saturate(limiter, 0.01, overloaded=True)
+    assert limiter.limit==4
+    # Latency well above the baseline shrinks it, again once per round trip.
+    time.sleep(0.06)
+    saturate(limiter, 0.05)
+    assert limiter.limit==3
+
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=4)
+
+
+def test_limit_is_not_exceeded_by_threads_or_tasks():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+    peak = []
+
+    def work():
+        limiter.acquire()
+        peak.append(limiter.in_flight)
+        time.sleep(0.01)
+        limiter.release(0.01)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    async def task():
+        await limiter.acquire_async()
+        peak.append(limiter.in_flight)
+        await asyncio.sleep(0.01)
+        limiter.release(0.01)
+
+    async def main():
+        await asyncio.gather(*(task() for _ in range(8)))
+
+    asyncio.run(main())
+    assert len(peak)==16
+    assert max(peak)==2
+    assert limiter.in_flight==0
+
+
+def test_retrievers_with_auto_workers():
+    filing = load_fixture_filings('tests/data')[1]
+    instrumentation = InMemoryInstrumentation()
+    client = httpx.Client(transport=MockSecapioTransport([filing], latency_s=0.01))
+    retriever = SecapioDataRetriever(api_key='key', client=client, instrumentation=instrumentation)
+    expected = retriever.get_report_html(filing.doc_type, filing.url)
+    assert retriever.concurrency_limiter is None
+
+    html = retriever.get_report_html(filing.doc_type, filing.url, use_multithreading=True, workers='auto')
+    assert html==expected
+    limiter = retriever.concurrency_limiter
+    assert limiter.limit > 4
+    assert instrumentation.gauges['concurrency.limit']==limiter.limit
+
+    # Throttled requests bring the limit down.
+    transport = MockSecapioTransport([filing], error_rate=0.5, error_status=429, seed=1)
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=16)
+    retry_policy = RetryPolicy(base_delay_s=0.001, max_delay_s=0.001, max_retries=20)
+    async_retriever = AsyncSecapioDataRetriever(
+        api_key='key',
+        client=httpx.AsyncClient(transport=transport),
+        max_concurrency='auto',
+        concurrency_limiter=limiter,
+        retry_policy=retry_policy,
+    )
+    assert asyncio.run(async_retriever.get_report_html(filing.doc_type, filing.url))==expected
+    assert limiter.limit < 16
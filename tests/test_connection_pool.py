@@ -0,0 +1,44 @@
+import httpx
+import pytest
+from sec_api_io.secapio_data_retriever import SecapioDataRetriever
+
+
+@pytest.fixture
+def seen_connections():
+    return []
+
+
+@pytest.fixture
+def mock_client(seen_connections):
+    def handler(request):
+        seen_connections.append(request.url.path)
+        if request.url.path == '/extractor':
+            return httpx.Response(200, text=f"<p>{request.url.params['item']}</p>")
+        return httpx.Response(200, json={'filings': [{'accessionNo': '0001090872-22-000026'}]})
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+def test_pool_limits_are_exposed():
+    retriever = SecapioDataRetriever(api_key='key', max_connections=7, max_keepalive_connections=3, keepalive_expiry_s=12, http2=False)
+    assert retriever.pool_limits.max_connections == 7
+    assert retriever.pool_limits.max_keepalive_connections == 3
+    assert retriever.pool_limits.keepalive_expiry == 12
+    assert retriever.http2 is False
+    retriever.close()
+
+
+def test_context_manager_closes_owned_client():
+    with SecapioDataRetriever(api_key='key', http2=False) as retriever:
+        client = retriever.client
+        assert not client.is_closed
+    assert client.is_closed
+
+
+def test_injected_client_is_shared_and_not_closed(mock_client, seen_connections):
+    with SecapioDataRetriever(api_key='key', client=mock_client) as retriever:
+        html = retriever.get_report_html('10-Q', 'https://www.sec.gov/x.htm', sections=['part1item1', 'part1item2'])
+        metadata = retriever.retrieve_report_metadata('10-Q', latest_from_ticker='A')
+    assert '<p>part1item1</p>' in html and '<p>part1item2</p>' in html
+    assert metadata['accessionNo'] == '0001090872-22-000026'
+    assert seen_connections == ['/extractor', '/extractor', '/']
+    assert not mock_client.is_closed
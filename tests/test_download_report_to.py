@@ -0,0 +1,65 @@
+import gzip
+import io
+
+import httpx
+import pytest
+from sec_api_io import secapio_data_retriever
+from sec_api_io.cache import SQLiteCache
+from sec_api_io.secapio_data_retriever import SecapioDataRetriever
+
+
+def handler(request):
+    url = request.url.params['url']
+    if url == 'https://broken':
+        return httpx.Response(404, text='not found')
+    return httpx.Response(200, content=f"<p>{url} {request.url.params['item']} é</p>".encode() * 1000)
+
+
+@pytest.fixture
+def retriever():
+    return SecapioDataRetriever(api_key='key', client=httpx.Client(transport=httpx.MockTransport(handler)))
+
+
+def test_download_report_to_path_matches_report_html(retriever, tmp_path):
+    expected_html = retriever.get_report_html('10-K', 'https://a')
+    written = retriever.download_report_to(tmp_path / 'a' / 'report.htm', '10-K', 'https://a')
+    assert (tmp_path / 'a' / 'report.htm').read_text(encoding='utf-8')==expected_html
+    assert written == len(expected_html.encode())
+    assert [p.name for p in (tmp_path / 'a').iterdir()] == ['report.htm']
+
+
+def test_download_report_to_fileobj_with_gzip(retriever):
+    buffer = io.BytesIO()
+    retriever.download_report_to(buffer, '8-K', 'https://a', sections=['2-2', 'signature'], compression='gzip')
+    expected_html = retriever.get_report_html('8-K', 'https://a', sections=['2-2', 'signature'])
+    assert gzip.decompress(buffer.getvalue()).decode()==expected_html
+    assert not buffer.closed
+
+
+def test_failed_download_leaves_no_file(retriever, tmp_path):
+    with pytest.raises(httpx.HTTPStatusError):
+        retriever.download_report_to(tmp_path / 'report.htm', '8-K', 'https://broken', sections=['signature'])
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_download_reports_to(retriever, tmp_path):
+    downloads = [(tmp_path / f'{i}.htm', ('10-Q', f'https://{i}')) for i in range(3)]
+    downloads.append((tmp_path / 'broken.htm', ('8-K', 'https://broken', ['signature'])))
+    results = list(retriever.download_reports_to(downloads, workers=3, return_exceptions=True))
+    assert len(results) == 4
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['0.htm', '1.htm', '2.htm']
+    assert (tmp_path / '1.htm').read_text(encoding='utf-8')==retriever.get_report_html('10-Q', 'https://1')
+
+
+def test_download_report_to_only_caches_small_sections(tmp_path, monkeypatch):
+    cache = SQLiteCache(tmp_path / 'cache.sqlite')
+    retriever = SecapioDataRetriever(api_key='key', client=httpx.Client(transport=httpx.MockTransport(handler)), cache=cache)
+    monkeypatch.setattr(secapio_data_retriever, 'MAX_STREAMED_CACHE_ENTRY_BYTES', 10_000)
+    buffer = io.BytesIO()
+    retriever.download_report_to(buffer, '8-K', 'https://a', sections=['2-2'])
+    assert cache.stats.writes==0
+    monkeypatch.setattr(secapio_data_retriever, 'MAX_STREAMED_CACHE_ENTRY_BYTES', 100_000)
+    retriever.download_report_to(io.BytesIO(), '8-K', 'https://a', sections=['2-2'])
+    assert cache.stats.writes==1
+    assert retriever.get_report_html('8-K', 'https://a', sections=['2-2']).encode() in buffer.getvalue()
+    assert cache.stats.hits==1
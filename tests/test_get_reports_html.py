@@ -0,0 +1,76 @@
+import threading
+import time
+
+import httpx
+import pytest
+from sec_api_io.abstract_sec_data_retriever import ReportRequest
+from sec_api_io.secapio_data_retriever import SecapioDataRetriever
+
+
+def handler(request):
+    url = request.url.params['url']
+    if url == 'https://slow':
+        time.sleep(0.05)
+    if url == 'https://broken':
+        return httpx.Response(404, request=request)
+    return httpx.Response(200, text=f"<p>{url} {request.url.params['item']}</p>")
+
+
+@pytest.fixture
+def retriever():
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    return SecapioDataRetriever(api_key='key', client=client)
+
+
+def test_get_reports_html_matches_single_filing_results(retriever):
+    requests = [
+        ReportRequest('10-Q', 'https://slow'),
+        ('10-K', 'https://fast'),
+        ('8-K', 'https://8k', ['2-2', 'signature']),
+    ]
+    actual = dict((r.url, html) for r, html in retriever.get_reports_html(requests, workers=8))
+    assert actual == {
+        'https://slow': retriever.get_report_html('10-Q', 'https://slow'),
+        'https://fast': retriever.get_report_html('10-K', 'https://fast'),
+        'https://8k': retriever.get_report_html('8-K', 'https://8k', sections=['2-2', 'signature']),
+    }
+
+
+def test_get_reports_html_yields_completed_filings_first(retriever):
+    requests = [('10-Q', 'https://slow'), ('8-K', 'https://fast', ['signature'])]
+    urls = [r.url for r, _ in retriever.get_reports_html(requests, workers=20)]
+    assert urls == ['https://fast', 'https://slow']
+
+
+def test_get_reports_html_bounds_threads_across_filings():
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def counting_handler(request):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.002)
+        with lock:
+            in_flight -= 1
+        return httpx.Response(200, text='x')
+
+    client = httpx.Client(transport=httpx.MockTransport(counting_handler))
+    retriever = SecapioDataRetriever(api_key='key', client=client)
+    results = list(retriever.get_reports_html([('10-Q', f'https://{i}') for i in range(6)], workers=5))
+    assert len(results) == 6
+    assert peak <= 5
+
+
+def test_get_reports_html_return_exceptions(retriever):
+    requests = [('8-K', 'https://broken', ['signature']), ('8-K', 'https://ok', ['signature'])]
+    results = dict((r.url, html) for r, html in retriever.get_reports_html(requests, workers=2, return_exceptions=True))
+    assert isinstance(results['https://broken'], httpx.HTTPStatusError)
+    assert 'https://ok signature' in results['https://ok']
+
+
+def test_multithreading_path_is_unchanged(retriever):
+    expected_html = retriever.get_report_html('10-K', 'https://a')
+    assert retriever.get_report_html('10-K', 'https://a', use_multithreading=True, workers=7)==expected_html
@@ -0,0 +1,99 @@
+import asyncio
+
+import httpx
+import pytest
+from sec_api_io.async_secapio_data_retriever import AsyncSecapioDataRetriever
+from sec_api_io.cache import FileSystemCache
+from sec_api_io.instrumentation import (
+    Histogram,
+    InMemoryInstrumentation,
+    Instrumentation,
+    InstrumentationNotAvailableError,
+    OpenTelemetryInstrumentation,
+    otel_trace,
+)
+from sec_api_io.retry import RetryPolicy
+from sec_api_io.secapio_data_retriever import SecapioDataRetriever
+from sec_api_io.testing import MockSecapioTransport, load_fixture_filings
+
+
+@pytest.fixture(scope='module')
+def fixture_filings():
+    return load_fixture_filings('tests/data')
+
+
+def make_retriever(transport, **kwargs):
+    retry_policy = RetryPolicy(base_delay_s=0.001, max_delay_s=0.001)
+    return SecapioDataRetriever(api_key='key', client=httpx.Client(transport=transport), retry_policy=retry_policy, **kwargs)
+
+
+def test_histogram_percentiles():
+    histogram = Histogram([1, 2, 4, 8])
+    for value in [0.5, 1.5, 1.5, 3, 7, 100]:
+        histogram.record(value)
+    assert (histogram.count, histogram.min, histogram.max) == (6, 0.5, 100)
+    assert histogram.percentile(50)==2
+    assert histogram.percentile(99)==100
+    assert histogram.buckets()[-1] == (float('inf'), 1)
+
+
+def test_default_instrumentation_is_a_noop(fixture_filings):
+    retriever = make_retriever(MockSecapioTransport(fixture_filings))
+    assert type(retriever.instrumentation) is Instrumentation
+    assert not retriever.instrumentation.enabled
+
+
+def test_in_memory_instrumentation_records_sections_filings_and_retries(fixture_filings, tmp_path):
+    instrumentation = InMemoryInstrumentation()
+    transport = MockSecapioTransport(fixture_filings, error_rate=0.3, seed=1)
+    retriever = make_retriever(transport, instrumentation=instrumentation, cache=FileSystemCache(tmp_path))
+    filing = next(f for f in fixture_filings if f.doc_type.value == '10-K')
+    retriever.get_report_html(filing.doc_type, filing.url, use_multithreading=True, workers=4)
+    retriever.get_report_html(filing.doc_type, filing.url)
+
+    counters = instrumentation.counters
+    sections = len(filing.sections)
+    assert counters['requests']==transport.request_count
+    assert counters['retries']==counters['request_errors']>0
+    assert counters['sections']==2 * sections
+    assert counters['section_cache_hits']==sections
+    assert counters['filings']==2
+    assert 1 <= instrumentation.histogram('request.in_flight').max <= 4
+    assert instrumentation.histogram('section.size_bytes').count==2 * sections
+    slowest = instrumentation.slowest_filings()
+    assert [e.url for e in slowest] == [filing.url, filing.url]
+    assert slowest[0].elapsed_s >= slowest[1].elapsed_s
+
+
+def test_in_memory_instrumentation_with_bulk_and_async(fixture_filings):
+    filings = [f for f in fixture_filings if f.doc_type.value == '8-K']
+    requests = [(f.doc_type, f.url, list(f.sections)) for f in filings]
+
+    instrumentation = InMemoryInstrumentation()
+    retriever = make_retriever(MockSecapioTransport(filings), instrumentation=instrumentation)
+    for _ in retriever.get_reports_html(requests, workers=2):
+        pass
+    assert instrumentation.counters['filings']==len(filings)
+
+    instrumentation.reset()
+    async_retriever = AsyncSecapioDataRetriever(api_key='key', client=httpx.AsyncClient(transport=MockSecapioTransport(filings)), instrumentation=instrumentation)
+    asyncio.run(async_retriever.gather_reports_html(requests))
+    snapshot = instrumentation.snapshot()
+    assert snapshot['counters']['filings']==len(filings)
+    assert snapshot['counters']['requests']==sum(len(f.sections) for f in filings)
+    assert snapshot['histograms']['filing.latency_s']['count']==len(filings)
+
+
+def test_errors_are_recorded(fixture_filings):
+    instrumentation = InMemoryInstrumentation()
+    retriever = make_retriever(MockSecapioTransport(fixture_filings), instrumentation=instrumentation)
+    with pytest.raises(httpx.HTTPStatusError):
+        retriever.get_report_html('10-K', 'https://www.sec.gov/Archives/edgar/data/0/000000000000000000/x.htm')
+    assert instrumentation.counters['section_errors']>=1
+    assert instrumentation.counters['filing_errors']==1
+
+
+@pytest.mark.skipif(otel_trace is not None, reason='opentelemetry-api is installed')
+def test_open_telemetry_requires_package():
+    with pytest.raises(InstrumentationNotAvailableError):
+        OpenTelemetryInstrumentation()
@@ -0,0 +1,60 @@
+import datetime
+import itertools
+
+import httpx
+import pytest
+from sec_api_io.abstract_sec_data_retriever import ReportRequest
+from sec_api_io.sec_edgar_enums import DocumentType
+from sec_api_io.secapio_data_retriever import SecapioDataRetriever, _build_filings_query_string
+from sec_api_io.testing import MockFiling, MockSecapioTransport
+
+
+def make_filing(i, ticker='AAPL'):
+    digits = f'{i:018d}'
+    accession_number = f'{digits[:10]}-{digits[10:12]}-{digits[12:]}'
+    url = f'https://www.sec.gov/Archives/edgar/data/0/{digits}/primary-document.htm'
+    return MockFiling(accession_number, DocumentType.FORM_8K, ticker, url, {'1-1': f'<p>{i}</p>'})
+
+
+@pytest.fixture
+def transport():
+    filings = [make_filing(i) for i in range(1, 6)] + [make_filing(10, ticker='MSFT')]
+    return MockSecapioTransport(filings)
+
+
+@pytest.fixture
+def retriever(transport):
+    return SecapioDataRetriever(api_key='key', client=httpx.Client(transport=transport))
+
+
+def test_build_filings_query_string():
+    query_string = _build_filings_query_string('items:"1.01"', ticker='AAPL', doc_type=DocumentType.FORM_8K, filed_from=datetime.date(2020, 1, 1), filed_to=None)
+    assert query_string == '(items:"1.01") AND ticker:"AAPL" AND formType:"8-K" AND filedAt:[2020-01-01 TO *]'
+    with pytest.raises(ValueError):
+        _build_filings_query_string(None, ticker=None, doc_type=None, filed_from=None, filed_to=None)
+
+
+def test_iter_filings_pages_through_all_results(retriever, transport):
+    filings = list(retriever.iter_filings(ticker='AAPL', doc_type='8-K', page_size=2))
+    assert len(filings)==5
+    assert {f['ticker'] for f in filings} == {'AAPL'}
+    assert transport.request_count==3
+
+
+def test_iter_filings_stops_when_consumer_stops(retriever, transport):
+    filings = list(itertools.islice(retriever.iter_filings(ticker='AAPL', page_size=2), 1))
+    assert len(filings)==1
+    # The first page plus at most one prefetched page.
+    assert transport.request_count<=2
+
+
+def test_iter_filings_feeds_bulk_downloader(retriever):
+    requests = (ReportRequest.from_metadata(m, sections=['1-1']) for m in retriever.iter_filings(ticker='MSFT'))
+    results = list(retriever.get_reports_html(requests, workers=2))
+    assert len(results)==1
+    assert results[0][1].endswith('<p>10</p>')
+
+
+def test_invalid_page_size(retriever):
+    with pytest.raises(ValueError):
+        next(retriever.iter_filings(ticker='AAPL', page_size=51))
@@ -0,0 +1,79 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from sec_api_io.async_secapio_data_retriever import AsyncSecapioDataRetriever
+from sec_api_io.scheduler import SectionDeadlineExceededError
+from sec_api_io.sec_edgar_enums import SectionType
+from sec_api_io.secapio_data_retriever import SecapioDataRetriever
+
+
+def handler(request):
+    item = request.url.params['item']
+    if item == 'part1item1':
+        time.sleep(0.05)
+    return httpx.Response(200, text=f'<p>{item}</p>')
+
+
+async def async_handler(request):
+    item = request.url.params['item']
+    if item == 'part1item1':
+        await asyncio.sleep(0.05)
+    return httpx.Response(200, text=f'<p>{item}</p>')
+
+
+@pytest.fixture
+def retriever():
+    return SecapioDataRetriever(api_key='key', client=httpx.Client(transport=httpx.MockTransport(handler)))
+
+
+@pytest.mark.parametrize('workers', [1, 4])
+def test_stream_report_html_concatenates_to_report(retriever, workers):
+    expected_html = retriever.get_report_html('10-Q', 'https://a')
+    assert ''.join(retriever.stream_report_html('10-Q', 'https://a', workers=workers))==expected_html
+
+
+def test_iter_report_sections_in_order(retriever):
+    sections = [s.section for s in retriever.iter_report_sections('10-Q', 'https://a', workers=4)]
+    assert sections[0] == SectionType.FORM_10Q_PART1ITEM1
+    assert len(sections) == 11
+
+
+def test_iter_report_sections_as_completed(retriever):
+    report_sections = list(retriever.iter_report_sections('10-Q', 'https://a', workers=11, ordered=False))
+    assert report_sections[-1].section == SectionType.FORM_10Q_PART1ITEM1
+    assert report_sections[-1].html == '<p>part1item1</p>'
+    assert report_sections[-1].marker.startswith('<top-level-section-start-marker id="part1item1"')
+
+
+def test_async_iter_report_sections():
+    async def collect(ordered):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(async_handler))
+        async with AsyncSecapioDataRetriever(api_key='key', client=client) as retriever:
+            return [s.section async for s in retriever.iter_report_sections('10-Q', 'https://a', ordered=ordered)]
+
+    assert asyncio.run(collect(True))[0] == SectionType.FORM_10Q_PART1ITEM1
+    assert asyncio.run(collect(False))[-1] == SectionType.FORM_10Q_PART1ITEM1
+
+
+def test_iter_report_sections_by_priority(retriever):
+    sections = [s.section.value for s in retriever.iter_report_sections('10-Q', 'https://a', ordered=False)]
+    assert sections[:2]==['part1item2', 'part1item1']
+    assert sections[-1]=='part2item6'
+
+    report_sections = retriever.iter_report_sections('10-Q', 'https://a', ordered=False, priorities={'part2item6': 20})
+    assert next(report_sections).section==SectionType.FORM_10Q_PART2ITEM6
+
+
+def test_sections_not_started_before_deadline_fail(retriever):
+    with pytest.raises(SectionDeadlineExceededError):
+        retriever.get_report('10-Q', 'https://a', deadline_s=0.02)
+    assert len(retriever.get_report('10-Q', 'https://a', deadline_s=10))==11
+
+
+def test_every_pending_job_past_its_deadline(retriever):
+    # The slow section outlives the deadline of every job still queued.
+    results = list(retriever.get_reports_html([('10-Q', 'https://a')], workers=1, deadline_s=0.01, return_exceptions=True))
+    assert len(results)==1
+    assert isinstance(results[0][1], SectionDeadlineExceededError)
@@ -0,0 +1,77 @@
+import httpx
+from sec_api_io import jobs
+from sec_api_io.archive import ReportArchive
+from sec_api_io.jobs import BulkDownloadJob, JobSummary
+from sec_api_io.retry import RetryPolicy
+from sec_api_io.secapio_data_retriever import SecapioDataRetriever
+from sec_api_io.testing import MockSecapioTransport, load_fixture_filings
+
+MISSING_URL = 'https://www.sec.gov/Archives/edgar/data/0/000000000000000000/primary-document.htm'
+
+
+def make_job(tmp_path, transport):
+    retriever = SecapioDataRetriever(api_key='key', client=httpx.Client(transport=transport), retry_policy=RetryPolicy(max_retries=0))
+    return retriever, BulkDownloadJob(retriever, tmp_path / 'journal.sqlite', ReportArchive(tmp_path / 'archive'))
+
+
+def requests_for(filings):
+    return [(f.doc_type, f.url, list(f.sections) if f.doc_type.value == '8-K' else None) for f in filings]
+
+
+def test_job_resumes_and_retries_transient_failures(tmp_path):
+    filings = load_fixture_filings('tests/data')
+    # Half of the requests fail with 503 on the first run.
+    retriever, job = make_job(tmp_path, MockSecapioTransport(filings, error_rate=0.5, seed=3))
+    assert job.add(requests_for(filings))==len(filings)
+    summary = job.run(workers=4, max_passes=1)
+    assert summary.done < len(filings)
+    job.close()
+
+    # A new process picks up the journal and only fetches what is missing.
+    transport = MockSecapioTransport(filings)
+    retriever, job = make_job(tmp_path, transport)
+    assert job.add(requests_for(filings))==0
+    assert job.run(workers=4)==JobSummary(len(filings), 0, 0)
+    assert transport.request_count < sum(len(f.sections) for f in filings)
+    for filing in filings:
+        sections = list(filing.sections) if filing.doc_type.value == '8-K' else None
+        expected = retriever.get_report_html(filing.doc_type, filing.url, sections=sections)
+        assert job._archive.get_report(filing.accession_number).html==expected
+
+
+def test_permanent_failures_are_recorded(tmp_path):
+    filings = load_fixture_filings('tests/data')[:1]
+    transport = MockSecapioTransport(filings)
+    _, job = make_job(tmp_path, transport)
+    job.add(requests_for(filings) + [('10-K', MISSING_URL, ['1', '7'])])
+    assert job.run(workers=2, retry_delay_s=0)==JobSummary(1, 1, 0)
+    failures = job.failures()
+    assert [(f.url, f.section, f.attempts) for f in failures]==[(MISSING_URL, '1', 1), (MISSING_URL, '7', 1)]
+    assert '404' in failures[0].error
+
+    requests_made = transport.request_count
+    job.run(workers=2, retry_delay_s=0)
+    assert transport.request_count==requests_made
+
+
+def test_filings_fail_when_a_section_runs_out_of_attempts(tmp_path):
+    filings = load_fixture_filings('tests/data')[:1]
+    transport = MockSecapioTransport(filings, error_rate=1.0)
+    retriever = SecapioDataRetriever(api_key='key', client=httpx.Client(transport=transport), retry_policy=RetryPolicy(max_retries=0))
+    job = BulkDownloadJob(retriever, tmp_path / 'journal.sqlite', ReportArchive(tmp_path / 'archive'), max_attempts=2)
+    job.add(requests_for(filings))
+    assert job.run(workers=2, max_passes=5, retry_delay_s=0)==JobSummary(0, 1, 0)
+    assert {f.attempts for f in job.failures()}=={2}
+
+
+def test_outstanding_sections_are_read_in_pages(tmp_path, monkeypatch):
+    monkeypatch.setattr(jobs, 'JOURNAL_PAGE_SIZE', 2)
+    filings = load_fixture_filings('tests/data')
+    transport = MockSecapioTransport(filings)
+    retriever, job = make_job(tmp_path, transport)
+    job.add(requests_for(filings))
+    pages = list(job._outstanding_pages())
+    assert all(len(page)<=2 for page in pages)
+    assert sum(map(len, pages))==sum(len(f.sections) for f in filings)
+    assert job.run(workers=4)==JobSummary(len(filings), 0, 0)
+    assert transport.request_count==sum(len(f.sections) for f in filings)
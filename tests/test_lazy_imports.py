@@ -0,0 +1,27 @@
+import subprocess
+import sys
+
+import sec_api_io
+
+
+def loaded_modules(code):
+    output = subprocess.run([sys.executable, '-c', f'import sys\n{code}\nprint(" ".join(sys.modules))'], check=True, capture_output=True, text=True).stdout
+    return set(output.split())
+
+
+def test_top_level_import_does_not_load_transport_dependencies():
+    modules = loaded_modules('import sec_api_io\nfrom sec_api_io import DocumentType, SectionType, ReportRequest')
+    assert 'httpx' not in modules
+    assert 'concurrent.futures' not in modules
+    assert 'sec_api_io.secapio_data_retriever' not in modules
+    assert 'httpx' in loaded_modules('from sec_api_io import SecapioDataRetriever')
+
+
+def test_public_api_resolves_lazily():
+    from sec_api_io.async_secapio_data_retriever import AsyncSecapioDataRetriever
+    from sec_api_io.secapio_data_retriever import SecapioDataRetriever
+    assert sec_api_io.SecapioDataRetriever is SecapioDataRetriever
+    assert sec_api_io.AsyncSecapioDataRetriever is AsyncSecapioDataRetriever
+    assert set(sec_api_io.__all__) <= set(dir(sec_api_io))
+    for name in sec_api_io.__all__:
+        getattr(sec_api_io, name)
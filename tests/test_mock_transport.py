@@ -0,0 +1,56 @@
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+from sec_api_io.async_secapio_data_retriever import AsyncSecapioDataRetriever
+from sec_api_io.retry import RetryPolicy
+from sec_api_io.secapio_data_retriever import SecapioDataRetriever
+from sec_api_io.testing import MockSecapioTransport, load_fixture_filings
+
+
+@pytest.fixture(scope='module')
+def fixture_filings():
+    return load_fixture_filings('tests/data')
+
+
+def make_retriever(transport):
+    retry_policy = RetryPolicy(base_delay_s=0.001, max_delay_s=0.001)
+    return SecapioDataRetriever(api_key='key', client=httpx.Client(transport=transport), retry_policy=retry_policy, processing_poll_interval_s=0.001)
+
+
+def expected_report(filing):
+    if filing.doc_type.value == '8-K':
+        return (Path('tests/data/8-K') / filing.ticker / filing.accession_number / 'primary-document-secapio.htm').read_text(encoding='utf-8')
+    return Path(f'tests/data/{filing.ticker}.{filing.accession_number.replace("-", "")}.result.htm').read_text(encoding='utf-8')
+
+
+def test_fixtures_are_loaded(fixture_filings):
+    assert sorted((f.doc_type.value, f.ticker) for f in fixture_filings) == [('10-K', 'A'), ('10-Q', 'A'), ('8-K', 'AEON'), ('8-K', 'COWNL')]
+
+
+def test_mock_server_reproduces_fixture_reports(fixture_filings):
+    retriever = make_retriever(MockSecapioTransport(fixture_filings))
+    for filing in fixture_filings:
+        sections = list(filing.sections) if filing.doc_type.value == '8-K' else None
+        actual_html = retriever.get_report_html(filing.doc_type, filing.url, sections=sections, use_multithreading=True, workers=4)
+        assert actual_html==expected_report(filing)
+
+
+def test_mock_server_with_errors_and_processing_responses(fixture_filings):
+    transport = MockSecapioTransport(fixture_filings, error_rate=0.2, processing_rate=0.2, seed=1)
+    retriever = make_retriever(transport)
+    filing = next(f for f in fixture_filings if f.doc_type.value == '10-Q')
+    assert retriever.get_report_html('10-Q', filing.url)==expected_report(filing)
+    assert transport.request_count > 11
+
+
+def test_mock_server_metadata_and_async(fixture_filings):
+    transport = MockSecapioTransport(fixture_filings, latency_s=0.001)
+    metadata = make_retriever(transport).retrieve_report_metadata('8-K', latest_from_ticker='AEON')
+    assert metadata['accessionNo'] == '0001104659-23-084851'
+
+    async def run():
+        async with AsyncSecapioDataRetriever(api_key='key', client=httpx.AsyncClient(transport=transport)) as retriever:
+            return await retriever.get_report_html('8-K', metadata['linkToFilingDetails'], sections=['1-1'])
+    assert '<b>Item 1.01.' in asyncio.run(run())
@@ -0,0 +1,42 @@
+import asyncio
+
+import httpx
+from sec_api_io.abstract_sec_data_retriever import ReportRequest
+from sec_api_io.async_secapio_data_retriever import AsyncSecapioDataRetriever
+from sec_api_io.sec_edgar_enums import SectionType
+from sec_api_io.sec_edgar_utils import sections_from_items
+from sec_api_io.secapio_data_retriever import SecapioDataRetriever
+from sec_api_io.testing import MockSecapioTransport, load_fixture_filings
+
+
+def expected_html(filing):
+    retriever = SecapioDataRetriever(api_key='key', client=httpx.Client(transport=MockSecapioTransport([filing])))
+    return retriever.get_report_html(filing.doc_type, filing.url, sections=list(filing.sections))
+
+
+def test_sections_from_items():
+    items = ['Item 9.01: Financial Statements and Exhibits', 'Item 2.02: Results of Operations', 'Item 6.10', 'Item 9.99']
+    assert [s.value for s in sections_from_items(items)]==['2-2', '6-10', '9-1', 'signature']
+    request = ReportRequest.from_metadata({'formType': '8-K', 'linkToFilingDetails': 'https://a', 'items': items}, 'present')
+    assert request.sections[-1]==SectionType.FORM_8K_SIGNATURE
+    assert ReportRequest.from_metadata({'formType': '10-K', 'linkToFilingDetails': 'https://a'}, 'present').sections is None
+
+
+def test_get_report_html_fetches_present_sections():
+    filings = [f for f in load_fixture_filings('tests/data') if f.doc_type.value == '8-K']
+    transport = MockSecapioTransport(filings)
+    retriever = SecapioDataRetriever(api_key='key', client=httpx.Client(transport=transport))
+    filing = filings[0]
+    assert retriever.get_report_html('8-K', filing.url, sections='present')==expected_html(filing)
+    assert transport.request_count==1 + len(filing.sections)
+
+    # Bulk calls look the items up with a single query.
+    transport = MockSecapioTransport(filings)
+    retriever = SecapioDataRetriever(api_key='key', client=httpx.Client(transport=transport))
+    requests = [('8-K', f.url, 'present') for f in filings]
+    htmls = [html for _, html in retriever.get_reports_html(requests, workers=4)]
+    assert sorted(htmls)==sorted(expected_html(f) for f in filings)
+    assert transport.request_count==1 + sum(len(f.sections) for f in filings)
+
+    async_retriever = AsyncSecapioDataRetriever(api_key='key', client=httpx.AsyncClient(transport=MockSecapioTransport(filings)))
+    assert asyncio.run(async_retriever.gather_reports_html(requests))==[expected_html(f) for f in filings]
@@ -0,0 +1,72 @@
+import asyncio
+import io
+
+import httpx
+import pytest
+from sec_api_io.async_secapio_data_retriever import AsyncSecapioDataRetriever
+from sec_api_io.scheduler import SectionProcessingTimeoutError
+from sec_api_io.sec_edgar_enums import SectionType
+from sec_api_io.secapio_data_retriever import SecapioDataRetriever
+
+
+def make_handler(pending_counts):
+    calls = {}
+
+    def handler(request):
+        item = request.url.params['item']
+        calls[item] = calls.get(item, 0) + 1
+        if calls[item] <= pending_counts.get(item, 0):
+            return httpx.Response(200, text='processing')
+        return httpx.Response(200, text=f'<p>{item}</p>')
+    handler.calls = calls
+    return handler
+
+
+def make_retriever(handler, **kwargs):
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    return SecapioDataRetriever(api_key='key', client=client, processing_poll_interval_s=0.02, **kwargs)
+
+
+def test_pending_section_is_polled_until_ready():
+    handler = make_handler({'2-2': 2})
+    retriever = make_retriever(handler)
+    html = retriever.get_report_html('8-K', 'https://a', sections=['2-2', 'signature'])
+    assert 'processing' not in html
+    assert '<p>2-2</p>' in html
+    assert handler.calls['2-2'] == 3
+
+
+def test_pending_section_does_not_block_other_sections():
+    retriever = make_retriever(make_handler({'2-2': 3}))
+    sections = [s.section for s in retriever.iter_report_sections('8-K', 'https://a', sections=['2-2', 'signature', '9-1'], ordered=False)]
+    assert sections[-1] == SectionType.FORM_8K_22
+
+
+def test_pending_section_times_out():
+    retriever = make_retriever(make_handler({'6-1': 100}), processing_max_wait_s=0.1)
+    with pytest.raises(SectionProcessingTimeoutError):
+        retriever.get_report_html('8-K', 'https://a', sections=['6-1'])
+
+
+def test_per_call_max_wait_for_bulk_downloads():
+    retriever = make_retriever(make_handler({'6-1': 100}))
+    [(_, result)] = retriever.get_reports_html([('8-K', 'https://a', ['6-1'])], return_exceptions=True, processing_max_wait_s=0.05)
+    assert isinstance(result, SectionProcessingTimeoutError)
+
+
+def test_download_report_to_waits_for_pending_section():
+    retriever = make_retriever(make_handler({'2-2': 1}))
+    buffer = io.BytesIO()
+    retriever.download_report_to(buffer, '8-K', 'https://a', sections=['2-2'])
+    assert buffer.getvalue().decode().endswith('\n<p>2-2</p>')
+
+
+def test_async_pending_section_is_polled():
+    handler = make_handler({'2-2': 2})
+
+    async def run():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncSecapioDataRetriever(api_key='key', client=client, processing_poll_interval_s=0.01) as retriever:
+            return await retriever.get_report_html('8-K', 'https://a', sections=['2-2'])
+
+    assert asyncio.run(run()).endswith('<p>2-2</p>')
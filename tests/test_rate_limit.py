@@ -0,0 +1,86 @@
+import asyncio
+import multiprocessing
+import threading
+import time
+
+import httpx
+import pytest
+from sec_api_io.concurrency import AdaptiveConcurrencyLimiter
+from sec_api_io.rate_limit import FileLockRateLimiter, TokenBucketRateLimiter
+from sec_api_io.secapio_data_retriever import SecapioDataRetriever
+
+
+def test_token_bucket_allows_burst_then_paces():
+    limiter = TokenBucketRateLimiter(rate_per_s=50, burst=5)
+    start = time.monotonic()
+    for _ in range(10):
+        limiter.acquire()
+    elapsed = time.monotonic() - start
+    assert 0.08 <= elapsed < 0.3
+
+
+def test_token_bucket_is_shared_by_threads_and_tasks():
+    limiter = TokenBucketRateLimiter(rate_per_s=100, burst=1)
+    start = time.monotonic()
+    threads = [threading.Thread(target=lambda: [limiter.acquire() for _ in range(5)]) for _ in range(2)]
+    for t in threads:
+        t.start()
+
+    async def tasks():
+        await asyncio.gather(*(limiter.acquire_async() for _ in range(10)))
+
+    asyncio.run(tasks())
+    for t in threads:
+        t.join()
+    assert time.monotonic() - start >= 0.18
+
+
+def _acquire_from_process(path):
+    limiter = FileLockRateLimiter(path, rate_per_s=100, burst=1)
+    for _ in range(5):
+        limiter.acquire()
+
+
+def test_file_lock_limiter_is_shared_by_processes(tmp_path):
+    path = tmp_path / 'bucket'
+    start = time.monotonic()
+    processes = [multiprocessing.Process(target=_acquire_from_process, args=(path,)) for _ in range(2)]
+    for p in processes:
+        p.start()
+    for p in processes:
+        p.join()
+    assert all(p.exitcode == 0 for p in processes)
+    assert time.monotonic() - start >= 0.09
+
+
+def test_retriever_takes_a_token_per_request():
+    class CountingLimiter(TokenBucketRateLimiter):
+        calls = 0
+
+        def acquire(self, tokens=1):
+            CountingLimiter.calls += 1
+            super().acquire(tokens)
+
+    limiter = CountingLimiter(rate_per_s=1000, burst=100)
+    client = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200, text='x')))
+    retriever = SecapioDataRetriever(api_key='key', client=client, rate_limiter=limiter)
+    retriever.get_report_html('10-Q', 'https://a', use_multithreading=True, workers=4)
+    assert CountingLimiter.calls == 11
+
+
+def test_tokens_are_taken_once_a_concurrency_slot_is_held():
+    concurrency = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+    in_flight = []
+
+    class RecordingLimiter(TokenBucketRateLimiter):
+        def acquire(self, tokens=1):
+            in_flight.append(concurrency.in_flight)
+            super().acquire(tokens)
+
+    client = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200, text='x')))
+    retriever = SecapioDataRetriever(
+        api_key='key', client=client, rate_limiter=RecordingLimiter(rate_per_s=1000, burst=100), concurrency_limiter=concurrency,
+    )
+    retriever.get_report_html('10-Q', 'https://a', use_multithreading=True, workers='auto')
+    assert len(in_flight)==11
+    assert all(1 <= n <= 2 for n in in_flight)
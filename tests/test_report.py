@@ -0,0 +1,58 @@
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+from sec_api_io.async_secapio_data_retriever import AsyncSecapioDataRetriever
+from sec_api_io.report import Report, build_section_index
+from sec_api_io.sec_edgar_enums import SectionType
+from sec_api_io.secapio_data_retriever import SecapioDataRetriever
+from sec_api_io.testing import MockSecapioTransport, load_fixture_filings
+
+FIXTURE = Path('tests/data/A.000109087222000026.result.htm')
+
+
+@pytest.fixture(scope='module')
+def fixture_filings():
+    return load_fixture_filings('tests/data')
+
+
+def test_parse_indexes_every_section():
+    html = FIXTURE.read_text(encoding='utf-8')
+    report = Report.parse(html)
+    assert report.html==html
+    assert report.sections[:2] == [SectionType.FORM_10K_1, SectionType.FORM_10K_1A]
+    assert report.index[0].title=='Business'
+    data = html.encode()
+    for entry in report.index:
+        assert report.section_bytes(entry.section).tobytes()==data[entry.offset:entry.offset + entry.length]
+    assert '1A' in report
+    assert SectionType.FORM_8K_11 not in report
+    assert ''.join(s.marker + '\n' + s.html + '\n' for s in report.iter_sections())[:-1]==html
+
+
+def test_open_memory_maps_the_file(tmp_path):
+    with Report.open(FIXTURE) as report:
+        assert report['7']==Report.parse(FIXTURE.read_bytes())['7']
+        index = report.index
+    with Report.open(FIXTURE, index=index) as report:
+        assert report.index==index
+    empty = tmp_path / 'empty.htm'
+    empty.write_bytes(b'')
+    with Report.open(empty) as report:
+        assert len(report)==0
+
+
+def test_get_report_matches_get_report_html(fixture_filings):
+    transport = MockSecapioTransport(fixture_filings)
+    retriever = SecapioDataRetriever(api_key='key', client=httpx.Client(transport=transport))
+    async_retriever = AsyncSecapioDataRetriever(api_key='key', client=httpx.AsyncClient(transport=transport))
+    for filing in fixture_filings:
+        sections = list(filing.sections) if filing.doc_type.value == '8-K' else None
+        html = retriever.get_report_html(filing.doc_type, filing.url, sections=sections)
+        report = retriever.get_report(filing.doc_type, filing.url, sections=sections, workers=4)
+        assert report.html==html
+        assert report.doc_type==filing.doc_type
+        assert report.index==tuple(build_section_index(html.encode()))
+        async_report = asyncio.run(async_retriever.get_report(filing.doc_type, filing.url, sections=sections))
+        assert async_report.index==report.index
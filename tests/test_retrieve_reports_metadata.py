@@ -0,0 +1,72 @@
+import asyncio
+
+import httpx
+import pytest
+from sec_api_io.async_secapio_data_retriever import AsyncSecapioDataRetriever
+from sec_api_io.sec_edgar_enums import DocumentType
+from sec_api_io.secapio_data_retriever import SecapioDataRetriever, SecapioRequestError
+from sec_api_io.testing import MockFiling, MockSecapioTransport
+
+
+def make_filing(i, ticker='AAPL'):
+    digits = f'{i:018d}'
+    accession_number = f'{digits[:10]}-{digits[10:12]}-{digits[12:]}'
+    url = f'https://www.sec.gov/Archives/edgar/data/0/{digits}/primary-document.htm'
+    return MockFiling(accession_number, DocumentType.FORM_8K, ticker, url, {})
+
+
+def make_retriever(filings):
+    transport = MockSecapioTransport(filings)
+    return SecapioDataRetriever(api_key='key', client=httpx.Client(transport=transport)), transport
+
+
+def test_accession_numbers_are_resolved_in_input_order():
+    retriever, transport = make_retriever([make_filing(i) for i in range(1, 4)])
+    keys = [make_filing(3).url, '000000000000000001', 'not-an-accession-number', make_filing(99).url, make_filing(3).url]
+    results = retriever.retrieve_reports_metadata('8-K', accession_numbers=keys)
+    assert [r.key for r in results] == keys
+    assert [r.metadata and r.metadata['accessionNo'] for r in results] == [make_filing(3).accession_number, make_filing(1).accession_number, None, None, make_filing(3).accession_number]
+    assert isinstance(results[2].error, ValueError)
+    assert isinstance(results[3].error, SecapioRequestError)
+    assert transport.request_count==1
+
+    retriever.retrieve_reports_metadata('8-K', accession_numbers=keys[:2])
+    assert transport.request_count==1
+
+
+def test_accession_numbers_are_chunked():
+    filings = [make_filing(i) for i in range(1, 61)]
+    retriever, transport = make_retriever(filings)
+    results = retriever.retrieve_reports_metadata('8-K', accession_numbers=[f.accession_number.replace('-', '') for f in filings])
+    assert all(r.error is None for r in results)
+    assert transport.request_count==2
+
+
+def test_tickers_fall_back_to_single_lookups():
+    filings = [make_filing(i) for i in range(1, 51)] + [make_filing(100, ticker='MSFT')]
+    retriever, transport = make_retriever(filings)
+    results = retriever.retrieve_reports_metadata('8-K', tickers=['msft', 'AAPL', 'NOPE'])
+    assert [r.metadata and r.metadata['ticker'] for r in results] == ['MSFT', 'AAPL', None]
+    assert results[1].metadata['accessionNo']==make_filing(1).accession_number
+    assert isinstance(results[2].error, SecapioRequestError)
+    # One batched query, then single lookups for the tickers not on its first page.
+    assert transport.request_count==3
+
+    # Single lookups and invalidation normalize tickers like the batch does.
+    assert retriever.retrieve_report_metadata('8-K', latest_from_ticker=' msft ')['ticker']=='MSFT'
+    assert transport.request_count==3
+    assert retriever.invalidate_report_metadata(latest_from_ticker='aapl')==1
+
+
+def test_exactly_one_kind_of_key():
+    retriever, _ = make_retriever([])
+    with pytest.raises(ValueError):
+        retriever.retrieve_reports_metadata('8-K')
+
+
+def test_async_retrieve_reports_metadata():
+    transport = MockSecapioTransport([make_filing(i) for i in range(1, 4)] + [make_filing(10, ticker='MSFT')])
+    retriever = AsyncSecapioDataRetriever(api_key='key', client=httpx.AsyncClient(transport=transport))
+    results = asyncio.run(retriever.retrieve_reports_metadata('8-K', tickers=['MSFT', 'AAPL']))
+    assert [r.metadata['accessionNo'] for r in results] == [make_filing(10).accession_number, make_filing(1).accession_number]
+    assert transport.request_count==1
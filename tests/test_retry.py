@@ -0,0 +1,114 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from sec_api_io.retry import RetriesExhaustedError, RetryBudget, RetryPolicy
+from sec_api_io.secapio_data_retriever import SecapioDataRetriever, SecapioRequestError
+
+
+def status_error(status_code, headers=None):
+    request = httpx.Request('GET', 'https://api.sec-api.io/extractor?url=u&item=1')
+    return httpx.HTTPStatusError('error', request=request, response=httpx.Response(status_code, headers=headers, request=request))
+
+
+def failing(errors, result='ok'):
+    errors = list(errors)
+
+    def send():
+        if errors:
+            raise errors.pop(0)
+        return result
+    return send
+
+
+@pytest.fixture
+def fast_policy():
+    return RetryPolicy(base_delay_s=0.001, max_delay_s=0.005)
+
+
+def test_retries_throttling_and_transport_errors(fast_policy):
+    send = failing([status_error(429), status_error(503), httpx.ConnectError('down')])
+    assert fast_policy.run(send)=='ok'
+
+
+def test_client_errors_are_not_retried(fast_policy):
+    with pytest.raises(httpx.HTTPStatusError):
+        fast_policy.run(failing([status_error(400)]))
+
+
+def test_max_retries(fast_policy):
+    fast_policy.max_retries = 2
+    with pytest.raises(RetriesExhaustedError, match=r'Maximum number of retries \(2\) exceeded.'):
+        fast_policy.run(failing([status_error(500)] * 3))
+
+
+def test_retry_after_header_is_respected():
+    delays = []
+    policy = RetryPolicy(base_delay_s=0.001, max_delay_s=0.1)
+    policy.run(failing([status_error(429, {'Retry-After': '0.05'})]), on_retry=lambda attempt, delay, e: delays.append(delay))
+    assert delays == [0.05]
+
+
+def test_retry_after_header_is_capped(fast_policy):
+    delays = []
+    start = time.monotonic()
+    fast_policy.run(failing([status_error(503, {'Retry-After': '86400'})]), on_retry=lambda attempt, delay, e: delays.append(delay))
+    assert delays == [0.005]
+    assert time.monotonic() - start < 1
+    # A capped wait still has to fit in the deadline and the budget.
+    policy = RetryPolicy(max_delay_s=5, deadline_s=1)
+    with pytest.raises(RetriesExhaustedError, match='deadline'):
+        policy.run(failing([status_error(429, {'Retry-After': '86400'})]))
+    policy = RetryPolicy(max_delay_s=0.001, budget=RetryBudget(max_tokens=0))
+    with pytest.raises(RetriesExhaustedError, match='budget'):
+        policy.run(failing([status_error(429, {'Retry-After': '86400'})]))
+
+
+def test_deadline_stops_retrying():
+    policy = RetryPolicy(deadline_s=0.01)
+    start = time.monotonic()
+    with pytest.raises(RetriesExhaustedError, match='deadline'):
+        policy.run(failing([status_error(429, {'Retry-After': '5'})]))
+    assert time.monotonic() - start < 1
+
+
+def test_shared_budget_limits_retries():
+    budget = RetryBudget(max_tokens=2, deposit_per_success=0)
+    policy = RetryPolicy(base_delay_s=0.001, max_delay_s=0.001, budget=budget)
+    assert policy.run(failing([status_error(500)] * 2))=='ok'
+    with pytest.raises(RetriesExhaustedError, match='budget'):
+        policy.run(failing([status_error(500)]))
+
+
+def test_run_async(fast_policy):
+    errors = [httpx.ReadTimeout('slow')]
+
+    async def send():
+        if errors:
+            raise errors.pop()
+        return 'ok'
+    assert asyncio.run(fast_policy.run_async(send))=='ok'
+
+
+def test_retriever_uses_policy_for_extractor_and_metadata(fast_policy):
+    responses = {'/extractor': [503, 200], '/': [502, 200]}
+
+    def handler(request):
+        status_code = responses[request.url.path].pop(0)
+        if request.url.path == '/':
+            return httpx.Response(status_code, json={'filings': [{'ticker': 'A'}]})
+        return httpx.Response(status_code, text='<p>x</p>')
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    retriever = SecapioDataRetriever(api_key='key', client=client, retry_policy=fast_policy)
+    assert retriever.get_report_html('8-K', 'https://a', sections=['signature']).endswith('<p>x</p>')
+    assert retriever.retrieve_report_metadata('8-K', latest_from_ticker='A') == {'ticker': 'A'}
+
+
+def test_metadata_gives_up_with_request_error(fast_policy):
+    fast_policy.max_retries = 1
+    client = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(500)))
+    retriever = SecapioDataRetriever(api_key='key', client=client, retry_policy=fast_policy)
+    with pytest.raises(SecapioRequestError):
+        retriever.retrieve_report_metadata('8-K', latest_from_ticker='A')
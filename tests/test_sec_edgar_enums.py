@@ -0,0 +1,39 @@
+import pytest
+from sec_api_io.sec_edgar_enums import (
+    FORM_SECTION_SETS,
+    DocumentType,
+    InvalidDocumentTypeError,
+    InvalidSectionTypeError,
+    SectionType,
+)
+from sec_api_io.sec_edgar_utils import parse_sections
+
+
+@pytest.mark.parametrize('alias, expected', [
+    ('1A', SectionType.FORM_10K_1A),
+    ('Item 1A', SectionType.FORM_10K_1A),
+    ('item7', SectionType.FORM_10K_7),
+    ('PART1ITEM2', SectionType.FORM_10Q_PART1ITEM2),
+    ('Part II, Item 1A', SectionType.FORM_10Q_PART2ITEM1A),
+    ('1.01', SectionType.FORM_8K_11),
+    ('Item 6.10', SectionType.FORM_8K_610),
+    ('2-2', SectionType.FORM_8K_22),
+    ('Signatures', SectionType.FORM_8K_SIGNATURE),
+])
+def test_section_aliases(alias, expected):
+    assert SectionType.from_str(alias)==expected
+
+
+def test_document_type_aliases_and_errors():
+    assert DocumentType.from_str(' 10-k ')==DocumentType.from_str('Form 10K')==DocumentType.FORM_10K
+    with pytest.raises(InvalidDocumentTypeError):
+        DocumentType.from_str('S-1')
+    with pytest.raises(InvalidSectionTypeError):
+        SectionType.from_str('item 99')
+
+
+def test_parse_sections():
+    assert parse_sections('10-K', ['Item 1A', SectionType.FORM_10K_7])==(SectionType.FORM_10K_1A, SectionType.FORM_10K_7)
+    assert SectionType.FORM_10K_1A in FORM_SECTION_SETS[DocumentType.FORM_10K]
+    with pytest.raises(InvalidSectionTypeError):
+        parse_sections('10-Q', ['1A'])
@@ -0,0 +1,77 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from sec_api_io.async_secapio_data_retriever import AsyncSecapioDataRetriever
+from sec_api_io.secapio_data_retriever import SecapioDataRetriever
+from sec_api_io.single_flight import SingleFlight
+from sec_api_io.testing import MockSecapioTransport, load_fixture_filings
+
+
+def test_threads_share_one_call_and_its_exception():
+    flight = SingleFlight()
+    started = threading.Event()
+    calls = []
+
+    def slow(value):
+        calls.append(value)
+        started.set()
+        time.sleep(0.1)
+        if value == 'error':
+            raise RuntimeError(value)
+        return value
+
+    for value in ['ok', 'error']:
+        started.clear()
+        with ThreadPoolExecutor(4) as pool:
+            first = pool.submit(flight.call, value, lambda v=value: slow(v))
+            started.wait()
+            others = [pool.submit(flight.call, value, lambda v=value: slow(v)) for _ in range(3)]
+        if value == 'ok':
+            assert [f.result() for f in [first, *others]]==['ok'] * 4
+        else:
+            for f in [first, *others]:
+                with pytest.raises(RuntimeError):
+                    f.result()
+    assert calls==['ok', 'error']
+    assert (flight.calls, flight.shared)==(8, 6)
+    # Finished calls are forgotten.
+    assert flight.call('ok', lambda: 'again')=='again'
+
+
+def test_tasks_share_one_call():
+    flight = SingleFlight()
+    calls = []
+
+    async def slow():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return 'ok'
+
+    async def main():
+        return await asyncio.gather(*(flight.call_async('k', slow) for _ in range(5)))
+
+    assert asyncio.run(main())==['ok'] * 5
+    assert len(calls)==1
+
+
+def test_retrievers_deduplicate_concurrent_section_requests():
+    filing = load_fixture_filings('tests/data')[2]
+    transport = MockSecapioTransport([filing], latency_s=0.1)
+    retriever = SecapioDataRetriever(api_key='key', client=httpx.Client(transport=transport))
+    with ThreadPoolExecutor(4) as pool:
+        htmls = list(pool.map(lambda _: retriever.get_report_html(filing.doc_type, filing.url, sections=['1-1']), range(4)))
+    assert len(set(htmls))==1
+    assert transport.request_count==1
+
+    transport = MockSecapioTransport([filing], latency_s=0.1)
+    async_retriever = AsyncSecapioDataRetriever(api_key='key', client=httpx.AsyncClient(transport=transport))
+
+    async def main():
+        return await asyncio.gather(*(async_retriever.get_report_html(filing.doc_type, filing.url, sections=['1-1']) for _ in range(4)))
+
+    assert asyncio.run(main())==htmls
+    assert transport.request_count==1